@@ -0,0 +1,55 @@
+"""
+Pomiar czasu uruchomienia trybu wsadowego main.py.
+
+Uruchomienie z katalogu głównego projektu:
+    python -m benchmarks.cli_startup --runs 10
+
+Uruchamia `python main.py hull` na pustym wejściu w osobnych procesach, wypisuje
+medianę i maksimum czasu całego procesu oraz sprawdza, czy tryb wsadowy nie
+importuje tkinter ani matplotlib. Kończy się kodem 1 po przekroczeniu budżetu.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from main import STARTUP_BUDGET
+
+EMPTY_INPUT = b"Point,X,Y\n"
+
+CHECK_IMPORTS = (
+    "import sys; import main; main.run_cli(['hull']); "
+    "sys.exit(any(m in sys.modules for m in ('tkinter', 'matplotlib')))"
+)
+
+def run(runs, budget):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "main.py", "hull"], input=EMPTY_INPUT,
+                       stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    print(f"uruchomienia: {runs}, mediana: {median:.3f} s, maksimum: {max(times):.3f} s, budżet: {budget} s")
+
+    imports = subprocess.run([sys.executable, "-c", CHECK_IMPORTS], input=EMPTY_INPUT,
+                             stdout=subprocess.DEVNULL)
+    if imports.returncode != 0:
+        print("Tryb wsadowy importuje tkinter lub matplotlib.")
+        return 1
+    if median > budget:
+        print("Przekroczono budżet czasu uruchomienia.")
+        return 1
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Czas uruchomienia trybu wsadowego main.py")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET)
+    args = parser.parse_args()
+    sys.exit(run(args.runs, args.budget))
+
+if __name__ == "__main__":
+    main()
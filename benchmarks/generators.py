@@ -0,0 +1,94 @@
+"""
+Generatory danych testowych dla benchmarków.
+
+Zbiory punktów zwracane są jako tablice (N, 2), pary odcinków jako dwie tablice
+(N, 4) w formacie check_intersections_batch (wiersz: x1, y1, x2, y2).
+Wszystkie generatory przyjmują liczbę elementów i numpy.random.Generator,
+więc dla tego samego ziarna dane są powtarzalne.
+"""
+import numpy as np
+
+def uniform_square(n, rng):
+    # Punkty jednostajnie w kwadracie [0, 1]^2 – otoczka ma O(log n) wierzchołków
+    return rng.random((n, 2))
+
+def uniform_disk(n, rng):
+    # Punkty jednostajnie w kole o promieniu 1 – otoczka ma O(n^(1/3)) wierzchołków
+    r = np.sqrt(rng.random(n))
+    theta = rng.random(n) * 2 * np.pi
+    return np.column_stack((r * np.cos(theta), r * np.sin(theta)))
+
+def on_circle(n, rng):
+    # Punkty na okręgu – (prawie) wszystkie są wierzchołkami otoczki (h = n)
+    theta = rng.random(n) * 2 * np.pi
+    return np.column_stack((np.cos(theta), np.sin(theta)))
+
+def clustered(n, rng):
+    # Skupiska o rozkładzie normalnym wokół losowych środków
+    k = min(50, max(1, n // 1000))
+    centers = rng.random((k, 2)) * 100
+    return centers[rng.integers(0, k, n)] + rng.normal(scale=1.0, size=(n, 2))
+
+def colinear(n, rng):
+    # Punkty całkowite dokładnie na prostej y = 2x + 1, z powtórzeniami (przypadek zdegenerowany)
+    x = rng.integers(-n, n + 1, n).astype(np.float64)
+    return np.column_stack((x, 2 * x + 1))
+
+POINT_SETS = {
+    "square": uniform_square,
+    "disk": uniform_disk,
+    "circle": on_circle,
+    "clustered": clustered,
+    "colinear": colinear,
+}
+
+def random_segments(n, rng):
+    # Losowe pary odcinków w kwadracie [0, 1]^2
+    return rng.random((n, 4)), rng.random((n, 4))
+
+def adversarial_segments(n, rng):
+    """
+    Pary odcinków w przypadkach szczególnych, po równo:
+    odcinki współliniowe nakładające się, stykające się końcami, równoległe,
+    prawie równoległe (różnica kąta rzędu 1e-15), zdegenerowane do punktów
+    oraz przecinające się w końcu jednego z odcinków.
+    """
+    case = rng.integers(0, 6, n)
+    base = rng.random((n, 4)) * 1000
+    x1, y1, x2, y2 = base.T
+    dx, dy = x2 - x1, y2 - y1
+    t = rng.random(n)
+    a = base.copy()
+    b = np.empty((n, 4))
+
+    # 0: współliniowe, nakładające się
+    b[:, 0], b[:, 1] = x1 + t * dx, y1 + t * dy
+    b[:, 2], b[:, 3] = x2 + t * dx, y2 + t * dy
+    rows = case == 1
+    # 1: wspólny koniec
+    b[rows, 0], b[rows, 1] = x2[rows], y2[rows]
+    b[rows, 2], b[rows, 3] = x2[rows] + dy[rows], y2[rows] - dx[rows]
+    rows = case == 2
+    # 2: równoległe, przesunięte
+    b[rows, 0], b[rows, 1] = x1[rows] + 1, y1[rows]
+    b[rows, 2], b[rows, 3] = x2[rows] + 1, y2[rows]
+    rows = case == 3
+    # 3: prawie równoległe, przecinające się daleko lub wcale
+    b[rows, 0], b[rows, 1] = x1[rows], y1[rows] + 1e-12
+    b[rows, 2], b[rows, 3] = x2[rows], np.nextafter(y2[rows], np.inf)
+    rows = case == 4
+    # 4: oba odcinki są punktami (identycznymi lub różnymi)
+    a[rows, 2], a[rows, 3] = x1[rows], y1[rows]
+    same = rows & (t < 0.5)
+    b[rows, 0], b[rows, 1] = x1[rows] + (~same[rows]), y1[rows]
+    b[rows, 2], b[rows, 3] = b[rows, 0], b[rows, 1]
+    rows = case == 5
+    # 5: koniec jednego odcinka leży na drugim
+    b[rows, 0], b[rows, 1] = x1[rows] + t[rows] * dx[rows], y1[rows] + t[rows] * dy[rows]
+    b[rows, 2], b[rows, 3] = b[rows, 0] - dy[rows], b[rows, 1] + dx[rows]
+    return a, b
+
+SEGMENT_SETS = {
+    "random": random_segments,
+    "adversarial": adversarial_segments,
+}
@@ -0,0 +1,50 @@
+"""
+Benchmark równoległej otoczki wypukłej (convex_hull z parametrem workers).
+
+Uruchomienie z katalogu głównego projektu:
+    python -m benchmarks.parallel_hull --points 10000000 --workers 1 2 4 8 16 32
+
+Dla każdej liczby procesów wypisuje czas, przyspieszenie względem wersji
+sekwencyjnej i sprawdza, czy wynik jest identyczny.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from convex_hull import convex_hull
+
+def run(n, workers_list, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2))
+
+    start = time.perf_counter()
+    reference = convex_hull(points)
+    serial = time.perf_counter() - start
+    print(f"punkty: {n}, wierzchołki otoczki: {reference.num_vertices}")
+    print(f"{'procesy':>8} {'czas [s]':>10} {'przyspieszenie':>15}")
+    print(f"{1:>8} {serial:>10.3f} {1.0:>15.2f}")
+
+    for workers in workers_list:
+        if workers <= 1:
+            continue
+        start = time.perf_counter()
+        result = convex_hull(points, workers=workers)
+        elapsed = time.perf_counter() - start
+        if result.coords != reference.coords or result.indices != reference.indices:
+            raise RuntimeError(f"Wynik dla {workers} procesów różni się od wersji sekwencyjnej.")
+        print(f"{workers:>8} {elapsed:>10.3f} {serial / elapsed:>15.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark równoległej otoczki wypukłej")
+    parser.add_argument("--points", type=int, default=10_000_000)
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({2 ** k for k in range(cpus.bit_length()) if 2 ** k <= cpus} | {cpus})
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.points, args.workers, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark przekazywania tablic do puli procesów: serializacja (pickle) a pamięć współdzielona.
+
+Uruchomienie z katalogu głównego projektu:
+    python -m benchmarks.shm_transport --sizes 100000 1000000 10000000
+
+Dla każdej liczby punktów mierzony jest czas zadania w puli procesów (najlepszy z --repeat):
+- pickle – tablica przekazana jako argument zadania (kopiowana do potoku i w procesie roboczym),
+- shm – tablica kopiowana raz do SharedArray, do procesu trafia tylko uchwyt (shm_transport),
+- shm (gotowy segment) – punkty są już w SharedArray, bez żadnego kopiowania.
+Zadanie tylko odczytuje tablicę (suma współrzędnych), więc różnica czasu to koszt przekazania.
+Wypisywany jest też rozmiar przesyłanych danych i czas równoległej otoczki (convex_hull z workers)
+dla punktów w zwykłej tablicy i w SharedArray.
+"""
+import argparse
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from convex_hull import convex_hull
+from shm_transport import SharedArray, attach, ensure_tracker
+
+def _touch(points):
+    return float(points.sum())
+
+def _touch_shared(handle):
+    with attach(handle) as points:
+        return _touch(points)
+
+def _best(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(sizes, repeat=5, workers=2, seed=0):
+    rng = np.random.default_rng(seed)
+    ensure_tracker()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        pool.submit(_touch, np.zeros((1, 2))).result()
+
+        print(f"{'punkty':>10} {'dane [MB]':>10} {'pickle [ms]':>12} {'shm [ms]':>10} "
+              f"{'gotowy [ms]':>12} {'oszczędność':>12}")
+        for n in sizes:
+            points = rng.random((n, 2))
+            pickled = _best(lambda: pool.submit(_touch, points).result(), repeat)
+
+            def shared_copy():
+                with SharedArray.from_array(points) as shared:
+                    pool.submit(_touch_shared, shared.handle).result()
+            copied = _best(shared_copy, repeat)
+
+            with SharedArray.from_array(points) as shared:
+                ready = _best(lambda: pool.submit(_touch_shared, shared.handle).result(), repeat)
+                handle_size = len(pickle.dumps(shared.handle))
+
+            size = len(pickle.dumps(points, protocol=pickle.HIGHEST_PROTOCOL)) / 2 ** 20
+            print(f"{n:>10} {size:>10.1f} {pickled * 1000:>12.2f} {copied * 1000:>10.2f} "
+                  f"{ready * 1000:>12.2f} {pickled / copied:>11.1f}x")
+    print(f"uchwyt segmentu: {handle_size} B")
+
+    n = max(sizes)
+    points = rng.random((n, 2))
+    plain = _best(lambda: convex_hull(points, workers=workers), 1)
+    with SharedArray.from_array(points) as shared:
+        ready = _best(lambda: convex_hull(shared, workers=workers), 1)
+    print(f"convex_hull({n} punktów, workers={workers}): tablica {plain:.3f} s, SharedArray {ready:.3f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pamięci współdzielonej a serializacji w puli procesów")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat, args.workers, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Zestaw benchmarków otoczki wypukłej i przecięć odcinków.
+
+Uruchomienie z katalogu głównego projektu:
+    python -m benchmarks.suite --output wyniki.json
+    python -m benchmarks.suite --sizes 10 1000 100000 --baseline wyniki.json
+
+Mierzone operacje:
+- hull – convex_hull na zbiorach punktów z benchmarks.generators.POINT_SETS,
+- intersection – check_intersection wywoływane dla każdej pary odcinków
+  (do --scalar-limit par, pętla w Pythonie jest wolna),
+- intersection_batch – check_intersections_batch na wszystkich parach naraz.
+
+Dla każdej operacji, zbioru danych i rozmiaru zapisywany jest najlepszy czas
+(timeit, co najmniej 0,2 s pomiaru), przepustowość (elementy / s) oraz
+szczytowe zużycie pamięci w czasie wywołania (tracemalloc, osobne uruchomienie).
+Wyniki zapisywane są w formacie JSON; z --baseline porównywane są z wcześniejszym
+plikiem wyników, a wzrost czasu powyżej --tolerance kończy program kodem 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.generators import POINT_SETS, SEGMENT_SETS
+from convex_hull import convex_hull
+from intersection import check_intersection, check_intersections_batch
+
+DEFAULT_SIZES = [10 ** k for k in range(1, 8)]
+
+def _hull_case(points):
+    return lambda: convex_hull(points)
+
+def _scalar_case(a, b):
+    rows = np.hstack((a, b)).tolist()
+    return lambda: [check_intersection(*row) for row in rows]
+
+def _batch_case(a, b):
+    return lambda: check_intersections_batch(a, b)
+
+def cases(sizes, scalar_limit, seed):
+    # Kolejne przypadki testowe: (operacja, zbiór danych, rozmiar, funkcja bez argumentów)
+    for name, generate in POINT_SETS.items():
+        for n in sizes:
+            yield "hull", name, n, _hull_case(generate(n, np.random.default_rng(seed)))
+    for name, generate in SEGMENT_SETS.items():
+        for n in sizes:
+            a, b = generate(n, np.random.default_rng(seed))
+            if n <= scalar_limit:
+                yield "intersection", name, n, _scalar_case(a, b)
+            yield "intersection_batch", name, n, _batch_case(a, b)
+
+def measure(func, repeat):
+    # Najlepszy czas jednego wywołania [s] i szczytowa pamięć w czasie wywołania [B]
+    timer = timeit.Timer(func)
+    number, total = timer.autorange()
+    best = min([total] + timer.repeat(repeat - 1, number)) / number
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def run(sizes, repeat, scalar_limit, seed):
+    results = []
+    print(f"{'operacja':<20} {'dane':<12} {'n':>10} {'czas [s]':>12} {'elem./s':>12} {'pamięć [MB]':>12}")
+    for benchmark, dataset, n, func in cases(sizes, scalar_limit, seed):
+        seconds, peak = measure(func, repeat)
+        results.append({"benchmark": benchmark, "dataset": dataset, "n": n,
+                        "seconds": seconds, "throughput": n / seconds, "peak_bytes": peak})
+        print(f"{benchmark:<20} {dataset:<12} {n:>10} {seconds:>12.6f} {n / seconds:>12.0f} {peak / 1e6:>12.2f}",
+              flush=True)
+    return {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+def compare(report, baseline, tolerance):
+    # Porównanie czasów z plikiem bazowym; zwraca listę regresji
+    reference = {(r["benchmark"], r["dataset"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'operacja':<20} {'dane':<12} {'n':>10} {'bazowy [s]':>12} {'teraz [s]':>12} {'stosunek':>9}")
+    for r in report["results"]:
+        base = reference.get((r["benchmark"], r["dataset"], r["n"]))
+        if base is None:
+            continue
+        ratio = r["seconds"] / base["seconds"]
+        mark = " !" if ratio > 1 + tolerance else ""
+        print(f"{r['benchmark']:<20} {r['dataset']:<12} {r['n']:>10} "
+              f"{base['seconds']:>12.6f} {r['seconds']:>12.6f} {ratio:>9.2f}{mark}")
+        if mark:
+            regressions.append(r)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarki otoczki wypukłej i przecięć odcinków")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scalar-limit", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="plik JSON z wynikami")
+    parser.add_argument("--baseline", help="plik JSON z wynikami do porównania")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="dopuszczalny względny wzrost czasu (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    report = run(args.sizes, max(1, args.repeat), args.scalar_limit, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\nRegresje: {len(regressions)} (wzrost czasu powyżej {args.tolerance:.0%}).")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import json
+import os
+from point_files import is_points_file, load_points
+
+# Indeks katalogu zapisów (saves/<tryb>) przechowywany w pliku .catalog.json w tym katalogu.
+#
+# Dla każdego pliku z punktami zapamiętywane są: nazwa, liczba punktów, prostokąt
+# ograniczający [xmin, ymin, xmax, ymax] (None dla pustego pliku) i czas modyfikacji.
+# Indeks aktualizowany jest przyrostowo przy zapisie i usuwaniu pliku; refresh() uzupełnia
+# go tylko o pliki dodane lub zmienione poza aplikacją (porównanie czasu modyfikacji).
+
+CATALOG_FILE = ".catalog.json"
+
+def _file_info(path, points=None):
+    if points is None:
+        points = load_points(path)
+    info = {"name": os.path.basename(path), "points": len(points), "bbox": None,
+            "mtime": os.path.getmtime(path)}
+    if len(points):
+        xs = [p[0] for p in points] if isinstance(points, list) else points[:, 0]
+        ys = [p[1] for p in points] if isinstance(points, list) else points[:, 1]
+        info["bbox"] = [float(min(xs)), float(min(ys)), float(max(xs)), float(max(ys))]
+    return info
+
+class SaveCatalog:
+    """
+    Indeks plików z punktami w jednym katalogu zapisów.
+
+    Wpisy to słowniki {"name", "points", "bbox", "mtime"}; query() zwraca je
+    w kolejności od najnowszej nazwy pliku (jak dotychczasowa lista).
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.path = os.path.join(folder, CATALOG_FILE)
+        self.entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = {e["name"]: e for e in json.load(f)}
+        except (OSError, ValueError, KeyError, TypeError):
+            self.entries = {}
+
+    def save(self):
+        os.makedirs(self.folder, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(list(self.entries.values()), f)
+        os.replace(tmp, self.path)
+
+    def refresh(self):
+        # Uzgadnia indeks z zawartością katalogu; wczytuje tylko nowe lub zmienione pliki
+        changed = False
+        present = set()
+        with os.scandir(self.folder) as it:
+            for item in it:
+                if not item.is_file() or not is_points_file(item.name):
+                    continue
+                present.add(item.name)
+                entry = self.entries.get(item.name)
+                if entry is not None and entry["mtime"] == item.stat().st_mtime:
+                    continue
+                try:
+                    self.entries[item.name] = _file_info(item.path)
+                except (OSError, ValueError):
+                    # Plik nieczytelny – widoczny na liście, bez liczby punktów
+                    self.entries[item.name] = {"name": item.name, "points": None, "bbox": None,
+                                               "mtime": item.stat().st_mtime}
+                changed = True
+        for name in set(self.entries) - present:
+            del self.entries[name]
+            changed = True
+        if changed:
+            self.save()
+
+    def add(self, name, points=None):
+        # Dodaje (lub aktualizuje) wpis po zapisie pliku; points pozwala pominąć ponowne wczytanie
+        self.entries[name] = _file_info(os.path.join(self.folder, name), points)
+        self.save()
+
+    def remove(self, name):
+        if self.entries.pop(name, None) is not None:
+            self.save()
+
+    def query(self, text="", min_points=None, max_points=None):
+        """
+        Wpisy, których nazwa zawiera text (bez rozróżniania wielkości liter)
+        i których liczba punktów mieści się w [min_points, max_points].
+        """
+        text = text.lower()
+        result = []
+        for entry in self.entries.values():
+            if text and text not in entry["name"].lower():
+                continue
+            n = entry["points"]
+            if min_points is not None and (n is None or n < min_points):
+                continue
+            if max_points is not None and (n is None or n > max_points):
+                continue
+            result.append(entry)
+        result.sort(key=lambda e: e["name"], reverse=True)
+        return result
@@ -1,5 +1,74 @@
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import random
+import numpy as np
+from predicates import orient2d, orient2d_batch
+from shm_transport import SharedArray, as_shared, attach
+import timing
 from translations import tr
 
+# Od tej liczby punktów compute_convex_hull korzysta z wektoryzowanego silnika NumPy
+# (z dokładnymi predykatami silnik w Pythonie jest szybszy tylko dla około 250 punktów
+# i mniej – zbiory z benchmarks.generators; dla punktów współliniowych już od ~100)
+VECTORIZED_THRESHOLD = 256
+
+class ConvexHullResult:
+    """
+    Wynik obliczenia otoczki wypukłej.
+
+    - coords: wierzchołki otoczki [(x, y), ...] w kolejności obiegu,
+    - indices: indeksy (od 0) punktów wejściowych odpowiadających wierzchołkom
+      wielokąta lub None, gdy otoczka jest punktem / odcinkiem / jest pusta.
+
+    Opis tekstowy (tłumaczenia z modułu translations) tworzony jest dopiero
+    przy odczycie atrybutu `text`.
+    """
+    __slots__ = ("coords", "indices")
+
+    def __init__(self, coords, indices=None):
+        self.coords = coords
+        self.indices = indices
+
+    @property
+    def num_vertices(self):
+        return len(self.coords)
+
+    @property
+    def text(self):
+        if not timing.is_enabled():
+            return self._text()
+        with timing.stage("text"):
+            return self._text()
+
+    def _text(self):
+        n = len(self.coords)
+        if n == 0:
+            return tr("no_points")
+        elif n == 1:
+            x, y = self.coords[0]
+            return f"{tr('convex_is_point')}\n{tr('convex_vertices')}:\nP1 ({x}, {y})"
+        elif n == 2:
+            (x1, y1), (x2, y2) = self.coords
+            return f"{tr('convex_is_segment')}\n{tr('convex_vertices')}:\nP1 ({x1}, {y1})\nP2 ({x2}, {y2})"
+
+        if n == 3:
+            shape_type = tr("convex_is_triangle")
+        elif n == 4:
+            shape_type = tr("convex_is_quadrilateral")
+        else:
+            shape_type = tr("convex_is_polygon").format(n=n)
+
+        result_lines = [shape_type]
+        result_lines.append(f"{tr('convex_vertices')}:")
+        for (x, y), index in zip(self.coords, self.indices):
+            result_lines.append(f"P{index + 1} ({x}, {y})")
+        return "\n".join(result_lines)
+
+    def as_tuple(self):
+        # Format zwracany przez compute_convex_hull: (opis tekstowy, lista wierzchołków)
+        return self.text, self.coords
+
 # Funkcja oblicza otoczkę wypukłą zbioru punktów na płaszczyźnie
 # przy użyciu algorytmu Andrew's Monotone Chain – jednego z wariantów algorytmu Grahama.
 # 
@@ -20,69 +89,771 @@ from translations import tr
 # - tekstowy opis typu otoczki wypukłej (punkt, odcinek, trójkąt, czworokąt, wielokąt z n wierzchołkami)
 # - listę nazwanych punktów w kolejności pojawienia się na otoczce: P1 (x, y), P2 (x, y), ...
 
-def compute_convex_hull(points):
-    # 1. Usunięcie duplikatów i przygotowanie
-    unique_points = list(set(points))  # unikamy wielokrotnego wpisania tego samego punktu
-    n = len(unique_points)
+def convex_hull(points, workers=None):
+    """
+    Oblicza otoczkę wypukłą i zwraca ConvexHullResult (bez formatowania tekstu).
 
-    # 2. Obsługa przypadków brzegowych (mniej niż 3 punkty lub więcej ale na jednej linii)
-    if n == 0:
-        return tr("no_points"), []
-    elif n == 1:
-        x, y = unique_points[0]
-        return f"{tr('convex_is_point')}\n{tr('convex_vertices')}:\nP1 ({x}, {y})", [(x, y)]
-    elif n == 2:
-        (x1, y1), (x2, y2) = unique_points
-        return f"{tr('convex_is_segment')}\n{tr('convex_vertices')}:\nP1 ({x1}, {y1})\nP2 ({x2}, {y2})", [(x1, y1), (x2, y2)]
-    elif all((unique_points[1][0] - unique_points[0][0]) * (y - unique_points[0][1]) == (x - unique_points[0][0]) * (unique_points[1][1] - unique_points[0][1])
-        for x, y in unique_points[2:]):
-            # Wszystkie punkty są współliniowe
-            sorted_points = sorted(unique_points)
-            (x1, y1), (x2, y2) = sorted_points[0], sorted_points[-1]
-            return f"{tr('convex_is_segment')}\n{tr('convex_vertices')}:\nP1 ({x1}, {y1})\nP2 ({x2}, {y2})", [(x1, y1), (x2, y2)]
-
-    # 3. Dodanie indeksów do punktów (potrzebne do etykietowania np. P1, P2)
-    indexed_points = [(x, y, i + 1) for i, (x, y) in enumerate(points)]
-
-    # 4. Sortowanie punktów najpierw po x, potem po y
-    indexed_points.sort()
-
-    # 5. Funkcja pomocnicza – oblicza iloczyn wektorowy dla trzech punktów
+    workers > 1 włącza obliczenia równoległe w puli procesów (wynik jest ten sam).
+    """
+    with timing.run("convex_hull"):
+        if workers is not None and workers > 1:
+            return _convex_hull_parallel(points, workers)
+        if isinstance(points, SharedArray):
+            points = points.array
+
+        # Tablica NumPy (N, 2) – małe zbiory liczone są na krotkach
+        if isinstance(points, np.ndarray) and len(points) < VECTORIZED_THRESHOLD:
+            points = [tuple(p) for p in points.reshape(-1, 2).tolist()]
+
+        # Duże zbiory punktów obsługuje silnik wektoryzowany (identyczny wynik)
+        if len(points) >= VECTORIZED_THRESHOLD:
+            return _convex_hull_vectorized(points)
+        return _convex_hull_python(points)
+
+def compute_convex_hull(points, workers=None):
+    # Zgodność wsteczna: (opis tekstowy, lista wierzchołków otoczki)
+    return convex_hull(points, workers).as_tuple()
+
+def _convex_hull_python(points):
+    with timing.stage("dedup"):
+        # 1. Usunięcie duplikatów i przygotowanie
+        unique_points = list(set(points))  # unikamy wielokrotnego wpisania tego samego punktu
+        n = len(unique_points)
+
+        # 2. Obsługa przypadków brzegowych (mniej niż 3 punkty lub więcej ale na jednej linii)
+        if n == 0:
+            return ConvexHullResult([])
+        elif n == 1:
+            x, y = unique_points[0]
+            return ConvexHullResult([(x, y)])
+        elif n == 2:
+            (x1, y1), (x2, y2) = unique_points
+            return ConvexHullResult([(x1, y1), (x2, y2)])
+        elif all(orient2d(*unique_points[0], *unique_points[1], x, y) == 0 for x, y in unique_points[2:]):
+                # Wszystkie punkty są współliniowe
+                sorted_points = sorted(unique_points)
+                (x1, y1), (x2, y2) = sorted_points[0], sorted_points[-1]
+                return ConvexHullResult([(x1, y1), (x2, y2)])
+
+    with timing.stage("sort"):
+        # 3. Dodanie indeksów do punktów (potrzebne do etykietowania np. P1, P2)
+        indexed_points = [(x, y, i + 1) for i, (x, y) in enumerate(points)]
+
+        # 4. Sortowanie punktów najpierw po x, potem po y
+        indexed_points.sort()
+
+    # 5. Funkcja pomocnicza – znak iloczynu wektorowego dla trzech punktów (test dokładny)
     def cross(o, a, b):
-        return (a[0] - o[0]) * (b[1] - o[1]) - \
-               (a[1] - o[1]) * (b[0] - o[0])
-
-    # 6. Budowanie dolnej części otoczki (z lewej do prawej)
-    lower = []
-    for p in indexed_points:
-        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
-            lower.pop()
-        lower.append(p)
-
-    # 7. Budowanie górnej części otoczki (z prawej do lewej)
-    upper = []
-    for p in reversed(indexed_points):
-        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
-            upper.pop()
-        upper.append(p)
-
-    # 8. Połączenie dolnej i górnej części, bez duplikatów końcowych punktów
-    hull = lower[:-1] + upper[:-1]
-
-    # 9. Ustalenie typu otoczki wypukłej na podstawie liczby unikalnych punktów
-    num_vertices = len(set((x, y) for x, y, _ in hull))
-    if num_vertices == 3:
-        shape_type = tr("convex_is_triangle")
-    elif num_vertices == 4:
-        shape_type = tr("convex_is_quadrilateral")
-    else:
-        shape_type = tr("convex_is_polygon").format(n=num_vertices)
+        return orient2d(o[0], o[1], a[0], a[1], b[0], b[1])
+
+    with timing.stage("chain"):
+        # 6. Budowanie dolnej części otoczki (z lewej do prawej)
+        lower = []
+        for p in indexed_points:
+            while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+                lower.pop()
+            lower.append(p)
 
-    # 10. Przygotowanie wyniku tekstowego do wyświetlenia w GUI
-    result_lines = [shape_type]
-    result_lines.append(f"{tr('convex_vertices')}:")
-    for x, y, index in hull:
-        result_lines.append(f"P{index} ({x}, {y})")
+        # 7. Budowanie górnej części otoczki (z prawej do lewej)
+        upper = []
+        for p in reversed(indexed_points):
+            while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+                upper.pop()
+            upper.append(p)
 
+        # 8. Połączenie dolnej i górnej części, bez duplikatów końcowych punktów
+        hull = lower[:-1] + upper[:-1]
+
+    # 9. Wynik: wierzchołki i indeksy punktów (opis tekstowy tworzony na żądanie)
     hull_coords = [(x, y) for x, y, _ in hull]
-    return "\n".join(result_lines), hull_coords
+    hull_indices = [index - 1 for _, _, index in hull]
+    return ConvexHullResult(hull_coords, hull_indices)
+
+
+# Wektoryzowany silnik otoczki wypukłej (NumPy) dla dużych zbiorów punktów.
+#
+# Działanie:
+# - sortowanie leksykograficzne (x, y, indeks) przez np.lexsort – ta sama kolejność co sort() na krotkach,
+# - usuwanie duplikatów i test współliniowości na całych tablicach,
+# - wstępne odrzucanie punktów wewnętrznych: w każdym przebiegu usuwane są naraz wszystkie punkty,
+#   w których łańcuch nie skręca w lewo (takie punkty na pewno nie są wierzchołkami otoczki),
+# - dokończenie łańcucha Andrew na pozostałych (nielicznych) punktach.
+#
+# Zwraca indeksy (od 0) punktów wejściowych w tej samej kolejności i z tymi samymi etykietami,
+# co czysto pythonowa wersja compute_convex_hull.
+
+def _cross_keep(xs, ys):
+    # Maska punktów środkowych, w których łańcuch skręca w lewo (iloczyn wektorowy > 0)
+    keep = np.ones(len(xs), dtype=bool)
+    keep[1:-1] = orient2d_batch(xs[:-2], ys[:-2], xs[1:-1], ys[1:-1], xs[2:], ys[2:]) > 0
+    return keep
+
+def _monotone_chain(xs, ys):
+    # Zwraca pozycje (w przekazanej kolejności) wierzchołków łańcucha otoczki
+    pos = np.arange(len(xs))
+
+    # Przebiegi wektoryzowane – dopóki odrzucają istotną część punktów
+    while len(pos) > 2:
+        keep = _cross_keep(xs[pos], ys[pos])
+        removed = len(pos) - np.count_nonzero(keep)
+        pos = pos[keep]
+        if removed * 8 < len(pos):
+            break
+
+    # Klasyczny łańcuch na pozostałych punktach
+    px = xs[pos].tolist()
+    py = ys[pos].tolist()
+    chain = []
+    for k in range(len(pos)):
+        while len(chain) >= 2:
+            i, j = chain[-2], chain[-1]
+            if orient2d(px[i], py[i], px[j], py[j], px[k], py[k]) <= 0:
+                chain.pop()
+            else:
+                break
+        chain.append(k)
+    return pos[chain]
+
+def _unique_groups(xs, ys, first, last):
+    # Sortuje punkty leksykograficznie i łączy duplikaty. Dla każdego unikalnego punktu zwraca
+    # współrzędne oraz najmniejszy indeks z `first` i największy z `last` w jego grupie.
+    order = np.lexsort((first, ys, xs))
+    sx, sy = xs[order], ys[order]
+    new_group = np.ones(len(xs), dtype=bool)
+    new_group[1:] = (sx[1:] != sx[:-1]) | (sy[1:] != sy[:-1])
+    starts = np.flatnonzero(new_group)
+    return (sx[starts], sy[starts],
+            np.minimum.reduceat(first[order], starts),
+            np.maximum.reduceat(last[order], starts))
+
+def _hull_positions(ux, uy):
+    # Pozycje (w tablicach punktów unikalnych) wierzchołków dolnej i górnej części otoczki
+    lower = _monotone_chain(ux, uy)
+    upper = len(ux) - 1 - _monotone_chain(ux[::-1], uy[::-1])
+    return lower, upper
+
+def _hull_labels(lower, upper, first_idx, last_idx):
+    # Etykiety duplikatów zgodne z wersją pythonową:
+    # dolna część – pierwszy punkt najmniejszy indeks, pozostałe największy;
+    # górna część – pierwszy punkt największy indeks, pozostałe najmniejszy.
+    lower_idx = last_idx[lower[:-1]]
+    lower_idx[0] = first_idx[lower[0]]
+    upper_idx = first_idx[upper[:-1]]
+    upper_idx[0] = last_idx[upper[0]]
+    return np.concatenate((lower_idx, upper_idx))
+
+def convex_hull_indices(coords):
+    """
+    Oblicza otoczkę wypukłą dla tablicy punktów o kształcie (N, 2).
+
+    Zwraca tablicę indeksów (od 0) wierzchołków otoczki w kolejności obiegu
+    algorytmu Andrew's Monotone Chain:
+    - pusta tablica dla braku punktów,
+    - jeden indeks dla punktu,
+    - dwa indeksy (skrajne punkty) dla odcinka lub punktów współliniowych,
+    - indeksy wierzchołków wielokąta w pozostałych przypadkach.
+    Dla powtórzonych punktów wybierany jest ten sam indeks co w compute_convex_hull.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    n = len(coords)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    xs, ys = coords[:, 0], coords[:, 1]
+    index = np.arange(n)
+
+    # 0. Odrzucenie punktów wewnętrznych
+    with timing.stage("prefilter"):
+        keep = _akl_toussaint_keep(xs, ys)
+    if keep is not None:
+        index = index[keep]
+        xs, ys = xs[index], ys[index]
+
+    # 1. Sortowanie leksykograficzne i grupy duplikatów (pierwszy i ostatni indeks grupy)
+    with timing.stage("sort"):
+        ux, uy, first_idx, last_idx = _unique_groups(xs, ys, index, index)
+
+    if len(ux) == 1:
+        return first_idx[:1]
+
+    # 2. Test współliniowości względem skrajnych punktów
+    with timing.stage("colinear"):
+        colinear = not np.any(orient2d_batch(ux[0], uy[0], ux[-1], uy[-1], ux, uy))
+    if colinear:
+        return np.array([first_idx[0], first_idx[-1]], dtype=np.intp)
+
+    # 3. Dolna i górna część otoczki na punktach unikalnych, etykiety duplikatów
+    with timing.stage("chain"):
+        lower, upper = _hull_positions(ux, uy)
+    with timing.stage("labels"):
+        return _hull_labels(lower, upper, first_idx, last_idx)
+
+def _convex_hull_vectorized(points):
+    # Wersja convex_hull oparta na convex_hull_indices (ten sam wynik)
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    indices = convex_hull_indices(coords)
+
+    # Przypadki zdegenerowane (punkt, odcinek) – wynik jak w wersji pythonowej
+    if len(indices) < 3:
+        if isinstance(points, np.ndarray):
+            points = [tuple(p) for p in coords.tolist()]
+        if len(indices) == 2 and len(set(map(tuple, points))) > 2:
+            # Punkty współliniowe – skrajne punkty w porządku leksykograficznym (bez ponownego
+            # testu współliniowości w wersji pythonowej, który dla każdego punktu liczy dokładnie)
+            return ConvexHullResult([tuple(points[i]) for i in indices])
+        return _convex_hull_python(points)
+
+    if isinstance(points, np.ndarray):
+        hull = [tuple(p) for p in coords[indices].tolist()]
+    else:
+        hull = [tuple(points[i]) for i in indices]
+    return ConvexHullResult(hull, indices.tolist())
+
+
+# Wstępne odrzucanie punktów (Akl–Toussaint): punkty skrajne w kierunkach x, y, x + y i x - y
+# tworzą wielokąt wpisany w otoczkę; punkty leżące ściśle w jego wnętrzu nie mogą być
+# wierzchołkami otoczki i są odrzucane jednym przebiegiem po tablicy (bez sortowania).
+
+def _akl_toussaint_keep(xs, ys):
+    # Maska punktów, które mogą być wierzchołkami otoczki, lub None,
+    # gdy wielokąt punktów skrajnych jest zdegenerowany
+    diag, anti = xs + ys, xs - ys
+    extremes = [np.argmin(xs), np.argmin(diag), np.argmin(ys), np.argmax(anti),
+                np.argmax(xs), np.argmax(diag), np.argmax(ys), np.argmin(anti)]
+    polygon = []
+    for i in extremes:
+        p = (float(xs[i]), float(ys[i]))
+        if not polygon or polygon[-1] != p:
+            polygon.append(p)
+    while len(polygon) > 1 and polygon[0] == polygon[-1]:
+        polygon.pop()
+    if len(polygon) < 3:
+        return None
+
+    span = max(float(xs.max() - xs.min()), float(ys.max() - ys.min()))
+    scale = span + max(abs(float(xs.min())), abs(float(xs.max())), abs(float(ys.min())), abs(float(ys.max())))
+    edges = list(zip(polygon, polygon[1:] + polygon[:1]))
+    if sum(ax * by - ay * bx for (ax, ay), (bx, by) in edges) <= 0:
+        return None
+
+    # Punkt leży ściśle na lewo od krawędzi a→b, gdy dx * y - dy * x > dx * ay - dy * ax;
+    # margin chroni punkty leżące (w granicach błędu zaokrągleń) na krawędzi
+    inside = np.ones(len(xs), dtype=bool)
+    side = np.empty(len(xs))
+    term = np.empty(len(xs))
+    for (ax, ay), (bx, by) in edges:
+        dx, dy = bx - ax, by - ay
+        margin = 1e-9 * (abs(dx) + abs(dy)) * scale
+        np.multiply(ys, dx, out=side)
+        np.multiply(xs, dy, out=term)
+        side -= term
+        inside &= side > dx * ay - dy * ax + margin
+    return ~inside
+
+
+# Strumieniowa otoczka wypukła – punkty wczytywane porcjami przy ograniczonej pamięci.
+#
+# Po każdej porcji zostają tylko wierzchołki otoczki dotychczasowych punktów (punkty wewnętrzne
+# i leżące na krawędziach nie mogą być wierzchołkami otoczki całego zbioru). Dla każdego
+# wierzchołka pamiętany jest najmniejszy i największy indeks jego wystąpień, dzięki czemu
+# kolejność wierzchołków i etykiety są takie same jak w compute_convex_hull dla całego zbioru.
+
+def _reduce_candidates(xs, ys, first, last, dropped=False):
+    # Zostawia tylko wierzchołki otoczki (łącząc duplikaty). Zwraca kandydatów
+    # (xs, ys, najmniejszy indeks, największy indeks, dropped), gdzie dropped mówi,
+    # czy odrzucono jakikolwiek punkt (wtedy zbiór ma co najmniej 3 różne punkty).
+    # Przed sortowaniem odrzucane są punkty wewnętrzne (filtr Akla–Toussainta jak w convex_hull)
+    if len(xs) >= VECTORIZED_THRESHOLD:
+        keep = _akl_toussaint_keep(xs, ys)
+        if keep is not None and not keep.all():
+            xs, ys, first, last = xs[keep], ys[keep], first[keep], last[keep]
+            dropped = True
+    ux, uy, umin, umax = _unique_groups(xs, ys, first, last)
+    if len(ux) > 2:
+        lower, upper = _hull_positions(ux, uy)
+        keep = np.union1d(lower, upper)
+        dropped = dropped or len(keep) < len(ux)
+        ux, uy, umin, umax = ux[keep], uy[keep], umin[keep], umax[keep]
+    return ux, uy, umin, umax, dropped
+
+def _merge_candidates(parts):
+    # Łączy kandydatów z kilku porcji / części zbioru
+    return _reduce_candidates(
+        np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts]),
+        np.concatenate([p[2] for p in parts]), np.concatenate([p[3] for p in parts]),
+        any(p[4] for p in parts))
+
+def _hull_from_candidates(hx, hy, hmin, hmax, dropped):
+    # Końcowa otoczka z kandydatów – wynik jak convex_hull dla całego zbioru
+    points = list(zip(hx.tolist(), hy.tolist()))
+    if len(points) < 2:
+        return ConvexHullResult(points)
+    if len(points) == 2:
+        if dropped:
+            # Punkty współliniowe – skrajne punkty w porządku leksykograficznym
+            return ConvexHullResult(points)
+        # Dwa różne punkty – kolejność jak list(set(points)) w compute_convex_hull
+        unique_points = set()
+        for i in np.argsort(hmin):
+            unique_points.add(points[i])
+        return ConvexHullResult(list(unique_points))
+
+    lower, upper = _hull_positions(hx, hy)
+    positions = np.concatenate((lower[:-1], upper[:-1]))
+    return ConvexHullResult([points[i] for i in positions],
+                            _hull_labels(lower, upper, hmin, hmax).tolist())
+
+def convex_hull_stream(chunks):
+    """
+    Oblicza otoczkę wypukłą punktów podawanych porcjami.
+
+    Przyjmuje iterowalny obiekt porcji – list punktów [(x, y), ...] lub tablic (k, 2).
+    W pamięci przechowywana jest tylko bieżąca porcja i otoczka dotychczasowych punktów.
+    Zwraca ConvexHullResult taki sam jak convex_hull dla wszystkich punktów naraz.
+    """
+    empty = np.empty(0, dtype=np.intp)
+    candidates = (np.empty(0), np.empty(0), empty, empty, False)
+    total = 0
+
+    with timing.run("convex_hull_stream"):
+        chunks = iter(chunks)
+        while True:
+            with timing.stage("read"):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                chunk = np.asarray(chunk, dtype=np.float64).reshape(-1, 2)
+            if len(chunk) == 0:
+                continue
+            index = np.arange(total, total + len(chunk))
+            total += len(chunk)
+            with timing.stage("reduce"):
+                candidates = _merge_candidates([candidates, (chunk[:, 0], chunk[:, 1], index, index, False)])
+
+        with timing.stage("chain"):
+            return _hull_from_candidates(*candidates)
+
+def iter_csv_chunks(path, chunk_size=100000):
+    """
+    Wczytuje punkty z pliku CSV (kolumny X i Y, jak w katalogu saves/) porcjami
+    tablic o kształcie (chunk_size, 2). Zamiast ścieżki można podać otwarty plik
+    tekstowy (np. sys.stdin).
+    """
+    if hasattr(path, "read"):
+        yield from _read_csv_chunks(path, chunk_size)
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from _read_csv_chunks(f, chunk_size)
+
+def _read_csv_chunks(f, chunk_size):
+    reader = csv.reader(f)
+    header = next(reader, [])
+    if not header:
+        return
+    ix, iy = header.index("X"), header.index("Y")
+    chunk = []
+    for row in reader:
+        if not row:
+            continue
+        chunk.append((float(row[ix]), float(row[iy])))
+        if len(chunk) >= chunk_size:
+            yield np.array(chunk)
+            chunk = []
+    if chunk:
+        yield np.array(chunk)
+
+def convex_hull_from_csv(path, chunk_size=100000):
+    """
+    Oblicza otoczkę wypukłą punktów z pliku CSV bez wczytywania całego pliku do pamięci.
+    """
+    return convex_hull_stream(iter_csv_chunks(path, chunk_size))
+
+
+# Równoległa otoczka wypukła (dziel i zwyciężaj) w puli procesów.
+#
+# Punkty przekazywane są procesom roboczym przez pamięć współdzieloną (moduł shm_transport):
+# procesy dostają tylko uchwyt segmentu i zakres indeksów – bez serializacji danych. Jeśli
+# punkty są już w SharedArray (float64), segment nie jest kopiowany, w przeciwnym razie
+# punkty kopiowane są do nowego segmentu raz, a segment usuwany jest po obliczeniach.
+# Każdy proces liczy kandydatów (wierzchołki otoczki) swojej części, a proces główny łączy
+# je tak jak kolejne porcje w convex_hull_stream – wynik jest identyczny z wersją sekwencyjną.
+
+def _partial_hull_shared(handle, start, stop):
+    # Kandydaci otoczki dla punktów [start, stop) z segmentu pamięci współdzielonej
+    with attach(handle) as coords:
+        part = coords.reshape(-1, 2)[start:stop]
+        index = np.arange(start, stop)
+        candidates = _reduce_candidates(part[:, 0], part[:, 1], index, index)
+        del coords, part
+        return candidates
+
+def _convex_hull_parallel(points, workers):
+    shared, created = as_shared(points, np.float64)
+    try:
+        n = shared.array.size // 2
+        if n == 0:
+            return ConvexHullResult([])
+
+        bounds = np.linspace(0, n, workers + 1).astype(int).tolist()
+        with timing.stage("partial_hulls"), ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_partial_hull_shared, shared.handle, start, stop)
+                       for start, stop in zip(bounds[:-1], bounds[1:]) if start < stop]
+            parts = [future.result() for future in futures]
+    finally:
+        if created:
+            shared.close()
+
+    with timing.stage("merge"):
+        return _hull_from_candidates(*_merge_candidates(parts))
+
+# Przyrostowa (online) otoczka wypukła – punkty dodawane są pojedynczo.
+#
+# Przechowywane są dwie części otoczki z algorytmu Andrew's Monotone Chain jako listy
+# posortowane leksykograficznie: dolna oraz górna (trzymana po obrocie o 180°, dzięki czemu
+# obie części obsługuje ten sam kod). Nowy punkt jest lokalizowany wyszukiwaniem binarnym;
+# jeśli leży poza łańcuchem, wstawiany jest w odpowiednie miejsce, a sąsiedzi, przy których
+# łańcuch przestaje skręcać w lewo, są usuwani (każdy punkt usuwany jest co najwyżej raz,
+# więc porównań jest zamortyzowanie O(log n)). Wstawianie i usuwanie w liście przesuwa
+# jednak jej elementy, więc zmiana otoczki kosztuje O(h) (h – liczba wierzchołków),
+# w najgorszym przypadku O(n); punkt wewnątrz otoczki kosztuje tylko O(log n).
+
+def _cross(o, a, b):
+    # Znak iloczynu wektorowego (a - o) × (b - o) – test dokładny z modułu predicates
+    return orient2d(o[0], o[1], a[0], a[1], b[0], b[1])
+
+class _LowerChain:
+    # Dolny łańcuch otoczki: kolejne trójki punktów skręcają w lewo (iloczyn wektorowy > 0)
+
+    def __init__(self):
+        self.points = []
+
+    def is_above(self, p):
+        # Czy punkt p leży na łańcuchu lub nad nim (w zakresie x łańcucha)
+        chain = self.points
+        i = bisect_left(chain, p)
+        if i < len(chain) and chain[i] == p:
+            return True
+        if i == 0 or i == len(chain):
+            return False
+        return _cross(chain[i - 1], p, chain[i]) <= 0
+
+    def insert(self, p):
+        # Wstawia punkt p; zwraca True, jeśli łańcuch się zmienił
+        chain = self.points
+        i = bisect_left(chain, p)
+        if i < len(chain) and chain[i] == p:
+            return False
+        if 0 < i < len(chain) and _cross(chain[i - 1], p, chain[i]) <= 0:
+            return False
+
+        chain.insert(i, p)
+        while i + 2 < len(chain) and _cross(p, chain[i + 1], chain[i + 2]) <= 0:
+            del chain[i + 1]
+        while i >= 2 and _cross(chain[i - 2], chain[i - 1], p) <= 0:
+            del chain[i - 1]
+            i -= 1
+        return True
+
+class IncrementalConvexHull:
+    """
+    Otoczka wypukła budowana przyrostowo (punkt po punkcie).
+
+    - add(x, y): dodaje punkt (O(log n) dla punktu wewnątrz otoczki, w przeciwnym razie
+      zamortyzowane O(n) w najgorszym przypadku), zwraca True, jeśli otoczka się zmieniła,
+    - contains(x, y): czy punkt leży wewnątrz otoczki lub na jej brzegu (O(log n)),
+    - coords: wierzchołki otoczki w kolejności jak w compute_convex_hull,
+    - result(): ConvexHullResult dla bieżącej otoczki.
+    """
+
+    def __init__(self, points=()):
+        self._lower = _LowerChain()
+        self._upper = _LowerChain()    # górna część obrócona o 180°: (x, y) -> (-x, -y)
+        self._index = {}               # punkt -> [indeks pierwszego, indeks ostatniego wystąpienia]
+        self._count = 0
+        for x, y in points:
+            self.add(x, y)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, x, y):
+        p = (x, y)
+        self._index.setdefault(p, [self._count, self._count])[1] = self._count
+        self._count += 1
+        changed_lower = self._lower.insert(p)
+        changed_upper = self._upper.insert((-x, -y))
+        return changed_lower or changed_upper
+
+    def contains(self, x, y):
+        return self._lower.is_above((x, y)) and self._upper.is_above((-x, -y))
+
+    @property
+    def coords(self):
+        lower = self._lower.points
+        if len(lower) <= 1:
+            return list(lower)
+        upper = [(-x, -y) for x, y in self._upper.points]
+        return lower[:-1] + upper[:-1]
+
+    def result(self):
+        # Etykiety powtórzonych punktów jak w compute_convex_hull: na dolnym łańcuchu pierwszy
+        # wierzchołek dostaje najmniejszy indeks, pozostałe największy; na górnym odwrotnie
+        hull = self.coords
+        if len(hull) < 3:
+            return ConvexHullResult(hull)
+        lower = len(self._lower.points) - 1
+        indices = [self._index[p][0 if k == 0 else 1] for k, p in enumerate(hull[:lower])]
+        indices += [self._index[p][1 if k == 0 else 0] for k, p in enumerate(hull[lower:])]
+        return ConvexHullResult(hull, indices)
+
+
+# W pełni dynamiczna otoczka wypukła (wstawianie, usuwanie i przesuwanie punktów).
+#
+# Wariant struktury Overmarsa–van Leeuwena: punkty przechowywane są w zrównoważonym drzewie
+# (treap) uporządkowanym leksykograficznie, a każdy węzeł pamięta łańcuch otoczki swojego
+# poddrzewa. Łańcuch rodzica powstaje z łańcuchów dzieci przez znalezienie "mostu" (wspólnej
+# stycznej) i sklejenie prefiksu lewego łańcucha z sufiksem prawego. Łańcuchy są trwałymi
+# (persistent) sekwencjami, więc podział i sklejenie kosztują O(log n) bez kopiowania.
+# Aktualizacja przebudowuje łańcuchy tylko na ścieżce do korzenia – koszt polilogarytmiczny.
+#
+# Trwała sekwencja to treap o niejawnych kluczach; węzeł: (lewy, prawy, punkt, priorytet, rozmiar).
+
+def _seq_size(t):
+    return t[4] if t else 0
+
+def _seq_node(left, right, point, prio):
+    return (left, right, point, prio, _seq_size(left) + _seq_size(right) + 1)
+
+def _seq_get(t, k):
+    while True:
+        left_size = _seq_size(t[0])
+        if k < left_size:
+            t = t[0]
+        elif k == left_size:
+            return t[2]
+        else:
+            k -= left_size + 1
+            t = t[1]
+
+def _seq_split(t, k):
+    # Zwraca (pierwsze k elementów, pozostałe elementy)
+    if t is None:
+        return None, None
+    left_size = _seq_size(t[0])
+    if k <= left_size:
+        a, b = _seq_split(t[0], k)
+        return a, _seq_node(b, t[1], t[2], t[3])
+    a, b = _seq_split(t[1], k - left_size - 1)
+    return _seq_node(t[0], a, t[2], t[3]), b
+
+def _seq_join(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a[3] > b[3]:
+        return _seq_node(a[0], _seq_join(a[1], b), a[2], a[3])
+    return _seq_node(_seq_join(a, b[0]), b[1], b[2], b[3])
+
+def _seq_list(t):
+    out, stack = [], []
+    while stack or t:
+        while t:
+            stack.append(t)
+            t = t[0]
+        t = stack.pop()
+        out.append(t[2])
+        t = t[1]
+    return out
+
+def _tangent_from_right(chain, q):
+    # Wierzchołek dolnego łańcucha, przez który przechodzi dolna styczna z punktu q
+    # leżącego na prawo od łańcucha (przy współliniowości – skrajny lewy)
+    lo, hi = 0, _seq_size(chain) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _cross(_seq_get(chain, mid), _seq_get(chain, mid + 1), q) > 0:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _tangent_advances(chain, r, j):
+    # Czy dolna styczna z punktu r (na lewo od łańcucha) dotyka łańcucha za wierzchołkiem j
+    # (przy współliniowości – skrajny prawy)
+    return _cross(r, _seq_get(chain, j), _seq_get(chain, j + 1)) <= 0
+
+def _bridge_join(a, b):
+    # Skleja dolne łańcuchy a i b (wszystkie punkty a są mniejsze od punktów b) wzdłuż mostu
+    lo, hi = 0, _seq_size(b) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        i = _tangent_from_right(a, _seq_get(b, mid))
+        if _tangent_advances(b, _seq_get(a, i), mid):
+            lo = mid + 1
+        else:
+            hi = mid
+    i = _tangent_from_right(a, _seq_get(b, lo))
+    prefix, _ = _seq_split(a, i + 1)
+    _, suffix = _seq_split(b, lo)
+    return _seq_join(prefix, suffix)
+
+class _ChainNode:
+    __slots__ = ("point", "prio", "left", "right", "chain")
+
+    def __init__(self, point):
+        self.point = point
+        self.prio = random.random()
+        self.left = None
+        self.right = None
+        self.chain = None
+
+def _chain_update(node):
+    chain = _seq_node(None, None, node.point, random.random())
+    if node.left:
+        chain = _bridge_join(node.left.chain, chain)
+    if node.right:
+        chain = _bridge_join(chain, node.right.chain)
+    node.chain = chain
+
+def _rotate_right(node):
+    top = node.left
+    node.left = top.right
+    _chain_update(node)
+    top.right = node
+    return top
+
+def _rotate_left(node):
+    top = node.right
+    node.right = top.left
+    _chain_update(node)
+    top.left = node
+    return top
+
+def _chain_insert(node, point):
+    if node is None:
+        node = _ChainNode(point)
+    elif point < node.point:
+        node.left = _chain_insert(node.left, point)
+        if node.left.prio > node.prio:
+            node = _rotate_right(node)
+    else:
+        node.right = _chain_insert(node.right, point)
+        if node.right.prio > node.prio:
+            node = _rotate_left(node)
+    _chain_update(node)
+    return node
+
+def _chain_delete(node, point):
+    if point < node.point:
+        node.left = _chain_delete(node.left, point)
+    elif point > node.point:
+        node.right = _chain_delete(node.right, point)
+    elif node.left is None:
+        return node.right
+    elif node.right is None:
+        return node.left
+    elif node.left.prio > node.right.prio:
+        node = _rotate_right(node)
+        node.right = _chain_delete(node.right, point)
+    else:
+        node = _rotate_left(node)
+        node.left = _chain_delete(node.left, point)
+    _chain_update(node)
+    return node
+
+def _chain_build(points):
+    # Buduje drzewo z posortowanej listy unikalnych punktów w czasie liniowym
+    # (zrównoważony kształt, priorytety nadawane malejąco w kolejności poziomów)
+    if not points:
+        return None
+    root = None
+    levels = []
+    stack = [(0, len(points), 0, None, None)]
+    while stack:
+        lo, hi, depth, parent, is_left = stack.pop()
+        mid = (lo + hi) // 2
+        node = _ChainNode(points[mid])
+        if parent is None:
+            root = node
+        elif is_left:
+            parent.left = node
+        else:
+            parent.right = node
+        if depth == len(levels):
+            levels.append([])
+        levels[depth].append(node)
+        if lo < mid:
+            stack.append((lo, mid, depth + 1, node, True))
+        if mid + 1 < hi:
+            stack.append((mid + 1, hi, depth + 1, node, False))
+
+    prios = sorted((random.random() for _ in points), reverse=True)
+    nodes = [node for level in levels for node in level]
+    for node, prio in zip(nodes, prios):
+        node.prio = prio
+    for node in reversed(nodes):
+        _chain_update(node)
+    return root
+
+class DynamicConvexHull:
+    """
+    Otoczka wypukła zbioru punktów zmieniającego się w dowolny sposób.
+
+    - konstruktor buduje strukturę z listy punktów w czasie O(n log^3 n),
+    - insert(x, y): dodaje punkt (O(log^4 n) w najgorszym przypadku),
+    - delete(x, y): usuwa jedno wystąpienie punktu (ValueError, jeśli go nie ma),
+    - move((x1, y1), (x2, y2)): zmienia współrzędne punktu,
+    - coords: wierzchołki otoczki w kolejności jak w compute_convex_hull.
+    Powtórzone punkty są zliczane – punkt znika z otoczki po usunięciu wszystkich wystąpień.
+    """
+
+    def __init__(self, points=()):
+        self._lower = None    # drzewo dolnej części otoczki
+        self._upper = None    # drzewo górnej części otoczki (punkty obrócone o 180°)
+        self._counts = {}
+        for p in points:
+            p = tuple(p)
+            self._counts[p] = self._counts.get(p, 0) + 1
+        unique = sorted(self._counts)
+        self._lower = _chain_build(unique)
+        self._upper = _chain_build([(-x, -y) for x, y in reversed(unique)])
+
+    def __len__(self):
+        return sum(self._counts.values())
+
+    def __contains__(self, point):
+        return tuple(point) in self._counts
+
+    def insert(self, x, y):
+        p = (x, y)
+        count = self._counts.get(p, 0)
+        self._counts[p] = count + 1
+        if count == 0:
+            self._lower = _chain_insert(self._lower, p)
+            self._upper = _chain_insert(self._upper, (-x, -y))
+
+    def delete(self, x, y):
+        p = (x, y)
+        count = self._counts.get(p, 0)
+        if count == 0:
+            raise ValueError(f"Punkt {p} nie należy do zbioru.")
+        if count > 1:
+            self._counts[p] = count - 1
+            return
+        del self._counts[p]
+        self._lower = _chain_delete(self._lower, p)
+        self._upper = _chain_delete(self._upper, (-x, -y))
+
+    def move(self, old, new):
+        self.delete(*old)
+        self.insert(*new)
+
+    @property
+    def coords(self):
+        if self._lower is None:
+            return []
+        lower = _seq_list(self._lower.chain)
+        if len(lower) == 1:
+            return lower
+        upper = [(-x, -y) for x, y in _seq_list(self._upper.chain)]
+        return lower[:-1] + upper[:-1]
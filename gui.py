@@ -1,25 +1,269 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from translations import tr, set_language_global
-from intersection import check_intersection
-from convex_hull import compute_convex_hull
+from convex_hull import DynamicConvexHull, convex_hull
+from point_files import load_points, save_points
+from catalog import SaveCatalog
+from point_table import PointTable
+from result_cache import ResultCache
+import timing
 from datetime import datetime
-import csv
+import numpy as np
 import os
+import queue
+import threading
+from time import perf_counter
+
+# Powyżej tej liczby punktów w widocznym obszarze wykres otoczki nie pokazuje etykiet P1, P2, ...
+MAX_POINT_LABELS = 200
+# Powyżej tej liczby punktów w widocznym obszarze punkty rysowane są jako obraz gęstości
+LOD_THRESHOLD = 50000
+# Zmiany wykresu zgłoszone w tym czasie (ms) łączone są w jedno odświeżenie
+REDRAW_DEBOUNCE_MS = 30
+# Największa liczba odświeżeń wykresu na sekundę
+REDRAW_MAX_FPS = 60
+# Co tyle ms wątek Tk odbiera wyniki przekazane z wątków roboczych
+POLL_INTERVAL_MS = 20
+
+class BlitManager:
+    """
+    Odświeżanie wykresu przez blitting.
+
+    Po każdym pełnym rysowaniu figury (otwarcie okna, przesunięcie, zmiana rozmiaru)
+    zapamiętywane jest tło – osie, siatka i tytuł. Zmiana danych rysuje na tym tle tylko
+    artystów dodanych przez add(), więc koszt odświeżenia nie zależy od reszty wykresu.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.artists = []
+        self.background = None
+        self.on_redraw = None   # wywoływane po pełnym rysowaniu, przed narysowaniem artystów
+        self.cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def add(self, *artists):
+        for artist in artists:
+            artist.set_animated(True)
+            self.artists.append(artist)
+
+    def disconnect(self):
+        self.canvas.mpl_disconnect(self.cid)
+
+    def _on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        if self.on_redraw is not None:
+            self.on_redraw()
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+
+    def update(self):
+        if self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+class TkDispatcher:
+    """
+    Przekazywanie wywołań z wątków roboczych do wątku Tk.
+
+    post(func) wkłada func do kolejki (bezpieczne z dowolnego wątku), a wątek Tk wykonuje
+    kolejkę co POLL_INTERVAL_MS. Odczyt działa tylko wtedy, gdy trwa jakieś zadanie
+    (begin() / end() z BackgroundTask) lub kolejka nie jest pusta – bezczynne okno nie jest
+    budzone. Wątki robocze wywołują post() tylko w czasie swojego zadania, a wynik zadania
+    trafia do kolejki jako ostatni, więc nic nie zostaje w kolejce po zatrzymaniu odczytu.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.calls = queue.Queue()
+        self.active = 0          # zadania w toku (zmieniane tylko w wątku Tk)
+        self.polling = False
+        self.tk_thread = threading.current_thread()
+
+    def begin(self):
+        self.active += 1
+        self._start()
+
+    def end(self):
+        self.active -= 1
+
+    def post(self, func):
+        # Wywołanie func w wątku Tk – przy najbliższym odczycie kolejki
+        self.calls.put(func)
+        if threading.current_thread() is self.tk_thread:
+            self._start()
+
+    def _start(self):
+        if self.polling:
+            return
+        try:
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+            self.polling = True
+        except tk.TclError:
+            pass   # okno zostało już zamknięte
+
+    def _poll(self):
+        # Wyjątek w jednej z funkcji nie zatrzymuje odbierania kolejnych (finally)
+        self.polling = False
+        try:
+            while True:
+                try:
+                    func = self.calls.get_nowait()
+                except queue.Empty:
+                    break
+                func()
+        finally:
+            if self.active or not self.calls.empty():
+                self._start()
+
+class BackgroundTask:
+    """
+    Obliczenia w wątku roboczym, bez blokowania pętli zdarzeń Tk.
+
+    run() uruchamia funkcję w nowym wątku; wynik (lub wyjątek) przekazywany jest do wątku
+    Tk przez TkDispatcher i tam wywoływane jest on_done (lub on_error). Wątek roboczy
+    nie wywołuje żadnych metod Tk.
+    Nowe zadanie lub cancel() unieważnia poprzednie – jego wynik jest pomijany
+    (wątku nie da się przerwać, ale nie wpływa już na okno).
+    on_busy(True / False) pozwala pokazać i ukryć wskaźnik zajętości.
+    """
+
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+        self.generation = 0
+        self.busy = False
+        self.on_busy = None
+
+    def run(self, func, on_done, on_error):
+        self.generation += 1
+        generation = self.generation
+
+        def work():
+            try:
+                result, ok = func(), True
+            except Exception as e:
+                result, ok = e, False
+            self.dispatcher.post(lambda: self._finish(generation, ok, result, on_done, on_error))
+
+        self._set_busy(True)
+        self.dispatcher.begin()
+        threading.Thread(target=work, daemon=True).start()
+
+    def cancel(self):
+        self.generation += 1
+        self._set_busy(False)
+
+    def _finish(self, generation, ok, result, on_done, on_error):
+        # Zadanie zakończone (także unieważnione) – odczyt kolejki może się zatrzymać
+        self.dispatcher.end()
+        if generation != self.generation:
+            return   # wynik nieaktualnego zadania
+        self._set_busy(False)
+        if ok:
+            on_done(result)
+        else:
+            on_error(result)
+
+    def _set_busy(self, busy):
+        if busy != self.busy:
+            self.busy = busy
+            if self.on_busy is not None:
+                self.on_busy(busy)
+
+class RedrawScheduler:
+    """
+    Łączenie zmian wykresu (wpisy współrzędnych, kliknięcia) w jedno odświeżenie.
+
+    request(key, update) zapamiętuje funkcję aktualizującą dane artystów; kolejne zgłoszenie
+    z tym samym kluczem zastępuje poprzednie. Pierwsze zgłoszenie planuje odświeżenie
+    po debounce_ms (nie wcześniej niż 1 / max_fps s od poprzedniego) – wtedy wykonywane są
+    wszystkie oczekujące funkcje i jeden raz redraw().
+    """
+
+    def __init__(self, root, redraw, debounce_ms=REDRAW_DEBOUNCE_MS, max_fps=REDRAW_MAX_FPS):
+        self.root = root
+        self.redraw = redraw
+        self.debounce_ms = debounce_ms
+        self.max_fps = max_fps
+        self.pending = {}
+        self.after_id = None
+        self.last_flush = 0.0
+
+    def request(self, key, update=None):
+        # Ponowne zgłoszenie przenosi zmianę na koniec kolejki (wykonanie w kolejności ostatnich zgłoszeń)
+        self.pending.pop(key, None)
+        self.pending[key] = update
+        if self.after_id is None:
+            frame_ms = 1000 / self.max_fps
+            since_last = (perf_counter() - self.last_flush) * 1000
+            delay = max(self.debounce_ms, frame_ms - since_last)
+            self.after_id = self.root.after(max(0, int(delay)), self.flush)
+
+    def flush(self):
+        # Wykonanie oczekujących zmian i jedno odświeżenie wykresu (także wywołane bezpośrednio)
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if not self.pending:
+            return
+        updates = list(self.pending.values())
+        self.pending.clear()
+        with timing.run("update_plot"):
+            with timing.stage("view"):
+                for update in updates:
+                    if update is not None:
+                        update()
+            with timing.stage("blit"):
+                self.redraw()
+        self.last_flush = perf_counter()
+
+    def cancel(self):
+        # Porzucenie oczekujących zmian (np. po zamknięciu okna z wykresem)
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.pending.clear()
 
 class AppWindow:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title(tr("title"))
         self.theme_mode = "dark"
+        self.save_format = ".csv"
         ttk.Style().theme_use("clam")
         self.center_window(1200, 850)
         self.content_frame = ttk.Frame(self.root, padding=20)
         self.content_frame.pack(fill="both", expand=True)
+        # Obliczenia uruchamiane przyciskiem „Wyznacz” wykonywane są w wątku roboczym;
+        # wyniki wszystkich zadań w tle wracają do wątku Tk przez wspólny dispatcher
+        self.dispatcher = TkDispatcher(self.root)
+        self.worker = BackgroundTask(self.dispatcher)
+        # Otoczka dynamiczna dla wczytanych punktów budowana jest w osobnym wątku roboczym,
+        # a kontur na czas budowy liczony w jeszcze innym (nowe „Wyznacz” nie unieważnia żadnego z nich)
+        self.hull_builder = BackgroundTask(self.dispatcher)
+        self.outline_worker = BackgroundTask(self.dispatcher)
+        # Zmiany wykresu z pól współrzędnych i kliknięć łączone w jedno odświeżenie
+        self.scheduler = RedrawScheduler(self.root, self.redraw_plot)
+        # Pasek stanu z czasami etapów ostatniego obliczenia (widoczny po włączeniu pomiaru w opcjach)
+        self.timing_reports = {}
+        self.status_var = tk.StringVar(value="")
+        self.status_bar = ttk.Label(self.root, textvariable=self.status_var, anchor="w", padding=(10, 2))
+        timing.add_listener(self.on_timing_report)
+        # Wyniki obliczeń zapamiętywane między kolejnymi „Wyznacz”; otoczki także na dysku
+        # (katalog saves/ i baza tworzone dopiero przy pierwszym obliczeniu otoczki)
+        self.results = ResultCache(path=os.path.join("saves", ".cache.sqlite"))
+        # Figura, płótno i pasek narzędzi wykresu tworzone przy pierwszym otwarciu okna z wykresem
+        self.figure = None
+        self.canvas = None
+        self.toolbar = None
+        self.toolbar_theme = None
+        self.plot_click_cid = None
+        self.blit = None
         self.apply_theme()
         self.render_main_menu()
 
@@ -30,6 +274,12 @@ class AppWindow:
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
     def clear_frame(self):
+        # Wynik obliczenia w toku i oczekujące zmiany wykresu nie dotyczą już nowej zawartości okna
+        self.worker.cancel()
+        self.hull_builder.cancel()
+        self.outline_worker.cancel()
+        self.scheduler.cancel()
+        self.worker.on_busy = None
         for widget in self.content_frame.winfo_children():
             widget.destroy()
 
@@ -141,6 +391,14 @@ class AppWindow:
             ("Dark", lambda: self.set_theme("dark")),
             ("Light", lambda: self.set_theme("light"))
         ])
+        section(tr("save_format"), [
+            ("CSV", lambda: self.set_save_format(".csv")),
+            ("NPY", lambda: self.set_save_format(".npy"))
+        ])
+        section(tr("performance"), [
+            (tr("on"), lambda: self.set_timing(True)),
+            (tr("off"), lambda: self.set_timing(False))
+        ])
         section(tr("size"), [
             ("1200x850", lambda: self.center_window(1200, 850)),
             ("1300x900", lambda: self.center_window(1300, 900))
@@ -157,6 +415,36 @@ class AppWindow:
         self.apply_theme()
         self.render_options_menu()
 
+    def set_save_format(self, ext):
+        self.save_format = ext
+        self.render_options_menu()
+
+    def set_timing(self, enabled):
+        timing.enable(enabled)
+        if enabled:
+            self.status_bar.pack(side="bottom", fill="x", before=self.content_frame)
+        else:
+            self.status_bar.pack_forget()
+            self.status_var.set("")
+            self.timing_reports.clear()
+        self.render_options_menu()
+
+    def on_timing_report(self, report):
+        # Wywoływane przez moduł timing po każdym zakończonym obliczeniu lub odświeżeniu wykresu,
+        # także w wątku roboczym – pasek stanu aktualizowany jest w wątku Tk
+        self.dispatcher.post(lambda: self.show_timing_report(report))
+
+    def show_timing_report(self, report):
+        # Ostatni raport każdego rodzaju (np. obliczenie w tle i rysowanie wyniku)
+        if not timing.is_enabled():
+            return
+        self.timing_reports.pop(report.name, None)
+        self.timing_reports[report.name] = report
+        stats = self.results.stats()
+        hits = stats["hits"] + stats["disk_hits"]
+        texts = [r.text() for r in self.timing_reports.values()]
+        self.status_var.set(" | ".join(texts + [tr("cache_hits").format(hits=hits, total=hits + stats["misses"])]))
+
     def show_info(self):
         self.clear_frame()
         wrapper = ttk.Frame(self.content_frame)
@@ -192,6 +480,19 @@ class AppWindow:
         canvas_container = tk.Frame(list_frame, background=self.bg_color, borderwidth=2, relief="groove")
         canvas_container.pack(pady=10, padx=10)
 
+        # Wyszukiwanie po nazwie i filtr liczby punktów
+        filter_frame = ttk.Frame(list_frame)
+        filter_frame.pack(before=canvas_container, pady=(0, 4))
+        ttk.Label(filter_frame, text=tr("search")).pack(side="left", padx=(0, 4))
+        search_entry = ttk.Entry(filter_frame, width=18)
+        search_entry.pack(side="left", padx=(0, 10))
+        ttk.Label(filter_frame, text=tr("points_min")).pack(side="left", padx=(0, 4))
+        min_entry = ttk.Entry(filter_frame, width=7)
+        min_entry.pack(side="left", padx=(0, 10))
+        ttk.Label(filter_frame, text=tr("points_max")).pack(side="left", padx=(0, 4))
+        max_entry = ttk.Entry(filter_frame, width=7)
+        max_entry.pack(side="left")
+
         canvas = tk.Canvas(
             canvas_container,
             width=450,
@@ -200,57 +501,109 @@ class AppWindow:
             highlightthickness=0,
             borderwidth=0
         )
-        scrollbar = ttk.Scrollbar(canvas_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, padding=(10, 0, 0, 0))
-
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
         canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
 
         folder = f"saves/{mode}"
         os.makedirs(folder, exist_ok=True)
-        files = sorted(os.listdir(folder), reverse=True)
-        files = [f for f in files if f.endswith(".csv")]
-
-        if not files:
-            ttk.Label(scrollable_frame, text=tr("no_data_saved"), font=("Segoe UI", 12)).pack(pady=20)
-        else:
-            for fname in files:
-                full_path = os.path.join(folder, fname)
-
-                card = ttk.Frame(scrollable_frame, width=660, padding=12, relief="ridge", borderwidth=2)
-                card.pack(pady=8, anchor="center")
-
-                content = ttk.Frame(card)
-                content.pack(fill="x")
-
-                ttk.Label(content, text=fname, font=("Segoe UI", 11, "bold")).pack(side="left", padx=10)
-
-                btn_frame = ttk.Frame(content)
-                btn_frame.pack(side="right")
-
-                load_btn = ttk.Button(btn_frame, text=tr("load"), width=7,
-                    command=lambda path=full_path, m=mode: self.load_points_from_file(path, m))
-                load_btn.pack(side="left", padx=(0, 6))
+        catalog = SaveCatalog(folder)
+        catalog.refresh()
+
+        # Lista wirtualna: karty tworzone są tylko dla wierszy widocznych w oknie listy
+        card_height = 70
+        visible_entries = []
+        cards = {}   # numer wiersza -> (identyfikator okna na płótnie, karta)
+        empty_label = [None]
+
+        def make_card(row):
+            entry = visible_entries[row]
+            full_path = os.path.join(folder, entry["name"])
+
+            card = ttk.Frame(canvas, padding=12, relief="ridge", borderwidth=2)
+            content = ttk.Frame(card)
+            content.pack(fill="x")
+
+            text_frame = ttk.Frame(content)
+            text_frame.pack(side="left", padx=10)
+            ttk.Label(text_frame, text=entry["name"], font=("Segoe UI", 11, "bold")).pack(anchor="w")
+            if entry["points"] is not None:
+                ttk.Label(text_frame, text=tr("points_count").format(n=entry["points"]),
+                          font=("Segoe UI", 9)).pack(anchor="w")
+
+            btn_frame = ttk.Frame(content)
+            btn_frame.pack(side="right")
+
+            load_btn = ttk.Button(btn_frame, text=tr("load"), width=7,
+                command=lambda path=full_path, m=mode: self.load_points_from_file(path, m))
+            load_btn.pack(side="left", padx=(0, 6))
+
+            delete_btn = ttk.Button(btn_frame, text=tr("delete"), width=7,
+                command=lambda path=full_path: self.delete_saved_file(path, catalog, apply_filter))
+            delete_btn.pack(side="left")
+
+            window = canvas.create_window(10, row * card_height + 8, window=card, anchor="nw",
+                                          width=430, height=card_height - 10)
+            cards[row] = (window, card)
+
+        def render_visible():
+            top = canvas.canvasy(0)
+            first = max(0, int(top // card_height) - 1)
+            last = min(len(visible_entries), int((top + canvas.winfo_height()) // card_height) + 2)
+            for row in [r for r in cards if not first <= r < last]:
+                window, card = cards.pop(row)
+                canvas.delete(window)
+                card.destroy()
+            for row in range(first, last):
+                if row not in cards:
+                    make_card(row)
+
+        def yview(*args):
+            canvas.yview(*args)
+            render_visible()
+
+        scrollbar = ttk.Scrollbar(canvas_container, orient="vertical", command=yview)
+        scrollbar.pack(side="right", fill="y")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.bind("<Configure>", lambda e: render_visible())
 
-                delete_btn = ttk.Button(btn_frame, text=tr("delete"), width=7,
-                    command=lambda path=full_path, row=card: self.delete_saved_file(path, row))
-                delete_btn.pack(side="left")
+        def parse_count(entry):
+            try:
+                return int(entry.get())
+            except ValueError:
+                return None
+
+        def apply_filter(event=None):
+            for window, card in cards.values():
+                canvas.delete(window)
+                card.destroy()
+            cards.clear()
+            if empty_label[0] is not None:
+                empty_label[0].destroy()
+                empty_label[0] = None
+
+            visible_entries[:] = catalog.query(search_entry.get().strip(),
+                                               parse_count(min_entry), parse_count(max_entry))
+            canvas.configure(scrollregion=(0, 0, 450, max(len(visible_entries) * card_height, 500)))
+            canvas.yview_moveto(0)
+            if not visible_entries:
+                empty_label[0] = ttk.Label(canvas, text=tr("no_data_saved"), font=("Segoe UI", 12))
+                canvas.create_window(225, 30, window=empty_label[0], anchor="n")
+            render_visible()
+
+        for entry in (search_entry, min_entry, max_entry):
+            entry.bind("<KeyRelease>", apply_filter)
+        apply_filter()
 
         ttk.Button(wrapper, text=tr("back"), command=self.render_main_menu, width=30).pack(pady=10)
 
     def load_points_from_file(self, path, mode):
         try:
-            with open(path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                points = [(float(row["X"]), float(row["Y"])) for row in reader]
+            points = load_points(path)
 
-            if mode == "intersection" and len(points) != 4:
-                messagebox.showerror(tr("error"), tr("error_info"))
-                return
+            if mode == "intersection":
+                points = [tuple(p) for p in points.tolist()]
+                if len(points) != 4:
+                    messagebox.showerror(tr("error"), tr("error_info"))
+                    return
 
             self.clear_frame()
             wrapper = ttk.Frame(self.content_frame)
@@ -258,23 +611,15 @@ class AppWindow:
 
             ttk.Label(wrapper, text=tr("coords_prompt"), font=("Segoe UI", 16)).pack(pady=10)
 
-            flat_coords = [coord for pt in points for coord in pt]
-
             if mode == "intersection":
-                callback = lambda: check_intersection(*[float(e.get()) for e in self.entries])
+                callback = self.results.check_intersection
                 self.render_intersection_coord_input(wrapper, callback)
-            else:
-                callback = lambda pts: compute_convex_hull(pts)
-                self.render_convex_coord_input(wrapper, callback)
-                needed_points = len(points)
-                existing_points = len(self.entries) // 2
-                while existing_points < needed_points:
-                    self.add_point_callback()
-                    existing_points += 1
-            self.root.after(50, lambda: self.fill_loaded_points(points))
-            if mode == "intersection":
+                self.root.after(50, lambda: self.fill_loaded_points(points))
                 self.root.after(100, self.redraw_all_points)
             else:
+                callback = self.results.compute_convex_hull
+                self.render_convex_coord_input(wrapper, callback)
+                self.load_convex_points(points)
                 self.root.after(100, self.update_convex_plot)
 
             def center_if_out_of_view():
@@ -305,15 +650,103 @@ class AppWindow:
         except Exception as e:
             print(tr("error"), e)
 
-    def delete_saved_file(self, path, row):
+    def delete_saved_file(self, path, catalog, on_deleted):
         confirm = messagebox.askyesno(tr("delete"), tr("delete_confirm").format(filename=os.path.basename(path)))
         if confirm:
             try:
                 os.remove(path)
-                row.destroy()
+                catalog.remove(os.path.basename(path))
+                on_deleted()
             except Exception as e:
                 messagebox.showerror(tr("error"), str(e))
 
+    def get_plot(self, parent, pady=0):
+        # Jedna figura i płótno matplotlib współdzielone przez okna z wykresem.
+        # matplotlib importowany jest dopiero przy pierwszym otwarciu takiego okna.
+        # Ramka wykresu jest dzieckiem okna głównego i wstawiana jest do `parent` (pack in_),
+        # więc przetrwa usunięcie zawartości okna przez clear_frame.
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+        if self.canvas is None:
+            from matplotlib.figure import Figure
+            self.plot_frame = ttk.Frame(self.root)
+            self.figure = Figure(figsize=(5, 4))
+            self.canvas = FigureCanvasTkAgg(self.figure, master=self.plot_frame)
+            self.canvas.get_tk_widget().pack(pady=0)
+            self.toolbar_frame = ttk.Frame(self.plot_frame)
+            self.toolbar_frame.pack(pady=0)
+
+        # Pasek narzędzi budowany ponownie tylko po zmianie motywu
+        if self.toolbar is None or self.toolbar_theme != self.theme_mode:
+            if self.toolbar is not None:
+                self.toolbar.destroy()
+
+            class CustomToolbar(NavigationToolbar2Tk):
+                toolitems = [t for t in NavigationToolbar2Tk.toolitems if t[0] == 'Pan']
+
+            self.toolbar = CustomToolbar(self.canvas, self.toolbar_frame)
+            self.toolbar_theme = self.theme_mode
+            if self.theme_mode == "dark":
+                self.toolbar.config(background="#2e2e2e", borderwidth=0)
+                for child in self.toolbar.winfo_children():
+                    child.configure(background="#2e2e2e", foreground="white", activebackground="#3a3a3a")
+        if self.toolbar.mode != '':
+            self.toolbar.pan()
+        self.toolbar.update()
+
+        if self.plot_click_cid is not None:
+            self.canvas.mpl_disconnect(self.plot_click_cid)
+            self.plot_click_cid = None
+        if self.blit is not None:
+            self.blit.disconnect()
+        self.blit = BlitManager(self.canvas)
+
+        self.figure.clf()
+        ax = self.figure.add_subplot()
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        ax.grid(True)
+        ax.set_title(tr("plot_title"))
+
+        if self.theme_mode == "dark":
+            self.figure.patch.set_facecolor('#2e2e2e')
+            ax.set_facecolor('#1e1e1e')
+            ax.tick_params(colors='white')
+            ax.xaxis.label.set_color('white')
+            ax.yaxis.label.set_color('white')
+            ax.title.set_color('white')
+            for spine in ax.spines.values():
+                spine.set_color('white')
+        else:
+            self.figure.patch.set_facecolor('white')
+
+        self.plot_frame.pack(in_=parent, pady=pady)
+        self.plot_frame.lift()
+        return ax
+
+    def redraw_plot(self):
+        if self.blit is not None:
+            self.blit.update()
+
+    def make_busy_indicator(self, parent, after):
+        # Pasek postępu i przycisk anulowania pod przyciskiem „Wyznacz”, widoczne w czasie obliczeń w tle
+        frame = ttk.Frame(parent)
+        progress = ttk.Progressbar(frame, mode="indeterminate", length=200)
+        progress.pack(side="left", padx=5)
+        ttk.Button(frame, text=tr("cancel"), command=self.worker.cancel, width=12).pack(side="left", padx=5)
+
+        def on_busy(busy):
+            if busy:
+                frame.pack(after=after, pady=5)
+                progress.start(15)
+            else:
+                progress.stop()
+                frame.pack_forget()
+        self.worker.on_busy = on_busy
+
+    def on_plot_click(self, handler):
+        self.plot_click_cid = self.canvas.mpl_connect("button_press_event", handler)
+
     def open_intersection_window(self):
         self.clear_frame()
         wrapper = ttk.Frame(self.content_frame)
@@ -346,83 +779,52 @@ class AppWindow:
             ttk.Label(input_frame, text="x").grid(row=2, column=i * 2, padx=(0, 0))
             ttk.Label(input_frame, text="y").grid(row=2, column=i * 2 + 1, padx=(0, 0))
 
-        point_dots = [None] * 4
-        point_labels = [None] * 4
         colors = ['red', 'blue', 'green', 'orange']
-        segment_lines = [None, None]
-
-        fig, ax = plt.subplots(figsize=(5, 4))
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 10)
-        ax.grid(True)
-        ax.set_title(tr("plot_title"))
-
-        if self.theme_mode == "dark":
-            fig.patch.set_facecolor('#2e2e2e')
-            ax.set_facecolor('#1e1e1e')
-            ax.tick_params(colors='white')
-            ax.xaxis.label.set_color('white')
-            ax.yaxis.label.set_color('white')
-            ax.title.set_color('white')
-            for spine in ax.spines.values():
-                spine.set_color('white')
-
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(pady=(10, 0))
-
-        toolbar_frame = ttk.Frame(parent)
-        toolbar_frame.pack(pady=0)
+        point_coords = [None] * 4
 
-        class CustomToolbar(NavigationToolbar2Tk):
-            toolitems = [t for t in NavigationToolbar2Tk.toolitems if t[0] == 'Pan']
+        ax = self.get_plot(parent, pady=(10, 0))
+        toolbar = self.toolbar
 
-        toolbar = CustomToolbar(canvas, toolbar_frame)
-        toolbar.update()
-
-        if self.theme_mode == "dark":
-            toolbar.config(background="#2e2e2e", borderwidth=0)
-            for child in toolbar.winfo_children():
-                child.configure(background="#2e2e2e", foreground="white", activebackground="#3a3a3a")
+        # Artyści tworzeni raz; zmiana punktów podmienia ich dane i odświeża wykres przez blitting
+        points_artist = ax.scatter([], [])
+        point_labels = [
+            ax.annotate(
+                f"P{i+1}",
+                (0, 0),
+                xytext=(5, 5),
+                textcoords="offset points",
+                color=colors[i],
+                fontsize=10,
+                weight="bold",
+                visible=False
+            )
+            for i in range(4)
+        ]
+        segment_lines = [ax.plot([], [], color='gray', linestyle='--')[0] for _ in range(2)]
+        result_segment = ax.plot([], [], color='#00bfff', linewidth=2)[0]
+        result_point = ax.plot([], [], 'o', color='#00bfff', markersize=8)[0]
+        self.blit.add(*segment_lines, result_segment, result_point, points_artist, *point_labels)
+
+        def set_point(index, point):
+            point_coords[index] = point
+            present = [i for i in range(4) if point_coords[i] is not None]
+            points_artist.set_offsets(np.array([point_coords[i] for i in present]).reshape(-1, 2))
+            points_artist.set_facecolor([colors[i] for i in present])
+            label = point_labels[index]
+            label.set_visible(point is not None)
+            if point is not None:
+                label.xy = point
 
         def update_plot_from_entry(index):
             x_str = self.entries[index * 2].get().strip()
             y_str = self.entries[index * 2 + 1].get().strip()
 
-            if not x_str or not y_str:
-                if point_dots[index]:
-                    point_dots[index].remove()
-                    point_dots[index] = None
-                if point_labels[index]:
-                    point_labels[index].remove()
-                    point_labels[index] = None
-                update_lines()
-                canvas.draw()
-                return
-
             try:
-                x_val = float(x_str)
-                y_val = float(y_str)
-
-                if point_dots[index]:
-                    point_dots[index].remove()
-                if point_labels[index]:
-                    point_labels[index].remove()
-
-                point_dots[index] = ax.plot(x_val, y_val, 'o', color=colors[index])[0]
-                point_labels[index] = ax.annotate(
-                    f"P{index+1}",
-                    (x_val, y_val),
-                    xytext=(5, 5),
-                    textcoords="offset points",
-                    color=colors[index],
-                    fontsize=10,
-                    weight="bold"
-                )
-                update_lines()
-                canvas.draw()
+                point = (float(x_str), float(y_str)) if x_str and y_str else None
             except ValueError:
-                pass
+                return
+            self.scheduler.request(("point", index), lambda: set_point(index, point))
+            self.scheduler.request("lines", update_lines)
 
         for i in range(4):
             x_entry = ttk.Entry(input_frame, width=8)
@@ -442,65 +844,56 @@ class AppWindow:
             y_entry.bind("<Return>", make_entry_callback(i))
 
         def update_lines():
-            try:
-                x1 = float(self.entries[0].get())
-                y1 = float(self.entries[1].get())
-                x2 = float(self.entries[2].get())
-                y2 = float(self.entries[3].get())
-
-                if segment_lines[0]:
-                    segment_lines[0].remove()
-                segment_lines[0] = ax.plot([x1, x2], [y1, y2], color='gray', linestyle='--')[0]
-            except ValueError:
-                if segment_lines[0]:
-                    segment_lines[0].remove()
-                    segment_lines[0] = None
-
-            try:
-                x3 = float(self.entries[4].get())
-                y3 = float(self.entries[5].get())
-                x4 = float(self.entries[6].get())
-                y4 = float(self.entries[7].get())
-
-                if segment_lines[1]:
-                    segment_lines[1].remove()
-                segment_lines[1] = ax.plot([x3, x4], [y3, y4], color='gray', linestyle='--')[0]
-            except ValueError:
-                if segment_lines[1]:
-                    segment_lines[1].remove()
-                    segment_lines[1] = None
+            for k, line in enumerate(segment_lines):
+                try:
+                    x1, y1, x2, y2 = [float(e.get()) for e in self.entries[4 * k:4 * k + 4]]
+                    line.set_data([x1, x2], [y1, y2])
+                except ValueError:
+                    line.set_data([], [])
 
-        intersection_visual = [None]
         def calculate():
             try:
                 coords_str = [e.get().strip() for e in self.entries]
                 if any(not s for s in coords_str):
                     show_custom_result(tr("error"), tr("missing_coords"))
                     return
-
                 coords = [float(s) for s in coords_str]
-                result_text, intersection_data = callback()
+            except ValueError:
+                show_custom_result(tr("error"), tr("invalid_coord_error"))
+                return
+
+            # Obliczenie w wątku roboczym, rysowanie wyniku w wątku Tk
+            def compute():
+                with timing.run("calculate"):
+                    with timing.stage("compute"):
+                        return callback(*coords)
 
+            def on_done(result):
+                result_text, intersection_data = result
                 if coords == [2.0, 1.0, 3.0, 7.0, 4.0, 2.0, 0.0, 0.0]:
                     result_text = f"{tr('special_info')}\n{result_text}"
 
-                if intersection_visual[0]:
-                    intersection_visual[0].remove()
-                    intersection_visual[0] = None
-
-                if intersection_data:
-                    if isinstance(intersection_data[0], tuple):
-                        (x1, y1), (x2, y2) = intersection_data
-                        intersection_visual[0] = ax.plot([x1, x2], [y1, y2], color='#00bfff', linewidth=2)[0]
-                    else:
-                        x, y = intersection_data
-                        intersection_visual[0] = ax.plot(x, y, 'o', color='#00bfff', markersize=8)[0]
-                canvas.draw()
+                with timing.run("draw"):
+                    result_segment.set_data([], [])
+                    result_point.set_data([], [])
+
+                    if intersection_data:
+                        if isinstance(intersection_data[0], tuple):
+                            (x1, y1), (x2, y2) = intersection_data
+                            result_segment.set_data([x1, x2], [y1, y2])
+                        else:
+                            x, y = intersection_data
+                            result_point.set_data([x], [y])
+                    self.blit.update()
                 show_custom_result(tr("result"), result_text)
-            except ValueError:
-                show_custom_result(tr("error"), tr("invalid_coord_error"))
-            except Exception as e:
-                show_custom_result(tr("error"), str(e))
+
+            def on_error(e):
+                if isinstance(e, ValueError):
+                    show_custom_result(tr("error"), tr("invalid_coord_error"))
+                else:
+                    show_custom_result(tr("error"), str(e))
+
+            self.worker.run(compute, on_done, on_error)
 
         def show_custom_result(title, message, x_offset=810, y_offset=180):
             popup = tk.Toplevel(self.root)
@@ -547,28 +940,24 @@ class AppWindow:
                 os.makedirs(save_dir, exist_ok=True)
 
                 timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                filename = os.path.join(save_dir, f"points_{timestamp}.csv")
-
-                with open(filename, mode="w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["Point", "X", "Y"])
-                    for i, (x, y) in enumerate(points, start=1):
-                        writer.writerow([f"P{i}", x, y])
+                filename = os.path.join(save_dir, f"points_{timestamp}{self.save_format}")
+                save_points(filename, points)
+                SaveCatalog(save_dir).add(os.path.basename(filename), points)
 
                 messagebox.showinfo(tr("saved"), f"{tr('save_success')}\n{filename}")
             except Exception as e:
                 messagebox.showerror(tr("error"), f"{tr('save_error')}\n{str(e)}")
 
         def back_and_close_plot():
-            plt.close(fig)
             self.render_main_menu()
 
         def clear():
-            plt.close(fig)
             self.render_main_menu()
             self.open_intersection_window()
 
-        ttk.Button(parent, text=tr("calculate"), command=calculate, width=30).pack(pady=5)
+        calculate_button = ttk.Button(parent, text=tr("calculate"), command=calculate, width=30)
+        calculate_button.pack(pady=5)
+        self.make_busy_indicator(parent, calculate_button)
         ttk.Button(parent, text=tr("save"), command=save, width=30).pack(pady=5)
         ttk.Button(parent, text=tr("clear"), command=clear, width=30).pack(pady=5)
         ttk.Button(parent, text=tr("back"), command=back_and_close_plot, width=30).pack(pady=5)
@@ -590,42 +979,24 @@ class AppWindow:
             self.entries[index * 2 + 1].delete(0, tk.END)
             self.entries[index * 2 + 1].insert(0, str(y))
 
-            if point_dots[index]:
-                point_dots[index].remove()
-            if point_labels[index]:
-                point_labels[index].remove()
-
-            point_dots[index] = ax.plot(x, y, 'o', color=colors[index])[0]
-            point_labels[index] = ax.annotate(
-                f"P{index+1}",
-                (x, y),
-                xytext=(5, 5),
-                textcoords="offset points",
-                color=colors[index],
-                fontsize=10,
-                weight="bold"
-            )
-            update_lines()
-            canvas.draw()
+            self.scheduler.request(("point", index), lambda: set_point(index, (x, y)))
+            self.scheduler.request("lines", update_lines)
 
             for i in range(index + 1, 4):
                 if self.entries[i * 2].get() == "" or self.entries[i * 2 + 1].get() == "":
                     selected_point_index.set(i)
                     break
 
-        canvas.mpl_connect("button_press_event", onclick)
+        self.on_plot_click(onclick)
 
         def redraw_all_points():
             for i in range(4):
                 update_plot_from_entry(i)
 
         self.redraw_all_points = redraw_all_points
-        self.figure = fig
-        self.canvas = canvas
 
-    def compute_intersection(self):
-        coords = [float(e.get()) for e in self.entries]
-        return check_intersection(*coords)
+    def compute_intersection(self, *coords):
+        return self.results.check_intersection(*coords)
 
     def open_convex_hull_window(self):
         self.clear_frame()
@@ -635,11 +1006,9 @@ class AppWindow:
         self.render_convex_coord_input(wrapper, self.compute_convex_hull)
 
     def render_convex_coord_input(self, parent, callback):
-        self.entries = []
-        self.point_dots = []
+        self.points = PointTable()
         self.point_labels = []
         selected_point_index = tk.IntVar(value=-1)
-        self.hull_line = None
 
         box = tk.LabelFrame(parent, bg=self.bg_color, fg="white", padx=10, pady=10)
         box.pack(padx=10, pady=10, fill="x")
@@ -647,132 +1016,287 @@ class AppWindow:
         frame_wrapper = ttk.Frame(box)
         frame_wrapper.pack(fill="x")
 
-        scroll_canvas = tk.Canvas(frame_wrapper, height=80, highlightthickness=0, background=self.bg_color)
-        h_scroll = ttk.Scrollbar(frame_wrapper, orient="horizontal", command=scroll_canvas.xview)
-        scroll_canvas.configure(xscrollcommand=h_scroll.set)
-
-        scroll_canvas.pack(fill="x")
+        # Edytor wirtualny: widżety istnieją tylko dla kolumn mieszczących się w oknie
+        # i po przewinięciu pokazują kolejne punkty z tablicy self.points
+        input_frame = ttk.Frame(frame_wrapper, height=80)
+        input_frame.pack(fill="x")
+        h_scroll = ttk.Scrollbar(frame_wrapper, orient="horizontal")
         h_scroll.pack(fill="x", pady=0)
 
-        input_frame = ttk.Frame(scroll_canvas)
-        scroll_canvas.create_window((0, 0), window=input_frame, anchor="nw")
-
-        def on_configure(event):
-            scroll_canvas.configure(scrollregion=scroll_canvas.bbox("all"))
-        input_frame.bind("<Configure>", on_configure)
-
-        def update_plot():
-            for dot in self.point_dots:
-                dot.remove()
-            for label in self.point_labels:
-                label.remove()
-            self.point_dots.clear()
-            self.point_labels.clear()
-
-            for i in range(len(self.entries) // 2):
-                try:
-                    x = float(self.entries[i * 2].get())
-                    y = float(self.entries[i * 2 + 1].get())
-                    dot = ax.plot(x, y, 'o', color='tab:blue')[0]
-                    label = ax.annotate(
-                        f"P{i+1}",
-                        (x, y),
-                        xytext=(5, 5),
-                        textcoords="offset points",
-                        color='black' if self.theme_mode == 'light' else 'white',
-                        fontsize=10,
-                        weight="bold"
-                    )
-                    self.point_dots.append(dot)
-                    self.point_labels.append(label)
-                except ValueError:
+        ttk.Label(input_frame, text="x", font=("Segoe UI", 10, "bold")).grid(row=1, column=0, padx=(6, 6), sticky="e")
+        ttk.Label(input_frame, text="y", font=("Segoe UI", 10, "bold")).grid(row=2, column=0, padx=(6, 6), sticky="e")
+
+        column_width = 62
+        columns = []        # widżety widocznych kolumn: (radiobutton, pole x, pole y)
+        shown_index = []    # indeks punktu pokazywanego w każdej kolumnie (None – kolumna ukryta)
+        first_column = [0]  # indeks punktu w pierwszej widocznej kolumnie
+
+        # None w trakcie budowy otoczki w tle (zmiany punktów czekają wtedy w pending_edits)
+        # lub po nieudanej budowie; w obu przypadkach rysowany jest kontur liczony w tle
+        self.live_hull = DynamicConvexHull()
+        pending_edits = []
+        building = [False]
+        outline = [[]]
+
+        def set_point(i, x, y):
+            # Zmienia współrzędne punktu i uzgadnia otoczkę (usunięcie / wstawienie / przesunięcie)
+            old = self.points.point(i)
+            self.points.set_point(i, x, y)
+            sync_hull(old, self.points.point(i))
+
+        def sync_hull(old, new):
+            if old == new:
+                return
+            if self.live_hull is not None:
+                apply_edit(self.live_hull, old, new)
+                return
+            if building[0]:
+                pending_edits.append((old, new))
+            refresh_outline()
+
+        def refresh_outline():
+            # Kontur z convex_hull bieżących punktów w wątku roboczym; nowsze żądanie unieważnia starsze
+            points = self.points.complete()[1].copy()
+
+            def done(hull):
+                outline[0] = hull
+                self.update_convex_plot()
+
+            self.outline_worker.run(lambda: convex_hull(points).coords, done, lambda e: None)
+
+        def apply_edit(hull, old, new):
+            if old is not None:
+                hull.delete(*old)
+            if new is not None:
+                hull.insert(*new)
+
+        def commit_column(slot):
+            # Zapisuje tekst z pól widocznej kolumny do tablicy punktów
+            i = shown_index[slot]
+            if i is None:
+                return
+            old = self.points.point(i)
+            for column, entry in enumerate(columns[slot][1:]):
+                text = entry.get().strip()
+                if text != self.points.text(i, column):
+                    self.points.set_text(i, column, text)
+            sync_hull(old, self.points.point(i))
+
+        def commit_all():
+            for slot in range(len(columns)):
+                commit_column(slot)
+
+        def show_columns():
+            n = len(self.points)
+            for slot, (rb, x_entry, y_entry) in enumerate(columns):
+                i = first_column[0] + slot
+                if i >= n:
+                    shown_index[slot] = None
+                    rb.grid_remove()
+                    x_entry.grid_remove()
+                    y_entry.grid_remove()
                     continue
-            canvas.draw()
-        self.update_convex_plot = update_plot
-
-        def add_point():
-            index = len(self.entries) // 2
-            col = index + 1
+                shown_index[slot] = i
+                rb.configure(text=f"P{i+1}", value=i)
+                for column, entry in ((0, x_entry), (1, y_entry)):
+                    entry.delete(0, tk.END)
+                    entry.insert(0, self.points.text(i, column))
+                rb.grid()
+                x_entry.grid()
+                y_entry.grid()
+            shown = max(0, min(len(columns), n - first_column[0]))
+            plus_btn.grid_forget()
+            plus_btn.grid(row=1, column=shown + 1, rowspan=2, padx=(12, 6), ipadx=4, ipady=2)
+            if n:
+                h_scroll.set(first_column[0] / n, (first_column[0] + shown) / n)
+            else:
+                h_scroll.set(0, 1)
+
+        def scroll_to(first):
+            commit_all()
+            n = len(self.points)
+            first_column[0] = max(0, min(first, n - len(columns)))
+            show_columns()
+
+        def ensure_visible(i):
+            if i < first_column[0]:
+                scroll_to(i)
+            elif i >= first_column[0] + len(columns):
+                scroll_to(i - len(columns) + 1)
+
+        def xview(*args):
+            if args[0] == "moveto":
+                scroll_to(int(float(args[1]) * len(self.points)))
+            elif args[0] == "scroll":
+                step = 1 if args[2] == "units" else max(1, len(columns) - 1)
+                scroll_to(first_column[0] + int(args[1]) * step)
+        h_scroll.configure(command=xview)
+
+        def on_entry_done(slot):
+            commit_column(slot)
+            update_plot()
 
-            if index == 0:
-                ttk.Label(input_frame, text="x", font=("Segoe UI", 10, "bold")).grid(row=1, column=0, padx=(6, 6), sticky="e")
-                ttk.Label(input_frame, text="y", font=("Segoe UI", 10, "bold")).grid(row=2, column=0, padx=(6, 6), sticky="e")
+        def on_select():
+            i = selected_point_index.get()
+            ensure_visible(i)
+            slot = i - first_column[0]
+            if 0 <= slot < len(columns):
+                columns[slot][1].focus_set()
 
-            rb = ttk.Radiobutton(
-                input_frame,
-                text=f"P{index+1}",
-                variable=selected_point_index,
-                value=index
-            )
+        def make_column(slot):
+            col = slot + 1
+            rb = ttk.Radiobutton(input_frame, variable=selected_point_index, command=on_select)
             rb.grid(row=0, column=col, padx=6, pady=(0, 2))
 
             x_entry = ttk.Entry(input_frame, width=6, justify="center")
             x_entry.grid(row=1, column=col, padx=(6, 6))
-            x_entry.bind("<FocusOut>", lambda e: update_plot())
-            x_entry.bind("<Return>", lambda e: update_plot())
-
             y_entry = ttk.Entry(input_frame, width=6, justify="center")
             y_entry.grid(row=2, column=col, padx=(6, 6), pady=(4, 0))
-            y_entry.bind("<FocusOut>", lambda e: update_plot())
-            y_entry.bind("<Return>", lambda e: update_plot())
-
-            def on_select():
-                try:
-                    i = selected_point_index.get()
-                    self.entries[i * 2].focus_set()
-                except:
-                    pass
-
-            rb.configure(command=on_select)
+            for entry in (x_entry, y_entry):
+                entry.bind("<FocusOut>", lambda e, s=slot: on_entry_done(s))
+                entry.bind("<Return>", lambda e, s=slot: on_entry_done(s))
+            columns.append((rb, x_entry, y_entry))
+            shown_index.append(None)
+
+        def on_resize(event):
+            # Liczba kolumn dopasowana do szerokości okna
+            count = max(1, (event.width - 110) // column_width)
+            if count == len(columns):
+                return
+            commit_all()
+            while len(columns) > count:
+                shown_index.pop()
+                for widget in columns.pop():
+                    widget.destroy()
+            while len(columns) < count:
+                make_column(len(columns))
+            scroll_to(first_column[0])
+        frame_wrapper.bind("<Configure>", on_resize)
+
+        def refresh_view():
+            # Dobór reprezentacji punktów do bieżącego widoku (wywoływane też po przesunięciu
+            # lub powiększeniu wykresu paskiem narzędzi):
+            # - ponad LOD_THRESHOLD punktów w widoku – obraz gęstości (histogram2d),
+            # - mniej – znaczniki tylko dla punktów w widoku,
+            # - etykiety tylko wtedy, gdy w widoku jest niewiele punktów.
+            indices, coords = self.points.complete()
+            (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+            inside = (coords[:, 0] >= x0) & (coords[:, 0] <= x1) & (coords[:, 1] >= y0) & (coords[:, 1] <= y1)
+            visible = np.flatnonzero(inside)
+
+            if len(visible) > LOD_THRESHOLD:
+                # Około dwa piksele ekranu na przedział histogramu
+                bins = (max(1, int(ax.bbox.width) // 2), max(1, int(ax.bbox.height) // 2))
+                density, _, _ = np.histogram2d(coords[visible, 0], coords[visible, 1],
+                                               bins=bins, range=[[x0, x1], [y0, y1]])
+                density = np.ma.masked_equal(np.log1p(density.T), 0)
+                density_image.set_data(density)
+                density_image.set_extent((x0, x1, y0, y1))
+                density_image.set_clim(0, density.max())
+                density_image.set_visible(True)
+                points_artist.set_offsets(np.empty((0, 2)))
+            else:
+                density_image.set_visible(False)
+                points_artist.set_offsets(coords[visible])
+
+            if len(visible) > MAX_POINT_LABELS:
+                visible = visible[:0]
+            while len(self.point_labels) < len(visible):
+                label = ax.annotate(
+                    "",
+                    (0, 0),
+                    xytext=(5, 5),
+                    textcoords="offset points",
+                    color='black' if self.theme_mode == 'light' else 'white',
+                    fontsize=10,
+                    weight="bold"
+                )
+                self.blit.add(label)
+                self.point_labels.append(label)
+            for k, label in enumerate(self.point_labels):
+                if k < len(visible):
+                    v = visible[k]
+                    label.xy = (coords[v, 0], coords[v, 1])
+                    label.set_text(f"P{indices[v] + 1}")
+                    label.set_visible(True)
+                else:
+                    label.set_visible(False)
 
-            self.entries.append(x_entry)
-            self.entries.append(y_entry)
+        def update_view():
+            # Dane punktów podmieniane w miejscu, odświeżenie przez blitting
+            refresh_view()
+            if self.live_hull is None:
+                draw_hull_outline(outline[0])
+            else:
+                draw_hull_outline(self.live_hull.coords)
 
-            plus_btn.grid_forget()
-            plus_btn.grid(row=1, column=col + 1, rowspan=2, padx=(12, 6), ipadx=4, ipady=2)
+        def update_plot():
+            # Kolejne zmiany przed najbliższym odświeżeniem łączone są w jedno
+            self.scheduler.request("view", update_view)
+        self.update_convex_plot = update_plot
 
-            scroll_canvas.update_idletasks()
-            scroll_canvas.xview_moveto(1.0)
+        def add_point():
+            commit_all()
+            index = self.points.append()
+            ensure_visible(index)
+            show_columns()
             selected_point_index.set(index)
-        self.add_point_callback = add_point
+            return index
+
+        def load_points(points):
+            # Wczytanie wielu punktów naraz: tablica od razu, otoczka dynamiczna budowana w tle
+            # (O(n log^3 n) – przy 100 tys. punktów ponad sekunda)
+            self.points.load(points)
+            if not len(self.points):
+                self.points.append()
+            loaded = self.points.complete()[1].tolist()
+            self.live_hull = None
+            building[0] = True
+            pending_edits.clear()
+            outline[0] = []
+            refresh_outline()
+
+            def built(hull):
+                building[0] = False
+                for old, new in pending_edits:
+                    apply_edit(hull, old, new)
+                pending_edits.clear()
+                self.live_hull = hull
+                self.outline_worker.cancel()
+                self.update_convex_plot()
+
+            def failed(e):
+                # Otoczka dynamiczna pozostaje wyłączona – kontur dalej liczony w tle
+                building[0] = False
+                pending_edits.clear()
+                show_custom_result(tr("error"), str(e))
+
+            self.hull_builder.run(lambda: DynamicConvexHull(map(tuple, loaded)), built, failed)
+            first_column[0] = 0
+            show_columns()
+            selected_point_index.set(0)
+        self.load_convex_points = load_points
 
         plus_btn = ttk.Button(input_frame, text="+", width=3, command=add_point)
-        add_point()
+        self.points.append()
+        make_column(0)
+        show_columns()
         selected_point_index.set(0)
 
-        fig, ax = plt.subplots(figsize=(5, 4))
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 10)
-        ax.grid(True)
-        ax.set_title(tr("plot_title"))
-
-        if self.theme_mode == "dark":
-            fig.patch.set_facecolor('#2e2e2e')
-            ax.set_facecolor('#1e1e1e')
-            ax.tick_params(colors='white')
-            ax.xaxis.label.set_color('white')
-            ax.yaxis.label.set_color('white')
-            ax.title.set_color('white')
-            for spine in ax.spines.values():
-                spine.set_color('white')
-
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(pady=0)
-
-        toolbar_frame = ttk.Frame(parent)
-        toolbar_frame.pack(pady=0)
-
-        class CustomToolbar(NavigationToolbar2Tk):
-            toolitems = [t for t in NavigationToolbar2Tk.toolitems if t[0] == 'Pan']
-
-        toolbar = CustomToolbar(canvas, toolbar_frame)
-        toolbar.update()
-
-        if self.theme_mode == "dark":
-            toolbar.config(background="#2e2e2e", borderwidth=0)
-            for child in toolbar.winfo_children():
-                child.configure(background="#2e2e2e", foreground="white", activebackground="#3a3a3a")
+        ax = self.get_plot(parent)
+        canvas = self.canvas
+
+        limits = ax.get_xlim(), ax.get_ylim()
+        density_image = ax.imshow(np.zeros((1, 1)), extent=(0, 10, 0, 10), origin="lower", cmap="Blues",
+                                  interpolation="nearest", aspect="auto", visible=False)
+        ax.set_xlim(*limits[0])
+        ax.set_ylim(*limits[1])
+        points_artist = ax.scatter([], [], color='tab:blue')
+        hull_line = ax.plot([], [], color='blue', linewidth=2)[0]
+        # Kolejność rysowania: gęstość, punkty, otoczka na wierzchu
+        self.blit.add(density_image, points_artist, hull_line)
+        # Po pełnym rysowaniu (przesunięcie, powiększenie, zmiana rozmiaru) widok liczony jest od nowa
+        self.blit.on_redraw = refresh_view
 
         def onclick(event):
             if hasattr(canvas, 'toolbar') and canvas.toolbar.mode != '':
@@ -780,97 +1304,79 @@ class AppWindow:
             if event.xdata is None or event.ydata is None:
                 return
 
+            commit_all()
             x, y = round(event.xdata, 2), round(event.ydata, 2)
             index = selected_point_index.get()
-            total_points = len(self.entries) // 2
+            total_points = len(self.points)
             last_index = total_points - 1
 
-            def is_empty(i):
-                return self.entries[i * 2].get().strip() == "" and self.entries[i * 2 + 1].get().strip() == ""
-
-            if 0 <= index < total_points:
-                x_entry = self.entries[index * 2]
-                y_entry = self.entries[index * 2 + 1]
-
-                if is_empty(index):
-                    x_entry.insert(0, str(x))
-                    y_entry.insert(0, str(y))
-
-                    for i in range(total_points):
-                        if is_empty(i):
-                            selected_point_index.set(i)
-                            break
-                elif index == last_index:
-                    add_point()
-                    self.entries[-2].insert(0, str(x))
-                    self.entries[-1].insert(0, str(y))
-                    selected_point_index.set(len(self.entries) // 2 - 1)
-                else:
-                    x_entry.delete(0, tk.END)
-                    x_entry.insert(0, str(x))
-                    y_entry.delete(0, tk.END)
-                    y_entry.insert(0, str(y))
-
-                    for i in range(total_points):
-                        if is_empty(i):
-                            selected_point_index.set(i)
-                            break
+            if 0 <= index < total_points and (self.points.is_empty(index) or index != last_index):
+                set_point(index, x, y)
+                empty = self.points.first_empty()
+                if empty is not None:
+                    selected_point_index.set(empty)
             else:
-                add_point()
-                self.entries[-2].insert(0, str(x))
-                self.entries[-1].insert(0, str(y))
-                selected_point_index.set(len(self.entries) // 2 - 1)
+                index = add_point()
+                set_point(index, x, y)
+            show_columns()
 
             update_plot()
 
-        canvas.mpl_connect("button_press_event", onclick)
+        self.on_plot_click(onclick)
 
         def calculate():
             try:
-                coords = []
-                for i in range(0, len(self.entries) - 1, 2):
-                    x_text = self.entries[i].get().strip()
-                    y_text = self.entries[i + 1].get().strip()
-
-                    if x_text == "" or y_text == "":
-                        show_custom_result(tr("error"), tr("empty_coord_error"))
-                        return
-
-                    try:
-                        x = float(x_text)
-                        y = float(y_text)
-                        coords.append((x, y))
-                    except ValueError:
-                        show_custom_result(tr("error"), tr("invalid_coord_error"))
-                        return
-                result_msg, hull = callback(coords)
-                draw_convex_hull(hull)
-                show_custom_result(tr("result"), result_msg)
+                commit_all()
+                if self.points.has_invalid():
+                    show_custom_result(tr("error"), tr("invalid_coord_error"))
+                    return
+                if self.points.has_missing():
+                    show_custom_result(tr("error"), tr("empty_coord_error"))
+                    return
             except Exception as e:
                 show_custom_result(tr("error"), str(e))
-
-        def draw_convex_hull(hull):
-            if not hull:
                 return
 
-            if self.hull_line:
-                self.hull_line.remove()
-                self.hull_line = None
+            # Obliczenie na kopii punktów w wątku roboczym (edycja w czasie obliczeń jest możliwa)
+            points = self.points.array.copy()
 
+            def compute():
+                with timing.run("calculate"):
+                    with timing.stage("compute"):
+                        return callback(points)
+
+            def on_done(result):
+                result_msg, hull = result
+                with timing.run("draw"):
+                    draw_convex_hull(hull)
+                show_custom_result(tr("result"), result_msg)
+
+            self.worker.run(compute, on_done, lambda e: show_custom_result(tr("error"), str(e)))
+
+        def draw_hull_outline(hull):
             if len(hull) >= 2:
                 loop = hull + [hull[0]] if len(hull) > 2 else hull
                 xs, ys = zip(*loop)
-                self.hull_line = ax.plot(xs, ys, color='blue', linewidth=2)[0]
+                hull_line.set_data(xs, ys)
+            else:
+                hull_line.set_data([], [])
+
+        def draw_convex_hull(hull):
+            if not hull:
+                return
 
-            canvas.draw()
+            draw_hull_outline(hull)
+            self.blit.update()
         self.draw_convex_hull = draw_convex_hull
 
         def save():
             try:
-                coords = [float(e.get()) for e in self.entries if e.get().strip()]
-                points = [(coords[i], coords[i + 1]) for i in range(0, len(coords), 2)]
+                commit_all()
+                if self.points.has_invalid():
+                    raise ValueError
+                _, points = self.points.complete()
 
-                if not points:
+                if not len(points):
                     messagebox.showerror(tr("error"), tr("empty_coord_error"))
                     return
 
@@ -878,13 +1384,9 @@ class AppWindow:
                 os.makedirs(save_dir, exist_ok=True)
 
                 timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                filename = os.path.join(save_dir, f"points_{timestamp}.csv")
-
-                with open(filename, mode="w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["Point", "X", "Y"])
-                    for i, (x, y) in enumerate(points, start=1):
-                        writer.writerow([f"P{i}", x, y])
+                filename = os.path.join(save_dir, f"points_{timestamp}{self.save_format}")
+                save_points(filename, points)
+                SaveCatalog(save_dir).add(os.path.basename(filename), points)
 
                 messagebox.showinfo(tr("saved"), f"{tr('save_success')}\n{filename}")
             except ValueError:
@@ -918,24 +1420,21 @@ class AppWindow:
             ttk.Button(frame, text="OK", command=popup.destroy).pack(ipadx=4, ipady=2, pady=(10, 0))
 
         def back_and_close_plot():
-            plt.close(fig)
             self.render_main_menu()
 
         def clear():
-            plt.close(fig)
             self.render_main_menu()
             self.open_convex_hull_window()
 
-        ttk.Button(parent, text=tr("calculate"), command=calculate, width=30).pack(pady=5)
+        calculate_button = ttk.Button(parent, text=tr("calculate"), command=calculate, width=30)
+        calculate_button.pack(pady=5)
+        self.make_busy_indicator(parent, calculate_button)
         ttk.Button(parent, text=tr("save"), command=save, width=30).pack(pady=5)
         ttk.Button(parent, text=tr("clear"), command=clear, width=30).pack(pady=5)
         ttk.Button(parent, text=tr("back"), command=back_and_close_plot, width=30).pack(pady=5)
 
-        self.figure = fig
-        self.canvas = canvas
-
     def compute_convex_hull(self, coords):
-        return compute_convex_hull(coords)
+        return self.results.compute_convex_hull(coords)
 
 def run_app():
     app = AppWindow()
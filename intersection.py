@@ -1,3 +1,8 @@
+import heapq
+import math
+import numpy as np
+from predicates import cross_sign, cross_sign_batch, orient2d, orient2d_batch
+import timing
 from translations import tr
 
 """
@@ -26,7 +31,7 @@ Krok po kroku:
 
 3. **Obliczanie punktu przecięcia (funkcja `intersection_point`)**
    - Dla przecinających się prostych, które nie są równoległe, obliczany jest punkt przecięcia za pomocą wzorów na podstawie równań prostych.
-   - W przypadku odcinków równoległych (denominator ≈ 0), zwracane jest `None`.
+   - W przypadku odcinków równoległych (denominator = 0, test dokładny z modułu `predicates`), zwracane jest `None`.
 
 4. **Funkcja `check_intersection` (funkcja główna)**
    - Przyjmuje współrzędne dwóch odcinków.
@@ -39,6 +44,9 @@ Krok po kroku:
      - podano punkty, nie odcinki.
 """
 
+# Zamiana znaku z orient2d (1 – w lewo, -1 – w prawo, 0) na wartości zwracane przez orientation()
+_ORIENTATION = (0, 2, 1)
+
 def orientation(p, q, r):
     """
     Zwraca orientację trzech punktów (p, q, r):
@@ -46,12 +54,10 @@ def orientation(p, q, r):
     - 1: układ zgodny z ruchem wskazówek zegara,
     - 2: układ przeciwny do ruchu wskazówek zegara.
     
-    Używa iloczynu wektorowego do określenia znaku kąta między wektorami pq i qr.
+    Używa iloczynu wektorowego do określenia znaku kąta między wektorami pq i qr
+    (znak wyznaczany dokładnie – predicates.orient2d).
     """
-    val = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
-    if abs(val) < 1e-9:
-        return 0
-    return 1 if val > 0 else 2
+    return _ORIENTATION[orient2d(p[0], p[1], q[0], q[1], r[0], r[1])]
 
 def on_segment(p, q, r):
     """
@@ -93,53 +99,509 @@ def intersection_point(p1, p2, p3, p4):
     x3, y3 = p3
     x4, y4 = p4
 
-    # Wyznacznik (mianownik) układu równań
-    denom = (x1 - x2)*(y3 - y4) - (y1 - y2)*(x3 - x4)
-    if abs(denom) < 1e-9:
+    # Wyznacznik (mianownik) układu równań; równoległość sprawdzana dokładnie
+    if cross_sign(x2, y2, x1, y1, x4, y4, x3, y3) == 0:
         return None  # odcinki są równoległe lub pokrywają się
+    denom = (x1 - x2)*(y3 - y4) - (y1 - y2)*(x3 - x4)
+    if denom == 0:
+        return None  # prawie równoległe – mianownik poniżej dokładności liczb float
 
     # Wzory na punkt przecięcia (x, y)
     px = ((x1*y2 - y1*x2)*(x3 - x4) - (x1 - x2)*(x3*y4 - y3*x4)) / denom
     py = ((x1*y2 - y1*x2)*(y3 - y4) - (y1 - y2)*(x3*y4 - y3*x4)) / denom
     return (px, py)
 
-def check_intersection(x1, y1, x2, y2, x3, y3, x4, y4):
+# Rodzaje wyniku sprawdzenia przecięcia
+NO_INTERSECTION = 0     # odcinki się nie przecinają
+POINT = 1               # przecięcie w jednym punkcie
+OVERLAP = 2             # odcinki współliniowe nakładają się na odcinku
+SAME_POINT = 3          # wszystkie cztery punkty są identyczne
+POINTS_ONLY = 4         # podano dwa różne punkty zamiast odcinków
+UNRESOLVED = 5          # odcinki się przecinają, ale nie wyznaczono punktu przecięcia
+
+class IntersectionResult:
+    """
+    Wynik sprawdzenia przecięcia dwóch odcinków.
+
+    - kind: rodzaj wyniku (NO_INTERSECTION, POINT, OVERLAP, SAME_POINT, POINTS_ONLY, UNRESOLVED),
+    - point: punkt przecięcia (x, y), końce wspólnego odcinka ((x1, y1), (x2, y2)) lub None.
+
+    Komunikat tekstowy (tłumaczenia z modułu translations) tworzony jest dopiero
+    przy odczycie atrybutu `text`.
+    """
+    __slots__ = ("kind", "point")
+
+    def __init__(self, kind, point=None):
+        self.kind = kind
+        self.point = point
+
+    @property
+    def text(self):
+        if not timing.is_enabled():
+            return self._text()
+        with timing.stage("text"):
+            return self._text()
+
+    def _text(self):
+        if self.kind == POINT:
+            return tr("intersect_at").format(x=self.point[0], y=self.point[1])
+        if self.kind == OVERLAP:
+            a, b = self.point
+            return tr("overlap").format(a=a, b=b)
+        if self.kind == SAME_POINT:
+            return tr("all_same_point").format(x=self.point[0], y=self.point[1])
+        if self.kind == POINTS_ONLY:
+            return tr("pairs_same_point")
+        if self.kind == UNRESOLVED:
+            return tr("intersect_but_error")
+        return tr("no_intersection")
+
+    def as_tuple(self):
+        # Format zwracany przez check_intersection: (komunikat, punkt / odcinek / None)
+        return (self.text, self.point)
+
+def find_intersection(x1, y1, x2, y2, x3, y3, x4, y4):
     """
     Sprawdza przecięcie dwóch odcinków zadanych współrzędnymi:
     (x1, y1)-(x2, y2) i (x3, y3)-(x4, y4).
-    
-    Zwraca komunikat tekstowy:
-    - brak przecięcia,
-    - przecięcie w punkcie,
-    - nałożenie się odcinków,
-    - wszystkie punkty są identyczne,
-    - podano punkty, nie odcinki.
+
+    Zwraca IntersectionResult (bez formatowania komunikatu).
     """
     p1, q1 = (x1, y1), (x2, y2)
     p2, q2 = (x3, y3), (x4, y4)
+    # Przy wyłączonym pomiarze bez kontekstów modułu timing (wywołanie pojedynczej pary jest krótkie)
+    if not timing.is_enabled():
+        return _intersection_result(p1, q1, p2, q2, _segments_case(p1, q1, p2, q2))
+    with timing.run("intersection"):
+        with timing.stage("orientation"):
+            case = _segments_case(p1, q1, p2, q2)
+        with timing.stage("point"):
+            return _intersection_result(p1, q1, p2, q2, case)
 
-    # Sprawdzenie, czy oba odcinki są punktami
+def _segments_case(p1, q1, p2, q2):
+    # Analiza orientacji: SAME_POINT / POINTS_ONLY (oba odcinki są punktami), NO_INTERSECTION,
+    # OVERLAP (odcinki współliniowe z częścią wspólną) lub POINT (przecięcie do wyznaczenia)
     if p1 == q1 and p2 == q2:
-        if p1 == p2:
-            return (tr("all_same_point").format(x=x1, y=y1), (x1, y1))
-        else:
-            return (tr("pairs_same_point"), None)
-
+        return SAME_POINT if p1 == p2 else POINTS_ONLY
     if not segments_intersect(p1, q1, p2, q2):
-        return (tr("no_intersection"), None)
-
-    # Sprawdzenie czy są współliniowe i nachodzą na siebie
+        return NO_INTERSECTION
     if orientation(p1, q1, p2) == 0 and orientation(p1, q1, q2) == 0:
+        return OVERLAP
+    return POINT
+
+def _intersection_result(p1, q1, p2, q2, case):
+    if case == SAME_POINT:
+        return IntersectionResult(SAME_POINT, p1)
+    if case in (POINTS_ONLY, NO_INTERSECTION):
+        return IntersectionResult(case)
+
+    # Odcinki współliniowe: część wspólna to środkowe dwa z posortowanych końców
+    if case == OVERLAP:
         points = sorted([p1, q1, p2, q2])
         a, b = points[1], points[2]
         if a == b:
-            return (tr("intersect_at").format(x=a[0], y=a[1]), a)
+            return IntersectionResult(POINT, a)
         else:
-            return (tr("overlap").format(a=a, b=b), (a, b))
+            return IntersectionResult(OVERLAP, (a, b))
 
     # Punkt przecięcia w przypadku zwykłego przecięcia
     pt = intersection_point(p1, q1, p2, q2)
     if pt:
-        return (tr("intersect_at").format(x=pt[0], y=pt[1]), pt)
+        return IntersectionResult(POINT, pt)
     else:
-        return (tr("intersect_but_error"), None)
+        return IntersectionResult(UNRESOLVED)
+
+def check_intersection(x1, y1, x2, y2, x3, y3, x4, y4):
+    """
+    Sprawdza przecięcie dwóch odcinków zadanych współrzędnymi:
+    (x1, y1)-(x2, y2) i (x3, y3)-(x4, y4).
+    
+    Zwraca komunikat tekstowy:
+    - brak przecięcia,
+    - przecięcie w punkcie,
+    - nałożenie się odcinków,
+    - wszystkie punkty są identyczne,
+    - podano punkty, nie odcinki.
+    """
+    return find_intersection(x1, y1, x2, y2, x3, y3, x4, y4).as_tuple()
+
+
+def _orientation_batch(px, py, qx, qy, rx, ry):
+    # Wektoryzowana wersja orientation(): tablica wartości 0 / 1 / 2
+    return np.array(_ORIENTATION, dtype=np.int8)[orient2d_batch(px, py, qx, qy, rx, ry)]
+
+def _on_segment_batch(px, py, qx, qy, rx, ry):
+    # Wektoryzowana wersja on_segment()
+    return (np.minimum(px, rx) <= qx) & (qx <= np.maximum(px, rx)) & \
+           (np.minimum(py, ry) <= qy) & (qy <= np.maximum(py, ry))
+
+def check_intersections_batch(segments_a, segments_b):
+    """
+    Sprawdza przecięcia wielu par odcinków naraz (NumPy).
+
+    Przyjmuje dwie tablice o kształcie (N, 4), w których wiersz i zawiera
+    współrzędne (x1, y1, x2, y2) odcinka z pierwszej i drugiej pary.
+
+    Zwraca krotkę (kinds, points):
+    - kinds: tablica (N,) z rodzajem wyniku (NO_INTERSECTION, POINT, OVERLAP,
+      SAME_POINT, POINTS_ONLY, UNRESOLVED) – ta sama analiza przypadków co w find_intersection,
+    - points: tablica (N, 4); dla POINT i SAME_POINT wiersz to (x, y, nan, nan),
+      dla OVERLAP końce wspólnego odcinka (ax, ay, bx, by), w pozostałych przypadkach same nan.
+    """
+    with timing.run("intersection_batch"):
+        a = np.asarray(segments_a, dtype=np.float64).reshape(-1, 4)
+        b = np.asarray(segments_b, dtype=np.float64).reshape(-1, 4)
+        if a.shape != b.shape:
+            raise ValueError("segments_a i segments_b muszą mieć ten sam kształt (N, 4)")
+
+        x1, y1, x2, y2 = a.T
+        x3, y3, x4, y4 = b.T
+        n = len(a)
+        kinds = np.full(n, NO_INTERSECTION, dtype=np.int8)
+        points = np.full((n, 4), np.nan)
+
+        # 1. Oba odcinki są punktami
+        degenerate = (x1 == x2) & (y1 == y2) & (x3 == x4) & (y3 == y4)
+        same = degenerate & (x1 == x3) & (y1 == y3)
+        kinds[same] = SAME_POINT
+        points[same, 0] = x1[same]
+        points[same, 1] = y1[same]
+        kinds[degenerate & ~same] = POINTS_ONLY
+
+        # 2. Test przecięcia na podstawie orientacji (jak w segments_intersect)
+        with timing.stage("orientation"):
+            o1 = _orientation_batch(x1, y1, x2, y2, x3, y3)
+            o2 = _orientation_batch(x1, y1, x2, y2, x4, y4)
+            o3 = _orientation_batch(x3, y3, x4, y4, x1, y1)
+            o4 = _orientation_batch(x3, y3, x4, y4, x2, y2)
+
+            hit = ((o1 != o2) & (o3 != o4)) | \
+                  ((o1 == 0) & _on_segment_batch(x1, y1, x3, y3, x2, y2)) | \
+                  ((o2 == 0) & _on_segment_batch(x1, y1, x4, y4, x2, y2)) | \
+                  ((o3 == 0) & _on_segment_batch(x3, y3, x1, y1, x4, y4)) | \
+                  ((o4 == 0) & _on_segment_batch(x3, y3, x2, y2, x4, y4))
+            hit &= ~degenerate
+
+        # 3. Odcinki współliniowe – środkowe dwa z czterech posortowanych punktów
+        with timing.stage("colinear"):
+            colinear = hit & (o1 == 0) & (o2 == 0)
+            if colinear.any():
+                cx = np.stack((x1, x2, x3, x4), axis=1)[colinear]
+                cy = np.stack((y1, y2, y3, y4), axis=1)[colinear]
+                # Sortowanie leksykograficzne (x, potem y) czterech punktów w każdym wierszu
+                order = np.argsort(cy, axis=1, kind="stable")
+                order = np.take_along_axis(order, np.argsort(np.take_along_axis(cx, order, axis=1), axis=1, kind="stable"), axis=1)
+                sx = np.take_along_axis(cx, order, axis=1)
+                sy = np.take_along_axis(cy, order, axis=1)
+                ax_, ay_, bx_, by_ = sx[:, 1], sy[:, 1], sx[:, 2], sy[:, 2]
+                touch = (ax_ == bx_) & (ay_ == by_)
+
+                rows = np.flatnonzero(colinear)
+                kinds[rows] = np.where(touch, POINT, OVERLAP)
+                points[rows, 0] = ax_
+                points[rows, 1] = ay_
+                points[rows[~touch], 2] = bx_[~touch]
+                points[rows[~touch], 3] = by_[~touch]
+
+        # 4. Zwykłe przecięcie – punkt z równań prostych
+        with timing.stage("point"):
+            crossing = hit & ~colinear
+            if crossing.any():
+                cx1, cy1, cx2, cy2 = x1[crossing], y1[crossing], x2[crossing], y2[crossing]
+                cx3, cy3, cx4, cy4 = x3[crossing], y3[crossing], x4[crossing], y4[crossing]
+                denom = (cx1 - cx2)*(cy3 - cy4) - (cy1 - cy2)*(cx3 - cx4)
+                parallel = (cross_sign_batch(cx2, cy2, cx1, cy1, cx4, cy4, cx3, cy3) == 0) | (denom == 0)
+                safe = np.where(parallel, 1.0, denom)
+                px = ((cx1*cy2 - cy1*cx2)*(cx3 - cx4) - (cx1 - cx2)*(cx3*cy4 - cy3*cx4)) / safe
+                py = ((cx1*cy2 - cy1*cx2)*(cy3 - cy4) - (cy1 - cy2)*(cx3*cy4 - cy3*cx4)) / safe
+
+                rows = np.flatnonzero(crossing)
+                kinds[rows] = np.where(parallel, UNRESOLVED, POINT)
+                points[rows, 0] = np.where(parallel, np.nan, px)
+                points[rows, 1] = np.where(parallel, np.nan, py)
+
+        return kinds, points
+
+
+# Algorytm Bentleya–Ottmanna – wszystkie przecięcia w zbiorze N odcinków.
+#
+# Miotła (pionowa prosta) przesuwa się od lewej do prawej; punkty zdarzeń
+# (końce odcinków i znalezione przecięcia) obsługiwane są w kolejności (x, y).
+# W każdym punkcie zdarzenia p (jak u de Berga):
+# - U(p): odcinki zaczynające się w p, L(p): kończące się w p, C(p): zawierające p we wnętrzu,
+# - jeśli |U ∪ L ∪ C| > 1, wszystkie pary tych odcinków są kandydatami na przecięcie,
+# - L ∪ C usuwane są ze struktury miotły, U ∪ C wstawiane w kolejności nachylenia tuż za p,
+# - nowi sąsiedzi w strukturze miotły są sprawdzani i ich przecięcie (na prawo od p)
+#   dodawane do kolejki zdarzeń.
+# Kandydaci oceniani są przez find_intersection, więc wynik (punkt, nałożenie współliniowych
+# odcinków, identyczne punkty) jest taki sam jak w check_intersection.
+#
+# Struktura miotły to lista uporządkowana od dołu do góry (wyszukiwanie binarne testem
+# orientation) – O((N + K) log N) porównań, przesunięcia elementów listy wykonywane są w C.
+
+def _sweep_slope(left, right):
+    # Nachylenie odcinka tuż za punktem zdarzenia (odcinek pionowy jest "ostatni")
+    if right[0] == left[0]:
+        return float("inf")
+    return (right[1] - left[1]) / (right[0] - left[0])
+
+def _sweep_containing(status, lefts, rights, p):
+    # Odcinki w strukturze miotły zawierające p tworzą spójny fragment listy [lo, hi);
+    # lo to zarazem miejsce wstawienia odcinków zaczynających się w p
+    lo, hi = 0, len(status)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        s = status[mid]
+        if orientation(lefts[s], rights[s], p) == 2:
+            lo = mid + 1
+        else:
+            hi = mid
+    hi = lo
+    while hi < len(status):
+        s = status[hi]
+        if orientation(lefts[s], rights[s], p) != 0 or not on_segment(lefts[s], p, rights[s]):
+            break
+        hi += 1
+    return lo, hi
+
+def _sweep_position(status, s, near):
+    # Pozycja odcinka s w strukturze miotły (najpierw w pobliżu near) lub None
+    for k in range(max(0, near - 4), min(len(status), near + 4)):
+        if status[k] == s:
+            return k
+    try:
+        return status.index(s)
+    except ValueError:
+        return None
+
+def _sweep_colinear(lefts, rights, s, t):
+    return orientation(lefts[s], rights[s], lefts[t]) == 0 and orientation(lefts[s], rights[s], rights[t]) == 0
+
+def _sweep_between(status, lefts, rights, bottom, top):
+    # Odcinki w strukturze miotły przecinające pionowy odcinek bottom-top (spójny fragment listy)
+    lo = _sweep_containing(status, lefts, rights, bottom)[0]
+    hi = lo
+    while hi < len(status) and orientation(lefts[status[hi]], rights[status[hi]], top) != 1:
+        hi += 1
+    return status[lo:hi]
+
+def _sweep_endpoints(segs):
+    # Końce odcinków uporządkowane leksykograficznie (lewy <= prawy)
+    lefts, rights = [], []
+    for x1, y1, x2, y2 in segs:
+        a, b = (x1, y1), (x2, y2)
+        if b < a:
+            a, b = b, a
+        lefts.append(a)
+        rights.append(b)
+    return lefts, rights
+
+def find_all_intersections(segments):
+    """
+    Znajduje wszystkie przecinające się pary w zbiorze odcinków.
+
+    Przyjmuje sekwencję odcinków (x1, y1, x2, y2) lub tablicę (N, 4).
+    Zwraca listę krotek (i, j, IntersectionResult) dla i < j, w kolejności
+    przesuwania się miotły; wynik dla pary jest taki sam jak find_intersection
+    (pary dwóch różnych punktów – POINTS_ONLY – nie są przecięciem).
+    """
+    with timing.run("all_intersections"):
+        segs = [tuple(map(float, s)) for s in np.asarray(segments, dtype=np.float64).reshape(-1, 4)]
+        with timing.stage("events"):
+            lefts, rights = _sweep_endpoints(segs)
+            events = {}   # punkt zdarzenia -> odcinki zaczynające się w nim (U) oraz odcinki-punkty
+            # Punkt przecięcia -> odcinki, które się w nim przecinają. Punkt jest zaokrąglony,
+            # więc tych odcinków nie da się pewnie odnaleźć testem orientacji względem niego.
+            # Na tej samej zasadzie odcinki kończące się w punkcie zdarzenia (L) są zapisane
+            crossings = {}
+            queue = []
+
+            for i, (a, b) in enumerate(zip(lefts, rights)):
+                if a not in events:
+                    events[a] = []
+                    heapq.heappush(queue, a)
+                events[a].append(i)
+                if b not in events:
+                    events[b] = []
+                    heapq.heappush(queue, b)
+                crossings.setdefault(b, set()).add(i)
+
+        status = []
+        reported = set()
+        results = []
+
+        def report(ids):
+            for k in range(len(ids)):
+                for m in range(k + 1, len(ids)):
+                    i, j = min(ids[k], ids[m]), max(ids[k], ids[m])
+                    if (i, j) in reported:
+                        continue
+                    reported.add((i, j))
+                    result = find_intersection(*segs[i], *segs[j])
+                    if result.kind not in (NO_INTERSECTION, POINTS_ONLY):
+                        results.append((i, j, result))
+
+        def schedule(s, t, p):
+            # Przecięcie sąsiadów s, t leżące na prawo od miotły staje się nowym zdarzeniem
+            ls, rs, lt, rt = lefts[s], rights[s], lefts[t], rights[t]
+            if not segments_intersect(ls, rs, lt, rt):
+                return
+            if orientation(ls, rs, lt) == 0 and orientation(ls, rs, rt) == 0:
+                return  # współliniowe – zgłaszane w punkcie początku jednego z nich
+            pt = intersection_point(ls, rs, lt, rt)
+            if pt is None or not pt > p:
+                # Punkt przecięcia (po zaokrągleniu) nie leży na prawo od miotły – odcinki
+                # przecinają się w p lub przed p. Jeśli s (niższy) ma większe nachylenie, za p
+                # powinien być wyżej – zdarzenie tuż za p zgłosi parę i ją zamieni
+                if _sweep_slope(ls, rs) <= _sweep_slope(lt, rt):
+                    report([s, t])
+                    return
+                pt = (p[0], math.nextafter(p[1], math.inf))
+            # Przecięcie nie później niż koniec któregokolwiek z odcinków
+            pt = min(pt, rs, rt)
+            if pt not in events:
+                events[pt] = []
+                heapq.heappush(queue, pt)
+            crossings.setdefault(pt, set()).update((s, t))
+
+        # Odcinki pionowe nie trafiają do struktury miotły (nie mają w niej jednoznacznego
+        # miejsca). W swoim dolnym końcu zgłaszane są z odcinkami miotły przecinającymi ich
+        # prostą w zakresie y, a do końca zdarzeń o tym samym x są "aktywne" – przecinają się
+        # z odcinkami zaczynającymi się i kończącymi w punktach zdarzeń, przez które przechodzą.
+        verticals = []
+
+        with timing.stage("sweep"):
+            while queue:
+                p = heapq.heappop(queue)
+                starting = events.pop(p)
+                # Aktywne odcinki pionowe zawierające p (te z mniejszym x kończą się przed p)
+                verticals = [v for v in verticals if rights[v] >= p]
+                new_verticals = [s for s in starting if lefts[s][0] == rights[s][0] and lefts[s] != rights[s]]
+                for v in new_verticals:
+                    report([v] + _sweep_between(status, lefts, rights, lefts[v], rights[v]))
+                upper = [s for s in starting if lefts[s][0] != rights[s][0]]
+
+                lo, hi = _sweep_containing(status, lefts, rights, p)
+                known = [k for k in (_sweep_position(status, s, lo) for s in crossings.pop(p, ())) if k is not None]
+                if known:
+                    if lo == hi:
+                        lo, hi = min(known), max(known) + 1
+                    else:
+                        lo, hi = min(lo, *known), max(hi, max(known) + 1)
+                    # Odcinki współliniowe z przecinającymi się (nakładające się) też zawierają p
+                    while lo > 0 and _sweep_colinear(lefts, rights, status[lo - 1], status[lo]):
+                        lo -= 1
+                    while hi < len(status) and _sweep_colinear(lefts, rights, status[hi - 1], status[hi]):
+                        hi += 1
+                containing = status[lo:hi]
+                crossing = [s for s in containing if rights[s] != p]
+
+                if len(starting) + len(containing) + len(verticals) > 1:
+                    report(starting + containing + verticals)
+                verticals += new_verticals
+
+                # Usunięcie L ∪ C i wstawienie U ∪ C w kolejności nachylenia tuż za p
+                inserted = sorted(upper + crossing, key=lambda s: _sweep_slope(lefts[s], rights[s]))
+                status[lo:hi] = inserted
+
+                if not inserted:
+                    if 0 < lo < len(status):
+                        schedule(status[lo - 1], status[lo], p)
+                else:
+                    if lo > 0:
+                        schedule(status[lo - 1], status[lo], p)
+                    top = lo + len(inserted)
+                    if top < len(status):
+                        schedule(status[top - 1], status[top], p)
+
+        return results
+
+
+# Algorytm Shamosa–Hoeya – czy w zbiorze odcinków jest jakiekolwiek przecięcie?
+#
+# Miotła przechodzi wyłącznie przez końce odcinków (bez zdarzeń przecięć) i kończy pracę
+# przy pierwszej znalezionej parze. Para jest sprawdzana testem segments_intersect,
+# gdy odcinki stają się sąsiadami w strukturze miotły lub mają wspólny punkt zdarzenia.
+# Czas O(N log N).
+
+def _first_intersection(segs, ignore_adjacent=None):
+    # Zwraca pierwszą znalezioną przecinającą się parę (i, j) lub None.
+    # ignore_adjacent(i, j) – czy para jest sąsiednimi krawędziami łamanej
+    lefts, rights = _sweep_endpoints(segs)
+
+    def intersects(s, t):
+        if not segments_intersect(lefts[s], rights[s], lefts[t], rights[t]):
+            return False
+        if ignore_adjacent is not None and ignore_adjacent(s, t):
+            # Sąsiednie krawędzie łamanej mają wspólny wierzchołek – liczy się tylko nałożenie
+            return find_intersection(*segs[s], *segs[t]).kind == OVERLAP
+        return True
+
+    starting = {}
+    for i, a in enumerate(lefts):
+        starting.setdefault(a, []).append(i)
+    points = sorted(set(lefts) | set(rights))
+
+    status = []
+    for p in points:
+        lo, hi = _sweep_containing(status, lefts, rights, p)
+        touching = status[lo:hi] + starting.get(p, [])
+
+        # Wszystkie odcinki zawierające p mają z sobą punkt wspólny
+        for k in range(len(touching)):
+            for m in range(k + 1, len(touching)):
+                if intersects(touching[k], touching[m]):
+                    return min(touching[k], touching[m]), max(touching[k], touching[m])
+
+        crossing = [s for s in status[lo:hi] if rights[s] != p]
+        inserted = [s for s in starting.get(p, []) if lefts[s] != rights[s]] + crossing
+        inserted.sort(key=lambda s: _sweep_slope(lefts[s], rights[s]))
+        status[lo:hi] = inserted
+
+        # Nowi sąsiedzi w strukturze miotły
+        top = lo + len(inserted)
+        for below, above in ((lo - 1, lo), (top - 1, top)):
+            if 0 <= below and above < len(status):
+                s, t = status[below], status[above]
+                if intersects(s, t):
+                    return min(s, t), max(s, t)
+    return None
+
+def find_any_intersection(segments):
+    """
+    Sprawdza, czy w zbiorze odcinków (x1, y1, x2, y2) istnieje jakiekolwiek przecięcie.
+
+    Zwraca parę indeksów (i, j), i < j, pierwszych znalezionych przecinających się
+    odcinków lub None, jeśli żadne dwa odcinki się nie przecinają.
+    """
+    segs = [tuple(map(float, s)) for s in np.asarray(segments, dtype=np.float64).reshape(-1, 4)]
+    with timing.run("any_intersection"):
+        return _first_intersection(segs)
+
+def find_polyline_self_intersection(points, closed=True):
+    """
+    Szuka samoprzecięcia łamanej zadanej wierzchołkami [(x, y), ...].
+
+    Krawędź i łączy punkty i oraz i + 1 (dla closed=True ostatnia krawędź wraca do punktu 0).
+    Sąsiednie krawędzie przecinają się tylko wtedy, gdy nakładają się na odcinku.
+    Zwraca parę indeksów krawędzi (i, j), i < j, lub None dla łamanej prostej.
+    """
+    pts = [tuple(map(float, p)) for p in np.asarray(points, dtype=np.float64).reshape(-1, 2)]
+    n = len(pts)
+    if n < 2:
+        return None
+    count = n if closed and n > 2 else n - 1
+    segs = [pts[i] + pts[(i + 1) % n] for i in range(count)]
+
+    def adjacent(i, j):
+        d = abs(i - j)
+        return d == 1 or (count == n and d == n - 1)
+
+    with timing.run("polyline_self_intersection"):
+        return _first_intersection(segs, adjacent)
+
+def is_simple_polygon(points):
+    """
+    Sprawdza, czy wielokąt o wierzchołkach [(x, y), ...] jest prosty (brak samoprzecięć).
+    """
+    return find_polyline_self_intersection(points, closed=True) is None
@@ -1,4 +1,148 @@
-from gui import run_app
+import sys
+import time
+
+_START = time.perf_counter()
+
+# Budżet czasu uruchomienia trybu wsadowego (import modułów geometrycznych) w sekundach
+STARTUP_BUDGET = 0.5
+
+# Tryb wsadowy (bez interfejsu graficznego):
+#     python main.py hull [PLIK ...] [--format json|csv] [--timing]
+#     python main.py intersection [PLIK ...] [--format json|csv] [--timing]
+#
+# Pliki CSV mają kolumny X i Y, pliki .npy tablicę (N, 2) (jak w katalogu saves/);
+# "-" lub brak plików oznacza stdin (CSV).
+# Dla przecięć każde kolejne cztery punkty to jeden przypadek: odcinki P1-P2 i P3-P4.
+# Wynik wypisywany jest na stdout – jeden obiekt JSON na wiersz lub CSV.
+# W tym trybie importowane są tylko moduły geometryczne (bez tkinter i matplotlib).
+# Uruchomienie bez argumentów otwiera aplikację okienkową.
+
+KIND_NAMES = {
+    0: "none",
+    1: "point",
+    2: "overlap",
+    3: "same_point",
+    4: "points_only",
+    5: "unresolved",
+}
+
+HULL_TYPES = {0: "empty", 1: "point", 2: "segment"}
+
+def parse_args(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="main.py", description="Obliczenia geometryczne bez interfejsu graficznego")
+    parser.add_argument("command", choices=["hull", "intersection"])
+    parser.add_argument("files", nargs="*", default=["-"], help="pliki .csv (kolumny X i Y) lub .npy (\"-\" = stdin)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--timing", action="store_true", help="czasy uruchomienia, obliczeń i etapów obliczeń na stderr")
+    return parser.parse_args(argv)
+
+def hull_records(name, result):
+    # Wiersze wyniku dla otoczki: słownik (JSON) i wiersze CSV
+    n = result.num_vertices
+    record = {
+        "input": name,
+        "type": HULL_TYPES.get(n, "polygon"),
+        "vertices": [list(p) for p in result.coords],
+        "indices": result.indices,
+    }
+    labels = result.indices or range(n)
+    rows = [[name, f"P{i + 1}", x, y] for i, (x, y) in zip(labels, result.coords)]
+    return [record], rows
+
+def intersection_records(name, results):
+    # Wiersze wyniku dla kolejnych przypadków przecięcia: słowniki (JSON) i wiersze CSV
+    records, rows = [], []
+    for case, result in enumerate(results):
+        kind = KIND_NAMES[result.kind]
+        if result.point is None:
+            ends = []
+        elif isinstance(result.point[0], tuple):
+            ends = [list(p) for p in result.point]
+        else:
+            ends = [list(result.point)]
+        point = ends if len(ends) == 2 else ends[0] if ends else None
+        records.append({"input": name, "case": case, "kind": kind, "point": point})
+        flat = [c for p in ends for c in p]
+        rows.append([name, case, kind] + flat + [""] * (4 - len(flat)))
+    return records, rows
+
+def finite_chunks(chunks):
+    # Porcje punktów bez współrzędnych nieskończonych i NaN (dla nich otoczka nie ma sensu)
+    import numpy as np
+    for chunk in chunks:
+        if not np.isfinite(chunk).all():
+            raise ValueError("Współrzędne punktów muszą być liczbami skończonymi (bez inf i nan)")
+        yield chunk
+
+def run_cli(argv):
+    args = parse_args(argv)
+    import csv
+    import json
+    from convex_hull import convex_hull, convex_hull_stream, iter_csv_chunks
+    from intersection import find_intersection
+    from point_files import load_points
+    import timing
+    startup = time.perf_counter() - _START
+
+    # Czasy etapów (moduł timing) sumowane po wszystkich obliczeniach
+    stages = {}
+    def add_stages(report):
+        for stage, seconds in report.stages.items():
+            stages[stage] = stages.get(stage, 0.0) + seconds
+    if args.timing:
+        timing.enable()
+        timing.add_listener(add_stages)
+
+    if args.format == "csv":
+        writer = csv.writer(sys.stdout)
+        if args.command == "hull":
+            writer.writerow(["Input", "Point", "X", "Y"])
+        else:
+            writer.writerow(["Input", "Case", "Kind", "X1", "Y1", "X2", "Y2"])
+
+    status = 0
+    compute_start = time.perf_counter()
+    for name in args.files:
+        source = sys.stdin if name == "-" else name
+        try:
+            if name.endswith(".npy"):
+                # Plik .npy mapowany do pamięci – cała tablica naraz
+                chunks = [load_points(name)]
+            else:
+                chunks = iter_csv_chunks(source, args.chunk_size)
+            chunks = finite_chunks(chunks)
+            if args.command == "hull":
+                hull = convex_hull(next(chunks)) if name.endswith(".npy") else convex_hull_stream(chunks)
+                records, rows = hull_records(name, hull)
+            else:
+                coords = [c for chunk in chunks for c in chunk.ravel().tolist()]
+                if len(coords) % 8:
+                    raise ValueError(f"Liczba punktów ({len(coords) // 2}) nie jest wielokrotnością 4")
+                results = [find_intersection(*coords[i:i + 8]) for i in range(0, len(coords), 8)]
+                records, rows = intersection_records(name, results)
+        except (OSError, ValueError) as e:
+            print(f"Błąd ({name}): {e}", file=sys.stderr)
+            status = 1
+            continue
+        if args.format == "csv":
+            writer.writerows(rows)
+        else:
+            for record in records:
+                sys.stdout.write(json.dumps(record) + "\n")
+    compute = time.perf_counter() - compute_start
+
+    if args.timing:
+        times = {"startup_s": round(startup, 4), "budget_s": STARTUP_BUDGET, "compute_s": round(compute, 4),
+                 "stages_s": {stage: round(seconds, 4) for stage, seconds in stages.items()}}
+        print(json.dumps(times), file=sys.stderr)
+    if startup > STARTUP_BUDGET:
+        print(f"Uwaga: uruchomienie trwało {startup:.3f} s (budżet {STARTUP_BUDGET} s)", file=sys.stderr)
+    return status
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    from gui import run_app
     run_app()
@@ -0,0 +1,43 @@
+import csv
+import numpy as np
+from convex_hull import iter_csv_chunks
+
+# Formaty plików z punktami w katalogu saves/:
+# - .csv – kolumny Point, X, Y (format tekstowy, wolny dla dużych zbiorów),
+# - .npy – tablica float64 o kształcie (N, 2) w formacie NumPy: krótki nagłówek
+#   i surowe dane, wczytywana przez numpy.memmap bez kopiowania i bez parsowania.
+SAVE_FORMATS = (".csv", ".npy")
+
+def is_points_file(name):
+    return name.endswith(SAVE_FORMATS)
+
+def save_points(path, points):
+    """
+    Zapisuje punkty [(x, y), ...] lub tablicę (N, 2) do pliku .csv albo .npy
+    (format wybierany na podstawie rozszerzenia).
+    """
+    if path.endswith(".npy"):
+        np.save(path, np.asarray(points, dtype=np.float64).reshape(-1, 2))
+        return
+    with open(path, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Point", "X", "Y"])
+        for i, (x, y) in enumerate(points, start=1):
+            writer.writerow([f"P{i}", x, y])
+
+def load_points(path):
+    """
+    Wczytuje punkty z pliku .csv lub .npy jako tablicę (N, 2).
+
+    Plik .npy jest mapowany do pamięci (numpy.memmap, tylko do odczytu) – dane
+    wczytywane są z dysku dopiero przy dostępie.
+    """
+    if path.endswith(".npy"):
+        points = np.load(path, mmap_mode="r")
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"Nieprawidłowy kształt tablicy punktów: {points.shape}")
+        return points
+    chunks = list(iter_csv_chunks(path))
+    if not chunks:
+        return np.empty((0, 2))
+    return np.concatenate(chunks)
@@ -0,0 +1,105 @@
+import math
+import numpy as np
+
+class PointTable:
+    """
+    Współrzędne punktów edytora otoczki w tablicy NumPy (N, 2).
+
+    - brak wartości współrzędnej zapisywany jest jako NaN,
+    - tekst, którego nie da się zamienić na liczbę, przechowywany jest osobno
+      (do ponownego wyświetlenia w polu edycji), a współrzędna ma wartość NaN,
+    - tekst poprawnej liczby wpisany w polu edycji też jest zapamiętywany, więc pole
+      pokazuje go bez zmian (np. "1", a nie "1.0"),
+    - tablica rośnie geometrycznie, więc dodawanie punktów ma stały koszt zamortyzowany.
+    """
+    __slots__ = ("_data", "_size", "_invalid", "_typed")
+
+    def __init__(self, points=None):
+        self._data = np.full((16, 2), np.nan)
+        self._size = 0
+        self._invalid = {}   # (indeks, kolumna) -> wpisany tekst
+        self._typed = {}     # (indeks, kolumna) -> wpisany tekst poprawnej liczby
+        if points is not None:
+            self.load(points)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def array(self):
+        # Widok (bez kopiowania) na współrzędne wszystkich punktów
+        return self._data[:self._size]
+
+    def load(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._data = np.full((max(16, 2 * len(points)), 2), np.nan)
+        self._data[:len(points)] = points
+        self._size = len(points)
+        self._invalid.clear()
+        self._typed.clear()
+
+    def append(self, x=math.nan, y=math.nan):
+        if self._size == len(self._data):
+            grown = np.full((2 * len(self._data), 2), np.nan)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size] = (x, y)
+        self._size += 1
+        return self._size - 1
+
+    def point(self, i):
+        # Punkt (x, y) lub None, gdy brakuje którejś współrzędnej
+        x, y = self._data[i].tolist()
+        if math.isnan(x) or math.isnan(y):
+            return None
+        return (x, y)
+
+    def set_point(self, i, x, y):
+        self._data[i] = (x, y)
+        for column in (0, 1):
+            self._invalid.pop((i, column), None)
+            self._typed.pop((i, column), None)
+
+    def text(self, i, column):
+        # Tekst do wyświetlenia w polu edycji współrzędnej
+        if (i, column) in self._invalid:
+            return self._invalid[(i, column)]
+        if (i, column) in self._typed:
+            return self._typed[(i, column)]
+        value = self._data[i, column]
+        return "" if math.isnan(value) else str(float(value))
+
+    def set_text(self, i, column, text):
+        text = text.strip()
+        self._invalid.pop((i, column), None)
+        self._typed.pop((i, column), None)
+        try:
+            value = float(text) if text else math.nan
+        except ValueError:
+            self._invalid[(i, column)] = text
+            value = math.nan
+        else:
+            if text:
+                self._typed[(i, column)] = text
+        self._data[i, column] = value
+
+    def is_empty(self, i):
+        return bool(np.isnan(self._data[i]).all()) and (i, 0) not in self._invalid and (i, 1) not in self._invalid
+
+    def first_empty(self):
+        # Indeks pierwszego punktu bez współrzędnych lub None
+        for i in np.flatnonzero(np.isnan(self.array).all(axis=1)).tolist():
+            if self.is_empty(i):
+                return i
+        return None
+
+    def has_invalid(self):
+        return bool(self._invalid)
+
+    def has_missing(self):
+        return bool(np.isnan(self.array).any())
+
+    def complete(self):
+        # Indeksy i współrzędne punktów z obiema współrzędnymi
+        mask = ~np.isnan(self.array).any(axis=1)
+        return np.flatnonzero(mask), self.array[mask]
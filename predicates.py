@@ -0,0 +1,159 @@
+import math
+import numpy as np
+
+"""
+Predykaty geometryczne wspólne dla modułów convex_hull i intersection.
+
+Znak iloczynu wektorowego liczony jest najpierw w arytmetyce zmiennoprzecinkowej.
+Jeśli wartość jest większa od oszacowania błędu zaokrągleń (filtr Shewchuka),
+jej znak jest na pewno poprawny. W przeciwnym razie (punkty prawie lub dokładnie
+współliniowe) kolejne etapy są coraz droższe:
+- oba iloczyny z czynnikiem zerowym (powtórzone punkty, odcinki poziome i pionowe) – zero,
+- małe liczby całkowite (siatka, współrzędne całkowite) – wynik float jest dokładny,
+- różnice współrzędnych bez zaokrągleń – mniejsze oszacowanie błędu, a gdy ono nie
+  wystarcza, znak liczony dokładnie z czterech różnic,
+- w pozostałych przypadkach wynik liczony jest dokładnie ze wszystkich współrzędnych:
+  każda liczba float jest ułamkiem o mianowniku 2^k, więc po sprowadzeniu do wspólnego
+  mianownika wyznacznik liczony jest na liczbach całkowitych Pythona.
+
+Dzięki temu nie jest potrzebna stała tolerancja (np. 1e-9), która dla dużych
+współrzędnych dawała błędne orientacje, a dla małych uznawała za współliniowe
+punkty, które współliniowe nie są.
+
+Dla współrzędnych nieskończonych lub NaN wyniku dokładnego nie ma – zwracany jest
+znak wyniku zmiennoprzecinkowego (NaN daje 0), tak jak przed wprowadzeniem tego modułu.
+"""
+
+# Oszacowanie względnego błędu wyznacznika (b - a) × (d - c) w arytmetyce double:
+# |błąd| <= ERRBOUND * (|lewy iloczyn| + |prawy iloczyn|)  (Shewchuk, ccwerrboundA)
+_EPSILON = 2.0 ** -53
+ERRBOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+# To samo oszacowanie, gdy różnice współrzędnych są dokładne (błąd tylko z iloczynów i odejmowania)
+ERRBOUND_EXACT_DIFF = (2.0 + 8.0 * _EPSILON) * _EPSILON
+
+# Liczby całkowite o module poniżej 2^25: różnice i iloczyny liczone są bez zaokrągleń
+_EXACT_INT_LIMIT = 2.0 ** 25
+
+def _ratio(v):
+    try:
+        return v.as_integer_ratio()
+    except AttributeError:
+        return int(v), 1
+
+def _float_sign(det):
+    return (det > 0) - (det < 0)
+
+def _diff_is_exact(a, b, d):
+    # Czy d = fl(a - b) jest różnicą dokładną (błąd odejmowania wg TwoDiff Knutha jest zerem)
+    bv = a - d
+    return a - (d + bv) == 0 and bv - b == 0
+
+def _adaptive_sign(det, left, right, ax, ay, bx, by, cx, cy, dx, dy):
+    # Znak (b - a) × (d - c), gdy filtr Shewchuka ani test małych liczb całkowitych nie rozstrzygnęły
+    values = (ax, ay, bx, by, cx, cy, dx, dy)
+    if not all(map(math.isfinite, values)):
+        return _float_sign(det)
+    p, q, r, s = bx - ax, dy - cy, by - ay, dx - cx
+    if (_diff_is_exact(bx, ax, p) and _diff_is_exact(dy, cy, q)
+            and _diff_is_exact(by, ay, r) and _diff_is_exact(dx, cx, s)):
+        if abs(det) > ERRBOUND_EXACT_DIFF * (abs(left) + abs(right)):
+            return 1 if det > 0 else -1
+        # p·q - r·s na liczbach całkowitych; mianowniki są potęgami dwójki
+        (pn, pd), (qn, qd), (rn, rd), (sn, sd) = map(_ratio, (p, q, r, s))
+        det = pn * qn * rd * sd - rn * sn * pd * qd
+        return (det > 0) - (det < 0)
+    return _exact_cross_sign(*values)
+
+def _exact_cross_sign(ax, ay, bx, by, cx, cy, dx, dy):
+    # Dokładny znak (b - a) × (d - c) na liczbach całkowitych
+    ratios = [_ratio(v) for v in (ax, ay, bx, by, cx, cy, dx, dy)]
+    scale = max(d for _, d in ratios)
+    ax, ay, bx, by, cx, cy, dx, dy = [n * (scale // d) for n, d in ratios]
+    det = (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+    return (det > 0) - (det < 0)
+
+def cross_sign(ax, ay, bx, by, cx, cy, dx, dy):
+    """
+    Znak iloczynu wektorowego (b - a) × (d - c): 1, -1 lub 0 (wynik dokładny).
+    """
+    u = bx - ax
+    v = dy - cy
+    w = by - ay
+    z = dx - cx
+    left = u * v
+    right = w * z
+    det = left - right
+    if abs(det) > ERRBOUND * (abs(left) + abs(right)):
+        return 1 if det > 0 else -1
+    # Oba iloczyny z czynnikiem zerowym (różnica float jest zerem tylko dla równych liczb):
+    # powtórzone punkty, odcinki poziome i pionowe – wyznacznik jest dokładnie zerem
+    if (u == 0 or v == 0) and (w == 0 or z == 0):
+        return 0
+    # Małe liczby całkowite (np. punkty na siatce) – wynik zmiennoprzecinkowy jest dokładny;
+    # reszta z dzielenia przez 1 dla NaN i inf to NaN, więc takie wartości nie przechodzą testu
+    if (ax % 1.0 == ay % 1.0 == bx % 1.0 == by % 1.0 == cx % 1.0 == cy % 1.0 == dx % 1.0 == dy % 1.0 == 0
+            and -_EXACT_INT_LIMIT < ax < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < ay < _EXACT_INT_LIMIT
+            and -_EXACT_INT_LIMIT < bx < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < by < _EXACT_INT_LIMIT
+            and -_EXACT_INT_LIMIT < cx < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < cy < _EXACT_INT_LIMIT
+            and -_EXACT_INT_LIMIT < dx < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < dy < _EXACT_INT_LIMIT):
+        return _float_sign(det)
+    return _adaptive_sign(det, left, right, ax, ay, bx, by, cx, cy, dx, dy)
+
+def orient2d(ax, ay, bx, by, cx, cy):
+    """
+    Orientacja trójki punktów (a, b, c): 1 – skręt w lewo (przeciwnie do ruchu
+    wskazówek zegara), -1 – skręt w prawo, 0 – punkty współliniowe (wynik dokładny).
+    """
+    u = bx - ax
+    v = cy - ay
+    w = by - ay
+    z = cx - ax
+    left = u * v
+    right = w * z
+    det = left - right
+    if abs(det) > ERRBOUND * (abs(left) + abs(right)):
+        return 1 if det > 0 else -1
+    if (u == 0 or v == 0) and (w == 0 or z == 0):
+        return 0
+    if (ax % 1.0 == ay % 1.0 == bx % 1.0 == by % 1.0 == cx % 1.0 == cy % 1.0 == 0
+            and -_EXACT_INT_LIMIT < ax < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < ay < _EXACT_INT_LIMIT
+            and -_EXACT_INT_LIMIT < bx < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < by < _EXACT_INT_LIMIT
+            and -_EXACT_INT_LIMIT < cx < _EXACT_INT_LIMIT and -_EXACT_INT_LIMIT < cy < _EXACT_INT_LIMIT):
+        return _float_sign(det)
+    return _adaptive_sign(det, left, right, ax, ay, bx, by, ax, ay, cx, cy)
+
+def cross_sign_batch(ax, ay, bx, by, cx, cy, dx, dy):
+    """
+    Wektoryzowana wersja cross_sign: tablica znaków (int8) dla tablic współrzędnych.
+    """
+    ax, ay, bx, by, cx, cy, dx, dy = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (ax, ay, bx, by, cx, cy, dx, dy)))
+    with np.errstate(invalid="ignore", over="ignore"):
+        left = (bx - ax) * (dy - cy)
+        right = (by - ay) * (dx - cx)
+        det = left - right
+    # Porównania zamiast np.sign – NaN daje 0 (rzutowanie NaN na int8 jest niezdefiniowane)
+    sign = (det > 0).view(np.int8) - (det < 0).view(np.int8)
+
+    uncertain = np.flatnonzero(np.abs(det) <= ERRBOUND * (np.abs(left) + np.abs(right)))
+    if len(uncertain) == 0:
+        return sign
+    coords = [v.ravel()[uncertain] for v in (ax, ay, bx, by, cx, cy, dx, dy)]
+
+    # Małe liczby całkowite (np. punkty na siatce) – wynik zmiennoprzecinkowy jest dokładny
+    exact = np.ones(len(uncertain), dtype=bool)
+    for v in coords:
+        exact &= (np.abs(v) < _EXACT_INT_LIMIT) & (v == np.round(v))
+    rest = uncertain[~exact]
+    if len(rest):
+        flat = sign.reshape(-1)
+        for k, values in zip(rest.tolist(), zip(*(v[~exact].tolist() for v in coords))):
+            if all(map(math.isfinite, values)):
+                flat[k] = _exact_cross_sign(*values)
+    return sign
+
+def orient2d_batch(ax, ay, bx, by, cx, cy):
+    """
+    Wektoryzowana wersja orient2d: tablica wartości 1 / -1 / 0 (int8).
+    """
+    return cross_sign_batch(ax, ay, bx, by, ax, ay, cx, cy)
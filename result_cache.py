@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from convex_hull import ConvexHullResult, convex_hull
+from intersection import find_intersection
+import timing
+
+"""
+Pamięć podręczna wyników otoczki wypukłej i przecięcia odcinków.
+
+Kluczem jest skrót (BLAKE2b) danych wejściowych po sprowadzeniu do postaci kanonicznej:
+tablicy float64 (N, 2) w układzie C dla otoczki i ośmiu liczb float64 dla przecięcia.
+Wynik zależy od kolejności punktów (etykiety P1, P2, ...), więc kolejność nie jest zmieniana.
+
+Przechowywane są wyniki bez tekstu (ConvexHullResult, IntersectionResult) – opis tworzony
+jest przy odczycie, więc zmiana języka nie unieważnia pamięci podręcznej.
+
+Warstwy:
+- pamięć – LRU ograniczone liczbą wpisów i przybliżonym rozmiarem w bajtach,
+- dysk (opcjonalnie) – baza SQLite z otoczkami, zachowana po ponownym uruchomieniu
+  aplikacji; baza (i jej katalog) tworzona jest dopiero przy pierwszym użyciu,
+  ograniczona liczbą wpisów. Po przekroczeniu limitu usuwana jest naraz
+  dziesiąta część najdawniej używanych otoczek, więc usuwanie nie odbywa się przy każdym zapisie.
+"""
+
+# Przybliżony rozmiar wyniku w pamięci (lista krotek współrzędnych i lista indeksów)
+_ENTRY_OVERHEAD = 200
+_VERTEX_SIZE = 150
+
+def _hull_key(coords):
+    digest = hashlib.blake2b(coords.tobytes(), digest_size=16)
+    digest.update(struct.pack("<q", len(coords)))
+    return "hull:" + digest.hexdigest()
+
+def _intersection_key(coords):
+    return "intersection:" + hashlib.blake2b(struct.pack("<8d", *coords), digest_size=16).hexdigest()
+
+def _result_size(result):
+    if isinstance(result, ConvexHullResult):
+        return _ENTRY_OVERHEAD + _VERTEX_SIZE * len(result.coords)
+    return _ENTRY_OVERHEAD
+
+class ResultCache:
+    """
+    Pamięć podręczna LRU wyników compute_convex_hull i check_intersection.
+
+    - max_entries, max_bytes: ograniczenia warstwy w pamięci,
+    - path: ścieżka bazy SQLite warstwy dyskowej (None – bez warstwy dyskowej),
+    - max_disk_entries: największa liczba otoczek w bazie.
+
+    Metody compute_convex_hull i check_intersection zwracają to samo co funkcje
+    o tych nazwach z modułów convex_hull i intersection (dla danych wejściowych
+    zamienionych na float). Można ich używać z kilku wątków.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 2 ** 20, path=None, max_disk_entries=1000):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+        self.entries = OrderedDict()   # klucz -> (wynik, rozmiar)
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path = path
+        self._db = None
+        self._disk_count = 0
+
+    def _disk(self):
+        # Połączenie z bazą warstwy dyskowej, otwierane przy pierwszym użyciu (wywoływane pod blokadą)
+        if self._db is None and self.path is not None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS hulls ("
+                             "key TEXT PRIMARY KEY, coords TEXT, indices TEXT, used REAL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS hulls_used ON hulls (used)")
+            self._db.commit()
+            self._disk_count = self._db.execute("SELECT COUNT(*) FROM hulls").fetchone()[0]
+        return self._db
+
+    def stats(self):
+        # Liczniki trafień (w pamięci i na dysku), chybień oraz zajętość warstwy w pamięci
+        with self._lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "entries": len(self.entries), "bytes": self.size}
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            if self._db is not None or (self.path is not None and os.path.exists(self.path)):
+                self._disk().execute("DELETE FROM hulls")
+                self._db.commit()
+                self._disk_count = 0
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def convex_hull(self, points):
+        # ConvexHullResult dla punktów [(x, y), ...] lub tablicy (N, 2)
+        with timing.stage("cache"):
+            coords = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+            key = _hull_key(coords)
+            result = self._get(key, disk=True)
+        if result is None:
+            result = convex_hull(coords)
+            with timing.stage("cache"):
+                self._put(key, result, disk=True)
+        return result
+
+    def compute_convex_hull(self, points):
+        # (opis tekstowy, lista wierzchołków) – jak convex_hull.compute_convex_hull
+        with timing.run("convex_hull"):
+            return self.convex_hull(points).as_tuple()
+
+    def intersection(self, x1, y1, x2, y2, x3, y3, x4, y4):
+        # IntersectionResult dla odcinków (x1, y1)-(x2, y2) i (x3, y3)-(x4, y4)
+        coords = [float(c) for c in (x1, y1, x2, y2, x3, y3, x4, y4)]
+        key = _intersection_key(coords)
+        result = self._get(key)
+        if result is None:
+            result = find_intersection(*coords)
+            self._put(key, result)
+        return result
+
+    def check_intersection(self, x1, y1, x2, y2, x3, y3, x4, y4):
+        # (komunikat, punkt / odcinek / None) – jak intersection.check_intersection
+        with timing.run("intersection"):
+            return self.intersection(x1, y1, x2, y2, x3, y3, x4, y4).as_tuple()
+
+    def _get(self, key, disk=False):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if disk and self._disk() is not None:
+                row = self._db.execute("SELECT coords, indices FROM hulls WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE hulls SET used = ? WHERE key = ?", (time.time(), key))
+                    self._db.commit()
+                    indices = json.loads(row[1])
+                    result = ConvexHullResult([tuple(p) for p in json.loads(row[0])], indices)
+                    self.disk_hits += 1
+                    self._remember(key, result)
+                    return result
+            self.misses += 1
+            return None
+
+    def _put(self, key, result, disk=False):
+        with self._lock:
+            self._remember(key, result)
+            if disk and self._disk() is not None:
+                added = self._db.execute("INSERT OR IGNORE INTO hulls VALUES (?, ?, ?, ?)",
+                                         (key, json.dumps(result.coords), json.dumps(result.indices),
+                                          time.time())).rowcount
+                if added:
+                    self._disk_count += 1
+                else:
+                    self._db.execute("UPDATE hulls SET used = ? WHERE key = ?", (time.time(), key))
+                if self._disk_count > self.max_disk_entries:
+                    self._evict_disk()
+                self._db.commit()
+
+    def _evict_disk(self):
+        # Usunięcie najdawniej używanych otoczek – do 90% limitu, aby kolejne zapisy nie usuwały
+        keep = self.max_disk_entries - self.max_disk_entries // 10
+        removed = self._db.execute("DELETE FROM hulls WHERE key IN "
+                                   "(SELECT key FROM hulls ORDER BY used LIMIT ?)",
+                                   (self._disk_count - keep,)).rowcount
+        self._disk_count -= removed
+
+    def _remember(self, key, result):
+        # Wstawienie do warstwy w pamięci i usunięcie najdawniej używanych wpisów ponad limity
+        size = _result_size(result)
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+        self.entries[key] = (result, size)
+        self.size += size
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= evicted
@@ -0,0 +1,366 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from convex_hull import convex_hull
+from intersection import IntersectionResult, check_intersections_batch, POINT, SAME_POINT, OVERLAP
+from main import HULL_TYPES, KIND_NAMES
+from shm_transport import SharedArray, attach, ensure_tracker
+
+"""
+Lokalny serwer HTTP/JSON z obliczeniami otoczki wypukłej i przecięć odcinków (bez Tk).
+
+Uruchomienie:
+    python server.py --port 8765 --workers 4
+
+Serwer nasłuchuje wyłącznie na 127.0.0.1. Zapytania:
+
+- POST /hull          {"points": [[x, y], ...]}
+                      -> {"type", "vertices", "indices", "text"} (jak compute_convex_hull)
+- POST /intersection  {"segments": [x1, y1, x2, y2, x3, y3, x4, y4]}
+                      lub {"cases": [[x1, ..., y4], ...]}
+                      -> {"results": [{"kind", "point", "text"}, ...]} (jak check_intersection)
+- GET  /metrics       liczniki, przepustowość i opóźnienia (p50 / p95 / p99) dla każdej ścieżki
+- GET  /health        {"status": "ok"}
+
+Małe zapytania o przecięcia zgłoszone w tym samym oknie czasowym (--batch-window-ms)
+łączone są w jedno wywołanie check_intersections_batch. Duże zapytania (co najmniej
+--pool-threshold punktów lub przypadków) liczone są w puli procesów, więc nie blokują
+pętli zdarzeń (dane przekazywane są przez pamięć współdzieloną, bez serializacji);
+pozostałe liczone są od razu w pętli zdarzeń.
+"""
+
+DEFAULT_PORT = 8765
+HOST = "127.0.0.1"
+# Od tej liczby punktów (otoczka) lub przypadków (przecięcia) zapytanie trafia do puli procesów
+POOL_THRESHOLD = 50000
+# Okno czasowe (s) i największy rozmiar (liczba przypadków) wspólnej partii przecięć
+BATCH_WINDOW = 0.002
+MAX_BATCH = 4096
+# Największy rozmiar treści zapytania w bajtach
+MAX_BODY = 256 * 2 ** 20
+# Liczba ostatnich pomiarów opóźnienia, z których liczone są percentyle
+LATENCY_SAMPLES = 10000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+def hull_record(result):
+    return {
+        "type": HULL_TYPES.get(result.num_vertices, "polygon"),
+        "vertices": [list(p) for p in result.coords],
+        "indices": result.indices,
+        "text": result.text,
+    }
+
+def intersection_records(kinds, points):
+    # Wyniki check_intersections_batch jako słowniki JSON (z komunikatem jak w check_intersection)
+    records = []
+    for kind, row in zip(kinds.tolist(), points.tolist()):
+        if kind in (POINT, SAME_POINT):
+            point = (row[0], row[1])
+            ends = [row[:2]]
+        elif kind == OVERLAP:
+            point = ((row[0], row[1]), (row[2], row[3]))
+            ends = [row[:2], row[2:]]
+        else:
+            point, ends = None, []
+        text = IntersectionResult(kind, point).text
+        records.append({"kind": KIND_NAMES[kind], "point": ends if len(ends) == 2 else ends[0] if ends else None,
+                        "text": text})
+    return records
+
+def _hull_job(coords):
+    return hull_record(convex_hull(coords))
+
+def _intersection_job(cases):
+    return intersection_records(*check_intersections_batch(cases[:, :4], cases[:, 4:]))
+
+# Zadania dla puli procesów – dane wejściowe z pamięci współdzielonej (moduł shm_transport),
+# do procesu roboczego trafia tylko uchwyt segmentu, a z powrotem wynik w postaci JSON
+
+def _hull_job_shared(handle):
+    with attach(handle) as coords:
+        return _hull_job(coords)
+
+def _intersection_job_shared(handle):
+    with attach(handle) as cases:
+        return _intersection_job(cases)
+
+def _as_array(value, message):
+    # Tablica float64 z listy JSON; inny typ lub elementy niebędące liczbami – błąd 400 (ValueError)
+    if not isinstance(value, list):
+        raise ValueError(message)
+    try:
+        return np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(message) from None
+
+def _parse_points(payload):
+    points = _as_array(payload.get("points", []), "Pole points musi być listą par [x, y]")
+    if points.size == 0:
+        return points.reshape(0, 2)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("Pole points musi być listą par [x, y]")
+    return points
+
+def _parse_cases(payload):
+    if "segments" in payload:
+        cases = _as_array(payload["segments"], "Pole segments musi być listą 8 współrzędnych").reshape(1, -1)
+    else:
+        cases = _as_array(payload.get("cases", []), "Pole cases musi być listą przypadków po 8 współrzędnych")
+        if cases.size == 0:
+            return cases.reshape(0, 8)
+    if cases.ndim != 2 or cases.shape[1] != 8:
+        raise ValueError("Każdy przypadek to 8 współrzędnych: x1, y1, x2, y2, x3, y3, x4, y4")
+    return cases
+
+class Metrics:
+    """
+    Liczniki zapytań dla każdej ścieżki: liczba zapytań, błędów i elementów
+    (punktów / przypadków), ostatnie opóźnienia oraz rozmiary partii przecięć.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.paths = {}
+        self.batches = 0
+        self.batched_cases = 0
+        self.pool_jobs = 0
+
+    def record(self, path, seconds, items, error=False):
+        entry = self.paths.setdefault(path, {"requests": 0, "errors": 0, "items": 0,
+                                             "latency": deque(maxlen=LATENCY_SAMPLES)})
+        entry["requests"] += 1
+        entry["errors"] += error
+        entry["items"] += items
+        entry["latency"].append(seconds)
+
+    def snapshot(self):
+        uptime = time.perf_counter() - self.start
+        paths = {}
+        for path, entry in self.paths.items():
+            latency = np.array(entry["latency"]) * 1000
+            p50, p95, p99 = np.percentile(latency, [50, 95, 99]).tolist() if len(latency) else (0, 0, 0)
+            paths[path] = {
+                "requests": entry["requests"],
+                "errors": entry["errors"],
+                "items": entry["items"],
+                "requests_per_s": entry["requests"] / uptime,
+                "items_per_s": entry["items"] / uptime,
+                "latency_ms": {"p50": p50, "p95": p95, "p99": p99},
+            }
+        return {
+            "uptime_s": uptime,
+            "paths": paths,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_cases / self.batches if self.batches else 0,
+            "pool_jobs": self.pool_jobs,
+        }
+
+class IntersectionBatcher:
+    """
+    Łączy zapytania o przecięcia zgłoszone w oknie BATCH_WINDOW w jedno wywołanie
+    check_intersections_batch (lub wcześniej, gdy partia osiągnie MAX_BATCH przypadków).
+    """
+
+    def __init__(self, metrics, window=BATCH_WINDOW, max_size=MAX_BATCH):
+        self.metrics = metrics
+        self.window = window
+        self.max_size = max_size
+        self.pending = []
+        self.size = 0
+        self.timer = None
+
+    def submit(self, cases):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((cases, future))
+        self.size += len(cases)
+        if self.size >= self.max_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        pending, self.pending, self.size = self.pending, [], 0
+        if not pending:
+            return
+        self.metrics.batches += 1
+        try:
+            cases = np.concatenate([c for c, _ in pending])
+            self.metrics.batched_cases += len(cases)
+            records = _intersection_job(cases)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        start = 0
+        for c, future in pending:
+            if not future.done():
+                future.set_result(records[start:start + len(c)])
+            start += len(c)
+
+class GeometryServer:
+    def __init__(self, workers=None, batch_window=BATCH_WINDOW, max_batch=MAX_BATCH,
+                 pool_threshold=POOL_THRESHOLD):
+        self.metrics = Metrics()
+        self.batcher = IntersectionBatcher(self.metrics, batch_window, max_batch)
+        self.pool_threshold = pool_threshold
+        ensure_tracker()
+        # Procesy uruchamiane przez "spawn" – proces potomny utworzony przez fork dziedziczyłby
+        # otwarte gniazda połączeń i klient nie dostawałby końca strumienia po ich zamknięciu
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        self.routes = {
+            ("POST", "/hull"): self.hull,
+            ("POST", "/intersection"): self.intersection,
+            ("GET", "/metrics"): self.metrics_view,
+            ("GET", "/health"): self.health,
+        }
+
+    async def hull(self, payload):
+        points = _parse_points(payload)
+        if len(points) >= self.pool_threshold:
+            record = await self.run_in_pool(_hull_job_shared, points)
+        else:
+            # Poniżej progu otoczka liczona jest w pętli zdarzeń: zajmuje najwyżej kilka ms,
+            # mniej niż przekazanie zadania do puli (pamięć współdzielona i komunikacja z procesem)
+            record = _hull_job(points)
+        return record, len(points)
+
+    async def intersection(self, payload):
+        cases = _parse_cases(payload)
+        if len(cases) >= self.pool_threshold:
+            records = await self.run_in_pool(_intersection_job_shared, cases)
+        elif len(cases):
+            records = await self.batcher.submit(cases)
+        else:
+            records = []
+        return {"results": records}, len(cases)
+
+    async def run_in_pool(self, job, array):
+        # Zadanie w puli procesów; segment pamięci współdzielonej usuwany jest po jego zakończeniu
+        self.metrics.pool_jobs += 1
+        with SharedArray.from_array(array) as shared:
+            future = asyncio.get_running_loop().run_in_executor(self.pool, job, shared.handle)
+            try:
+                return await future
+            except asyncio.CancelledError:
+                # Rozłączony klient – segment może zostać usunięty dopiero po zakończeniu zadania
+                await asyncio.wait([future])
+                raise
+
+    async def metrics_view(self, payload):
+        return self.metrics.snapshot(), 0
+
+    async def health(self, payload):
+        return {"status": "ok"}, 0
+
+    async def dispatch(self, method, path, body):
+        # Zwraca (kod HTTP, odpowiedź JSON)
+        route = self.routes.get((method, path))
+        if route is None:
+            known = any(p == path for _, p in self.routes)
+            return (405 if known else 404), {"error": REASONS[405 if known else 404]}
+        start = time.perf_counter()
+        items, error = 0, True
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("Treść zapytania musi być obiektem JSON")
+            response, items = await route(payload)
+            error = False
+            return 200, response
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": str(e)}
+        finally:
+            self.metrics.record(path, time.perf_counter() - start, items, error)
+
+    async def handle(self, reader, writer):
+        # Połączenie HTTP/1.1 (keep-alive): kolejne zapytania do zamknięcia przez klienta
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                # Przy błędnej długości nie wiadomo, gdzie kończy się treść – połączenie jest zamykane
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Nieprawidłowy nagłówek Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": REASONS[413]}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, response = await self.dispatch(method.upper(), target.split("?")[0], body)
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, response, keep_alive):
+        body = json.dumps(response).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def serve(self, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, HOST, port)
+        print(f"Serwer geometrii: http://{HOST}:{server.sockets[0].getsockname()[1]}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokalny serwer HTTP/JSON obliczeń geometrycznych")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="liczba procesów puli (domyślnie liczba CPU)")
+    parser.add_argument("--batch-window-ms", type=float, default=BATCH_WINDOW * 1000)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--pool-threshold", type=int, default=POOL_THRESHOLD)
+    args = parser.parse_args()
+    server = GeometryServer(args.workers, args.batch_window_ms / 1000, args.max_batch, args.pool_threshold)
+    try:
+        asyncio.run(server.serve(args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import atexit
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+"""
+Przekazywanie tablic NumPy do procesów roboczych przez pamięć współdzieloną.
+
+Argumenty zadań puli procesów (ProcessPoolExecutor) są serializowane (pickle), więc
+duża tablica punktów jest kopiowana do potoku i jeszcze raz odtwarzana w procesie
+roboczym. Tutaj tablica umieszczana jest w segmencie multiprocessing.shared_memory,
+a do procesu roboczego trafia tylko mały uchwyt (nazwa segmentu, kształt, typ):
+
+    with SharedArray.from_array(points) as shared:        # proces główny (właściciel)
+        pool.submit(job, shared.handle, ...)
+
+    def job(handle, ...):                                  # proces roboczy
+        with attach(handle) as points:                     # widok bez kopiowania
+            ...
+
+Czas życia segmentu:
+- właścicielem jest SharedArray – close() (lub koniec bloku with) zamyka i usuwa segment,
+- segmenty niezamknięte jawnie usuwane są przy zakończeniu procesu (atexit),
+- attach() tylko otwiera istniejący segment i zamyka go na końcu bloku; widoki
+  z attach() nie mogą być używane po wyjściu z bloku (wyniki zadań muszą być kopiami).
+
+Procesy robocze muszą korzystać z tego samego procesu resource_tracker co właściciel –
+proces roboczy z własnym resource_tracker usunąłby (po swoim zakończeniu) segmenty
+otwarte przez attach(). Pulę, której procesy mogą zostać uruchomione przed utworzeniem
+pierwszego segmentu, należy tworzyć po wywołaniu ensure_tracker().
+"""
+
+# Uchwyt segmentu przekazywany do procesów roboczych (serializuje się do kilkudziesięciu bajtów)
+SharedHandle = namedtuple("SharedHandle", ["name", "shape", "dtype"])
+
+# Segmenty utworzone w tym procesie i jeszcze nieusunięte: nazwa -> SharedArray
+_owned = {}
+_owned_lock = threading.Lock()
+
+class SharedArray:
+    """
+    Tablica NumPy w nowym segmencie pamięci współdzielonej (właściciel segmentu).
+
+    - array: tablica (widok segmentu) do zapisu danych w procesie głównym,
+    - handle: SharedHandle do przekazania procesom roboczym (attach()).
+
+    Obiekt można przekazać wszędzie tam, gdzie oczekiwana jest tablica (np. convex_hull);
+    równoległa otoczka wypukła używa wtedy istniejącego segmentu bez kopiowania punktów.
+    """
+
+    def __init__(self, shape, dtype=np.float64):
+        dtype = np.dtype(dtype)
+        shape = tuple(int(s) for s in np.atleast_1d(shape))
+        size = int(np.prod(shape)) * dtype.itemsize
+        # Segment o rozmiarze 0 nie jest dozwolony – przydzielany jest co najmniej 1 bajt
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        self.handle = SharedHandle(self._shm.name, shape, dtype.str)
+        with _owned_lock:
+            _owned[self.handle.name] = self
+
+    @classmethod
+    def from_array(cls, array, dtype=None):
+        # Nowy segment z kopią tablicy (jedno kopiowanie w pamięci zamiast serializacji)
+        array = np.asarray(array, dtype=dtype)
+        shared = cls(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @property
+    def array(self):
+        if self._array is None:
+            raise ValueError("Segment pamięci współdzielonej został już zamknięty")
+        return self._array
+
+    @property
+    def closed(self):
+        return self._array is None
+
+    def __array__(self, dtype=None, copy=None):
+        return self.array if dtype is None else self.array.astype(dtype, copy=False)
+
+    def __len__(self):
+        return len(self.array)
+
+    def close(self):
+        # Zamknięcie i usunięcie segmentu; kolejne wywołania nic nie robią
+        with _owned_lock:
+            if _owned.pop(self.handle.name, None) is None:
+                return
+        self._array = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Istnieją jeszcze widoki tablicy – odwzorowanie zostanie zwolnione razem z nimi
+            pass
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+def ensure_tracker():
+    # Uruchamia resource_tracker w procesie głównym (dziedziczą go później tworzone procesy)
+    resource_tracker.ensure_running()
+
+@contextmanager
+def attach(handle):
+    """
+    Widok tablicy z segmentu utworzonego przez SharedArray (w procesie roboczym lub głównym).
+    """
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        yield np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=shm.buf)
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # Widok przeżył blok with – segment zostanie zamknięty przy jego usunięciu
+            pass
+
+def as_shared(array, dtype=None):
+    """
+    (SharedArray, czy_utworzony): istniejący segment, jeśli array jest już SharedArray
+    o wymaganym typie, w przeciwnym razie nowy segment z kopią (do zamknięcia przez wywołującego).
+    """
+    if isinstance(array, SharedArray) and (dtype is None or array.array.dtype == np.dtype(dtype)):
+        return array, False
+    return SharedArray.from_array(array, dtype), True
+
+def live_segments():
+    # Nazwy segmentów utworzonych w tym procesie, które nie zostały jeszcze usunięte
+    with _owned_lock:
+        return list(_owned)
+
+@atexit.register
+def _cleanup():
+    for shared in list(_owned.values()):
+        shared.close()
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+import convex_hull as ch
+
+"""
+Zgodność silników otoczki wypukłej: wynik (wierzchołki, indeksy i tekst) nie może
+zależeć od tego, który silnik został wybrany.
+"""
+
+def point_sets(count=200, max_points=700):
+    # Losowe punkty rzeczywiste oraz punkty na małej siatce (duplikaty, punkty współliniowe)
+    for seed in range(count):
+        rng = np.random.default_rng(seed)
+        n = int(rng.integers(1, max_points))
+        if seed % 2:
+            yield rng.integers(0, 6, (n, 2)).astype(float)
+        else:
+            yield rng.random((n, 2))
+
+def same(a, b):
+    return a.coords == b.coords and a.indices == b.indices and a.text == b.text
+
+def test_python_and_vectorized_engines_agree():
+    for points in point_sets():
+        tuples = [tuple(p) for p in points.tolist()]
+        assert same(ch._convex_hull_python(tuples), ch._convex_hull_vectorized(tuples))
+
+@pytest.mark.parametrize("n", [ch.VECTORIZED_THRESHOLD - 1, ch.VECTORIZED_THRESHOLD])
+def test_threshold_does_not_change_result(n):
+    points = np.random.default_rng(n).random((n, 2))
+    tuples = [tuple(p) for p in points.tolist()]
+    assert same(ch.convex_hull(points), ch._convex_hull_python(tuples))
+
+def test_incremental_hull_matches_convex_hull():
+    # Etykiety powtórzonych punktów jak w convex_hull; dla odcinka kolejność końców
+    # w convex_hull zależy od kolejności w zbiorze (set), więc porównywane są same punkty
+    for points in point_sets(count=100, max_points=300):
+        tuples = [tuple(p) for p in points.tolist()]
+        result, expected = ch.IncrementalConvexHull(tuples).result(), ch.convex_hull(tuples)
+        if expected.indices is None:
+            assert result.indices is None and sorted(result.coords) == sorted(expected.coords)
+        else:
+            assert same(result, expected)
+
+def expected_coords(points):
+    # Wierzchołki z convex_hull; kolejność końców odcinka zależy od zbioru (set), więc
+    # dla mniej niż 3 wierzchołków porównywane są posortowane punkty
+    coords = ch.convex_hull(points).coords
+    return coords if len(coords) > 2 else sorted(coords)
+
+def test_dynamic_hull_matches_convex_hull_after_every_update():
+    # Losowe wstawienia, usunięcia i przesunięcia na małej siatce (duplikaty), na jednej
+    # prostej i na liczbach rzeczywistych, w tym stany z 0, 1 i 2 punktami
+    for seed in range(60):
+        rng = np.random.default_rng(seed)
+        kind = seed % 3
+
+        def random_point():
+            if kind == 0:
+                return tuple(float(v) for v in rng.integers(0, 5, 2))
+            if kind == 1:
+                t = float(rng.integers(-4, 5))
+                return (t, 2 * t + 1)
+            return tuple(rng.random(2).tolist())
+
+        points = [random_point() for _ in range(int(rng.integers(0, 4)))]
+        hull = ch.DynamicConvexHull(points)
+        for _ in range(150):
+            action = rng.random()
+            if action < 0.45 or not points:
+                p = random_point()
+                hull.insert(*p)
+                points.append(p)
+            elif action < 0.8 or len(points) > 40:
+                p = points.pop(int(rng.integers(len(points))))
+                hull.delete(*p)
+            else:
+                k = int(rng.integers(len(points)))
+                p = random_point()
+                hull.move(points[k], p)
+                points[k] = p
+            assert len(hull) == len(points)
+            coords = hull.coords
+            assert (coords if len(coords) > 2 else sorted(coords)) == expected_coords(points), points
+
+def test_dynamic_hull_rejects_missing_point():
+    hull = ch.DynamicConvexHull([(0.0, 0.0), (1.0, 1.0)])
+    hull.delete(1.0, 1.0)
+    with pytest.raises(ValueError):
+        hull.delete(1.0, 1.0)
+    assert hull.coords == [(0.0, 0.0)]
+    hull.delete(0.0, 0.0)
+    assert hull.coords == [] and len(hull) == 0
+
+def same_hull(result, expected):
+    # Dla odcinka kolejność końców w convex_hull zależy od zbioru (set) – porównanie bez kolejności
+    if expected.indices is None and len(expected.coords) == 2:
+        return result.indices is None and sorted(result.coords) == sorted(expected.coords)
+    return same(result, expected)
+
+def chunked(points, size):
+    # Co najwyżej ok. 20 porcji na zbiór – małe porcje tylko dla małych zbiorów
+    size = max(size, len(points) // 20)
+    return [points[k:k + size] for k in range(0, len(points), size)]
+
+SMALL_SETS = [
+    [],
+    [(1.0, 2.0)],
+    [(1.0, 2.0), (1.0, 2.0), (1.0, 2.0)],
+    [(0.0, 0.0), (3.0, 1.0)],
+    [(3.0, 1.0), (0.0, 0.0), (3.0, 1.0), (0.0, 0.0)],
+    [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0), (1.0, 1.0)],
+    [(0.0, 0.0), (2.0, 0.0), (0.0, 0.0), (1.0, 3.0), (2.0, 0.0), (1.0, 3.0)],
+]
+
+def stream_cases():
+    # Małe zbiory (n = 0, 1, 2, duplikaty w różnych porcjach), zbiory testowe silników
+    # i większe zbiory (powyżej VECTORIZED_THRESHOLD – filtr Akla–Toussainta w porcjach)
+    for points in SMALL_SETS:
+        yield np.array(points, dtype=np.float64).reshape(-1, 2)
+    yield from point_sets(count=40)
+    for seed in range(4):
+        rng = np.random.default_rng(seed)
+        yield rng.integers(0, 40, (3000, 2)).astype(float) if seed % 2 else rng.random((3000, 2))
+
+@pytest.mark.parametrize("size", [1, 2, 7, 300, 5000])
+def test_stream_matches_convex_hull(size):
+    for points in stream_cases():
+        expected = ch.convex_hull(points)
+        assert same_hull(ch.convex_hull_stream(chunked(points, size)), expected)
+        # Porcje jako listy krotek, także z pustymi porcjami
+        tuples = [[tuple(p) for p in chunk.tolist()] for chunk in chunked(points, size)]
+        assert same_hull(ch.convex_hull_stream([[]] + tuples + [[]]), expected)
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_csv_stream_matches_convex_hull(tmp_path, chunk_size):
+    for k, points in enumerate(stream_cases()):
+        path = tmp_path / f"points_{k}.csv"
+        rows = "".join(f"{x!r},{y!r}\n" for x, y in points.tolist())
+        path.write_text("X,Y\n" + rows, encoding="utf-8")
+        expected = ch.convex_hull(points)
+        size = max(chunk_size, len(points) // 20)
+        assert same_hull(ch.convex_hull_from_csv(path, size), expected)
+        with open(path, encoding="utf-8") as f:
+            assert same_hull(ch.convex_hull_stream(ch.iter_csv_chunks(f, size)), expected)
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_matches_convex_hull(workers):
+    # Te same przypadki co dla otoczki strumieniowej; granice części wypadają także
+    # między duplikatami, a przy n < workers część procesów nie dostaje punktów
+    cases = [np.array(points, dtype=np.float64).reshape(-1, 2) for points in SMALL_SETS]
+    cases += [points for k, points in enumerate(stream_cases()) if k % 10 == 3 or len(points) > 1000]
+    for points in cases:
+        expected = ch.convex_hull(points)
+        assert same_hull(ch.convex_hull(points, workers=workers), expected)
+        assert same_hull(ch.convex_hull([tuple(p) for p in points.tolist()], workers=workers), expected)
@@ -0,0 +1,188 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from intersection import (NO_INTERSECTION, OVERLAP, POINT, POINTS_ONLY, SAME_POINT, check_intersection,
+                          check_intersections_batch, find_all_intersections, find_any_intersection,
+                          find_intersection, find_polyline_self_intersection, is_simple_polygon)
+
+"""
+Porównanie miotły (find_all_intersections, find_any_intersection, samoprzecięcia łamanych)
+i wersji wektoryzowanej
+(check_intersections_batch) ze sprawdzeniem wszystkich par odcinków przez find_intersection.
+"""
+
+def brute_force(segments):
+    pairs = set()
+    for i, j in itertools.combinations(range(len(segments)), 2):
+        if find_intersection(*segments[i], *segments[j]).kind not in (NO_INTERSECTION, POINTS_ONLY):
+            pairs.add((i, j))
+    return pairs
+
+def random_segments(seed):
+    # Zestawy z przypadkami szczególnymi: współrzędne z jednym miejscem po przecinku,
+    # mała siatka liczb całkowitych (wspólne końce, nakładanie się), odcinki pionowe,
+    # dowolne liczby rzeczywiste i pęki odcinków przez jeden punkt
+    rng = random.Random(seed)
+    n = rng.randint(2, 30)
+    kind = seed % 5
+    if kind == 0:
+        return [tuple(round(rng.uniform(0, 10), 1) for _ in range(4)) for _ in range(n)]
+    if kind == 1:
+        return [tuple(float(rng.randint(0, 4)) for _ in range(4)) for _ in range(n)]
+    if kind == 2:
+        return [tuple(rng.random() for _ in range(4)) for _ in range(n)]
+    if kind == 3:
+        segments = []
+        for _ in range(n):
+            x = float(rng.randint(0, 5))
+            x2 = x if rng.random() < 0.5 else float(rng.randint(0, 5))
+            segments.append((x, float(rng.randint(0, 5)), x2, float(rng.randint(0, 5))))
+        return segments
+    return [(5 - dx, 5 - dy, 5 + dx, 5 + dy)
+            for dx, dy in ((rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(n))]
+
+@pytest.mark.parametrize("segments", [
+    [(7, 1, 2, 10), (0, 2, 8, 3)],
+    [(2.9, 4.6, 2.9, 10.0), (1.5, 6.7, 7.1, 4.1)],
+    [(8.1, 0.1, 7.2, 9.0), (0.6, 8.7, 9.4, 9.1), (3.2, 6.7, 8.2, 2.8)],
+    [(4.4, 3.2, 0.9, 0.0), (6.1, 1.5, 0.4, 7.2), (5.5, 3.1, 5.1, 3.8), (5.3, 7.5, 5.5, 2.1)],
+])
+def test_find_all_intersections_regressions(segments):
+    assert {(i, j) for i, j, _ in find_all_intersections(segments)} == brute_force(segments)
+
+@pytest.mark.parametrize("segments", [
+    # Odcinki pionowe: przecięcie z ukośnym, wspólny koniec, nałożenie, rozłączne na jednej prostej
+    [(2, 0, 2, 4), (0, 0, 4, 4), (2, 4, 3, 5), (2, 3, 2, 6), (2, 7, 2, 8)],
+    # Nałożenia współliniowe: zawieranie, częściowe, styk w jednym punkcie, rozłączne
+    [(0, 0, 6, 3), (2, 1, 4, 2), (4, 2, 8, 4), (8, 4, 10, 5), (11, 5.5, 12, 6)],
+    # Wspólne końce: pęk odcinków z jednego punktu i łamana
+    [(1, 1, 5, 1), (1, 1, 1, 5), (1, 1, 4, 4), (5, 1, 4, 4), (1, 5, 4, 4), (0, 0, 1, 1)],
+    # Odcinki poziome, pionowe i punkty na ich końcach
+    [(0, 2, 6, 2), (3, 0, 3, 2), (6, 2, 6, 5), (3, 2, 3, 2), (7, 7, 7, 7)],
+])
+def test_special_cases_match_brute_force(segments):
+    segments = [tuple(map(float, s)) for s in segments]
+    pairs = brute_force(segments)
+    assert {(i, j) for i, j, _ in find_all_intersections(segments)} == pairs
+    pair = find_any_intersection(segments)
+    assert (pair is None) == (not pairs) and (pair is None or pair in pairs)
+
+def test_find_all_intersections_matches_brute_force():
+    for seed in range(500):
+        segments = random_segments(seed)
+        found = find_all_intersections(segments)
+        assert {(i, j) for i, j, _ in found} == brute_force(segments), segments
+        for i, j, result in found:
+            expected = find_intersection(*segments[i], *segments[j])
+            assert (result.kind, result.point) == (expected.kind, expected.point)
+
+def test_find_any_intersection_matches_brute_force():
+    for seed in range(500):
+        segments = random_segments(seed)
+        pair = find_any_intersection(segments)
+        pairs = brute_force(segments)
+        assert (pair is None) == (not pairs), segments
+        assert pair is None or pair in pairs
+
+def expected_row(result):
+    # Wiersz tablicy points z check_intersections_batch odpowiadający wynikowi find_intersection
+    if result.kind in (POINT, SAME_POINT):
+        return [*result.point, None, None]
+    if result.kind == OVERLAP:
+        return [*result.point[0], *result.point[1]]
+    return [None] * 4
+
+def test_batch_matches_find_intersection():
+    # Wszystkie pary z zestawów random_segments (pionowe, współliniowe, wspólne końce)
+    # oraz odcinki zdegenerowane do punktu (SAME_POINT, POINTS_ONLY)
+    kinds = set()
+    for seed in range(150):
+        rng = random.Random(seed)
+        segments = random_segments(seed)
+        segments += [(x, y, x, y) for x, y in ((float(rng.randint(0, 4)), float(rng.randint(0, 4)))
+                                               for _ in range(3))]
+        pairs = list(itertools.combinations(range(len(segments)), 2))
+        a = np.array([segments[i] for i, _ in pairs])
+        b = np.array([segments[j] for _, j in pairs])
+        batch_kinds, points = check_intersections_batch(a, b)
+        for (i, j), kind, row in zip(pairs, batch_kinds.tolist(), points.tolist()):
+            expected = find_intersection(*segments[i], *segments[j])
+            kinds.add(expected.kind)
+            assert kind == expected.kind, (segments[i], segments[j])
+            assert [None if v != v else v for v in row] == expected_row(expected), (segments[i], segments[j])
+    assert kinds >= {NO_INTERSECTION, POINT, OVERLAP, SAME_POINT, POINTS_ONLY}
+
+def test_batch_rejects_mismatched_shapes():
+    with pytest.raises(ValueError):
+        check_intersections_batch(np.zeros((2, 4)), np.zeros((3, 4)))
+
+def polyline_brute_force(points, closed):
+    # Pary krawędzi łamanej, które się przecinają; sąsiednie krawędzie mają wspólny wierzchołek,
+    # więc liczy się dla nich tylko nałożenie
+    n = len(points)
+    if n < 2:
+        return set()
+    count = n if closed and n > 2 else n - 1
+    edges = [points[i] + points[(i + 1) % n] for i in range(count)]
+    pairs = set()
+    for i, j in itertools.combinations(range(count), 2):
+        adjacent = j - i == 1 or (count == n and j - i == n - 1)
+        kind = find_intersection(*edges[i], *edges[j]).kind
+        if kind == OVERLAP if adjacent else kind not in (NO_INTERSECTION, POINTS_ONLY):
+            pairs.add((i, j))
+    return pairs
+
+def test_polyline_self_intersection_matches_brute_force():
+    # Małe łamane na siatce (powtórzone wierzchołki, krawędzie pionowe i współliniowe) i losowe
+    simple = 0
+    for seed in range(600):
+        rng = random.Random(seed)
+        n = rng.randint(0, 9)
+        if seed % 2:
+            points = [(float(rng.randint(0, 4)), float(rng.randint(0, 4))) for _ in range(n)]
+        else:
+            points = [(rng.random(), rng.random()) for _ in range(n)]
+        for closed in (True, False):
+            pairs = polyline_brute_force(points, closed)
+            pair = find_polyline_self_intersection(points, closed)
+            assert (pair is None) == (not pairs), (points, closed)
+            assert pair is None or pair in pairs
+        assert is_simple_polygon(points) == (not polyline_brute_force(points, True))
+        simple += is_simple_polygon(points)
+    assert 0 < simple < 600
+
+@pytest.mark.parametrize("points, expected", [
+    ([(0, 0), (4, 0), (4, 4), (0, 4)], True),
+    ([(0, 0), (4, 4), (4, 0), (0, 4)], False),            # kokarda
+    ([(0, 0), (4, 0), (2, 0), (2, 3)], False),            # krawędź wraca po sobie
+    ([(0, 0), (4, 0), (4, 4), (2, 0), (0, 4)], False),    # wierzchołek na krawędzi
+    ([(0, 0), (2, 0), (4, 0), (2, 3)], True),             # wierzchołki współliniowe
+])
+def test_is_simple_polygon_cases(points, expected):
+    assert is_simple_polygon(points) == expected
+
+def test_scalar_path_skips_timing_when_disabled(monkeypatch):
+    import timing
+
+    reports = []
+    timing.add_listener(reports.append)
+    try:
+        timing.enable()
+        check_intersection(0.0, 0.0, 4.0, 4.0, 0.0, 4.0, 4.0, 0.0)
+        assert [r.name for r in reports] == ["intersection"]
+        assert list(reports[0].stages) == ["orientation", "point"]
+    finally:
+        timing.disable()
+        timing.remove_listener(reports.append)
+
+    # Przy wyłączonym pomiarze nie jest tworzony żaden kontekst modułu timing
+    def fail(name):
+        raise AssertionError(f"kontekst timing przy wyłączonym pomiarze: {name}")
+    monkeypatch.setattr(timing, "run", fail)
+    monkeypatch.setattr(timing, "stage", fail)
+    for segments in ([0.0, 0.0, 4.0, 4.0, 1.0, 1.0, 3.0, 3.0], [0.0, 0.0, 4.0, 4.0, 0.0, 4.0, 4.0, 0.0],
+                     [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0]):
+        assert check_intersection(*segments) == find_intersection(*segments).as_tuple()
@@ -0,0 +1,83 @@
+import random
+from fractions import Fraction
+
+import numpy as np
+
+from predicates import cross_sign, cross_sign_batch, orient2d, orient2d_batch
+
+"""
+Predykaty porównywane z wyznacznikiem liczonym na ułamkach (Fraction).
+"""
+
+def exact_orient(ax, ay, bx, by, cx, cy):
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    det = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    return (det > 0) - (det < 0)
+
+def test_orient2d_is_exact_for_nearly_colinear_points():
+    rng = random.Random(0)
+    cases = []
+    for _ in range(2000):
+        ax, ay, bx, by = (rng.uniform(-1e3, 1e3) for _ in range(4))
+        t = rng.random()
+        # Punkt na prostej ab (po zaokrągleniu) – znak zależy od błędów rzędu ulp
+        cases.append((ax, ay, bx, by, ax + t * (bx - ax), ay + t * (by - ay)))
+    for case in cases:
+        assert orient2d(*case) == exact_orient(*case)
+    columns = np.array(cases).T
+    assert orient2d_batch(*columns).tolist() == [exact_orient(*case) for case in cases]
+
+def test_cross_sign_matches_orient2d():
+    assert cross_sign(0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 2.0, 2.0) == 0
+    assert cross_sign(0.0, 0.0, 1.0, 0.0, 5.0, 5.0, 5.0, 6.0) == orient2d(0.0, 0.0, 1.0, 0.0, 1.0, 1.0) == 1
+
+def test_non_finite_coordinates_use_float_sign():
+    inf, nan = float("inf"), float("nan")
+    assert orient2d(0.0, 0.0, 1.0, inf, 2.0, 0.0) == -1
+    assert orient2d(0.0, 0.0, nan, 1.0, 1.0, 1.0) == 0
+    assert cross_sign(0.0, 0.0, 1.0, 1.0, 0.0, 0.0, inf, inf) == 0
+    signs = cross_sign_batch([0.0, 0.0], [0.0, 0.0], [1.0, nan], [inf, 1.0],
+                             [0.0, 0.0], [0.0, 0.0], [2.0, 1.0], [0.0, 1.0])
+    assert signs.tolist() == [-1, 0]
+
+def random_cases(rng, kind, count=3000):
+    # Trójki punktów często współliniowe: siatka, duże liczby całkowite, liczby dziesiętne
+    # i ułamki o mianowniku 2^k (różnice bez zaokrągleń)
+    cases = []
+    for _ in range(count):
+        if kind == "grid":
+            case = [float(rng.randint(-5, 5)) for _ in range(6)]
+        elif kind == "big":
+            case = [float(rng.randint(-2 ** 40, 2 ** 40) // 2 ** 20 * 2 ** 20) for _ in range(6)]
+        elif kind == "decimal":
+            case = [rng.randint(0, 20) / 10 for _ in range(6)]
+        else:
+            case = [1000 + rng.randint(0, 64) / 64 for _ in range(6)]
+        if rng.random() < 0.5:
+            # Trzeci punkt na prostej przez dwa pierwsze
+            t = rng.choice((-1, 2, 3, 0.5))
+            case[4] = case[0] + t * (case[2] - case[0])
+            case[5] = case[1] + t * (case[3] - case[1])
+        cases.append(tuple(case))
+    return cases
+
+def test_orient2d_is_exact_for_colinear_grid_decimal_and_large_inputs():
+    rng = random.Random(1)
+    for kind in ("grid", "big", "decimal", "dyadic"):
+        for case in random_cases(rng, kind):
+            assert orient2d(*case) == exact_orient(*case), (kind, case)
+            ax, ay, bx, by, cx, cy = case
+            assert cross_sign(ax, ay, bx, by, ax, ay, cx, cy) == exact_orient(*case), (kind, case)
+
+def test_grid_input_does_not_use_the_exact_fallback(monkeypatch):
+    # Dla małych liczb całkowitych wynik float jest dokładny – wolniejsze etapy są zbędne
+    import predicates
+
+    def fail(*args):
+        raise AssertionError("wywołano etap dokładny dla punktów na siatce")
+    monkeypatch.setattr(predicates, "_adaptive_sign", fail)
+    for case in random_cases(random.Random(2), "grid"):
+        if any(v % 1 for v in case):
+            continue
+        assert orient2d(*case) == exact_orient(*case)
+        assert orient2d(*map(int, case)) == exact_orient(*case)
@@ -0,0 +1,103 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+import result_cache as rc
+from convex_hull import compute_convex_hull, convex_hull
+from intersection import check_intersection
+from result_cache import ResultCache
+
+"""
+Pamięć podręczna wyników: kolejność usuwania LRU, warstwa dyskowa i stałość kluczy.
+"""
+
+HULL_KEY = "hull:f6ed409994d44db1b4fc18a119f58231"
+
+def triangle(i):
+    return [(0.0, 0.0), (1.0, 0.0), (0.0, float(i + 1))]
+
+def test_results_match_uncached_functions():
+    cache = ResultCache()
+    rng = np.random.default_rng(0)
+    for _ in range(2):
+        points = [tuple(p) for p in rng.random((50, 2)).tolist()]
+        assert cache.compute_convex_hull(points) == compute_convex_hull(points)
+        assert cache.compute_convex_hull(points) == compute_convex_hull(points)
+        segments = rng.integers(0, 4, 8).tolist()
+        assert cache.check_intersection(*segments) == check_intersection(*segments)
+    assert cache.stats()["hits"] == 2
+
+def test_lru_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.convex_hull(triangle(0))
+    cache.convex_hull(triangle(1))
+    cache.convex_hull(triangle(0))          # trafienie – triangle(1) staje się najdawniej używany
+    cache.convex_hull(triangle(2))
+    keys = list(cache.entries)
+    assert keys == [rc._hull_key(np.array(triangle(i))) for i in (0, 2)]
+    cache.convex_hull(triangle(1))
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 4, "entries": 2,
+                             "bytes": 2 * (rc._ENTRY_OVERHEAD + 3 * rc._VERTEX_SIZE)}
+
+def test_lru_respects_byte_limit():
+    size = rc._ENTRY_OVERHEAD + 3 * rc._VERTEX_SIZE
+    cache = ResultCache(max_bytes=2 * size)
+    for i in range(5):
+        cache.convex_hull(triangle(i))
+    assert cache.stats()["entries"] == 2 and cache.stats()["bytes"] == 2 * size
+
+def test_disk_tier_survives_reopen(tmp_path):
+    path = tmp_path / "saves" / "cache.sqlite"
+    cache = ResultCache(path=str(path))
+    cache.intersection(0, 0, 1, 1, 0, 1, 1, 0)
+    assert not path.parent.exists()         # baza tworzona dopiero przy pierwszej otoczce
+    points = np.random.default_rng(1).random((100, 2))
+    expected = convex_hull(points)
+    cache.convex_hull(points)
+    cache.close()
+
+    cache = ResultCache(path=str(path))
+    result = cache.convex_hull(points)
+    assert (result.coords, result.indices) == (expected.coords, expected.indices)
+    assert cache.stats()["disk_hits"] == 1
+    cache.close()
+
+def test_disk_tier_evicts_oldest_in_batches(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(max_entries=1, path=path, max_disk_entries=10)
+    for i in range(10):
+        cache.convex_hull(triangle(i))
+    cache.convex_hull(triangle(0))          # odczyt z dysku odświeża czas użycia
+    cache.convex_hull(triangle(10))         # przekroczenie limitu – zostaje 9 otoczek
+    cache.close()
+
+    keys = {row[0] for row in sqlite3.connect(path).execute("SELECT key FROM hulls")}
+    assert len(keys) == 9
+    assert rc._hull_key(np.array(triangle(0))) in keys
+    assert rc._hull_key(np.array(triangle(1))) not in keys
+    cache = ResultCache(path=path, max_disk_entries=10)
+    cache.convex_hull(triangle(1))
+    assert cache._disk_count == 10
+    cache.close()
+
+@pytest.mark.parametrize("points", [
+    [(0, 0), (1, 0), (0, 1)],
+    [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+    np.array([[0, 0], [1, 0], [0, 1]], dtype=np.int64),
+    np.asfortranarray([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]),
+    np.array([0.0, 0.0, 1.0, 0.0, 0.0, 1.0]),
+])
+def test_hull_key_is_stable(points):
+    # Ta sama postać kanoniczna – ten sam klucz; wartość ustalona, bo klucze zapisywane są na dysku
+    coords = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    assert rc._hull_key(coords) == rc._hull_key(np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]))
+    assert rc._hull_key(coords) == HULL_KEY
+
+def test_keys_depend_on_order_and_values():
+    base = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+    assert rc._hull_key(base) != rc._hull_key(base[::-1].copy())
+    assert rc._hull_key(base) != rc._hull_key(base[:2].copy())
+    assert rc._intersection_key([0.0] * 8) == rc._intersection_key([0] * 8)
+    assert rc._intersection_key([0.0] * 8) != rc._intersection_key([0.0] * 7 + [1.0])
+    assert rc._intersection_key([0.0] * 8).startswith("intersection:")
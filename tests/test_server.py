@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+import server
+from convex_hull import compute_convex_hull
+from intersection import check_intersection
+
+"""
+Serwer HTTP/JSON: odpowiedzi poprawne, błędy 400 / 404 / 405 / 413 i zadania w puli procesów.
+"""
+
+@pytest.fixture(scope="module")
+def geometry_server():
+    # Jeden serwer na moduł – uruchomienie procesu puli (spawn) trwa około sekundy
+    s = server.GeometryServer(workers=1, pool_threshold=1000)
+    yield s
+    s.pool.shutdown()
+
+def request(geometry_server, method, path, body=b"", headers=None):
+    # (kod HTTP, odpowiedź JSON) dla jednego zapytania na osobnym połączeniu
+    async def run():
+        srv = await asyncio.start_server(geometry_server.handle, "127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            head = {"Content-Length": str(len(body)), "Connection": "close"}
+            head.update(headers or {})
+            writer.write(f"{method} {path} HTTP/1.1\r\n".encode("latin-1")
+                         + "".join(f"{k}: {v}\r\n" for k, v in head.items()).encode("latin-1")
+                         + b"\r\n" + body)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 30)
+            writer.close()
+        finally:
+            srv.close()
+            await srv.wait_closed()
+        status_line, _, rest = response.partition(b"\r\n")
+        return int(status_line.split()[1]), json.loads(rest.partition(b"\r\n\r\n")[2])
+    return asyncio.run(run())
+
+def post(geometry_server, path, payload):
+    return request(geometry_server, "POST", path, json.dumps(payload).encode("utf-8"))
+
+@pytest.mark.parametrize("n", [3, 200, 5000])
+def test_hull_matches_compute_convex_hull(geometry_server, n):
+    # 5000 punktów – powyżej progu, zadanie liczone w puli procesów
+    points = np.random.default_rng(n).random((n, 2)).tolist()
+    pool_jobs = geometry_server.metrics.pool_jobs
+    status, response = post(geometry_server, "/hull", {"points": points})
+    assert geometry_server.metrics.pool_jobs - pool_jobs == (n >= geometry_server.pool_threshold)
+    text, vertices = compute_convex_hull([tuple(p) for p in points])
+    assert status == 200
+    assert response["text"] == text
+    assert [tuple(v) for v in response["vertices"]] == vertices
+
+def test_intersection_matches_check_intersection(geometry_server):
+    cases = [[0, 0, 2, 2, 0, 2, 2, 0], [0, 0, 1, 0, 2, 0, 3, 0], [0, 0, 2, 0, 1, 0, 3, 0]]
+    status, response = post(geometry_server, "/intersection", {"cases": cases})
+    assert status == 200
+    assert [r["text"] for r in response["results"]] == [check_intersection(*map(float, c))[0] for c in cases]
+    status, response = post(geometry_server, "/intersection", {"segments": cases[0]})
+    assert status == 200 and len(response["results"]) == 1
+
+@pytest.mark.parametrize("path, payload", [
+    ("/hull", {"points": {"x": 1}}),
+    ("/hull", {"points": [[1, 2], [3]]}),
+    ("/hull", {"points": [{"x": 1}]}),
+    ("/hull", [1, 2]),
+    ("/intersection", {"cases": "abc"}),
+    ("/intersection", {"segments": [1, 2, 3]}),
+])
+def test_invalid_payload_is_400(geometry_server, path, payload):
+    status, response = post(geometry_server, path, payload)
+    assert status == 400 and response["error"]
+
+def test_invalid_json_and_length_are_400(geometry_server):
+    assert request(geometry_server, "POST", "/hull", b"{")[0] == 400
+    assert request(geometry_server, "POST", "/hull", headers={"Content-Length": "abc"})[0] == 400
+
+def test_too_large_body_is_413(geometry_server):
+    status, _ = request(geometry_server, "POST", "/hull", headers={"Content-Length": str(server.MAX_BODY + 1)})
+    assert status == 413
+
+def test_unknown_route(geometry_server):
+    assert request(geometry_server, "GET", "/nothing")[0] == 404
+    assert request(geometry_server, "GET", "/hull")[0] == 405
+    assert request(geometry_server, "GET", "/health") == (200, {"status": "ok"})
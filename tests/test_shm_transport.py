@@ -0,0 +1,60 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from shm_transport import SharedArray, as_shared, attach, ensure_tracker, live_segments
+
+"""
+Pamięć współdzielona: przekazanie tablicy do procesu roboczego (spawn) i usunięcie segmentu.
+"""
+
+def double_in_place(handle):
+    # Zadanie procesu roboczego: suma przed zmianą i podwojenie danych w segmencie
+    with attach(handle) as array:
+        total = float(array.sum())
+        array *= 2
+        return total, array.shape, array.dtype.str
+
+def assert_unlinked(name):
+    assert name not in live_segments()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+@pytest.mark.parametrize("dtype", [np.float64, np.int32])
+def test_round_trip_through_spawned_process(dtype):
+    ensure_tracker()
+    data = np.arange(12, dtype=dtype).reshape(6, 2)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        with SharedArray.from_array(data) as shared:
+            name = shared.handle.name
+            assert name in live_segments()
+            total, shape, dtype_str = pool.submit(double_in_place, shared.handle).result(timeout=60)
+            assert (total, shape, dtype_str) == (float(data.sum()), (6, 2), np.dtype(dtype).str)
+            assert np.array_equal(shared.array, data * 2)
+        assert shared.closed
+        assert_unlinked(name)
+        # Segment usunięty przez właściciela nie może być już otwarty w procesie roboczym
+        with pytest.raises(FileNotFoundError):
+            pool.submit(double_in_place, shared.handle).result(timeout=60)
+
+def test_close_is_idempotent_and_blocks_access():
+    shared = SharedArray((0, 2))
+    assert len(shared) == 0
+    shared.close()
+    shared.close()
+    assert_unlinked(shared.handle.name)
+    with pytest.raises(ValueError):
+        shared.array
+
+def test_as_shared_reuses_matching_segment():
+    with SharedArray.from_array(np.ones((3, 2))) as shared:
+        same, created = as_shared(shared, np.float64)
+        assert same is shared and not created
+        copy, created = as_shared(shared, np.float32)
+        assert created and copy.array.dtype == np.float32
+        assert np.array_equal(np.asarray(copy), np.ones((3, 2)))
+        copy.close()
+        assert_unlinked(copy.handle.name)
@@ -0,0 +1,138 @@
+import threading
+from time import perf_counter
+
+"""
+Pomiar czasu etapów obliczeń (deduplikacja, sortowanie, budowa łańcucha, tekst, rysowanie).
+
+Użycie w kodzie obliczeń:
+
+    with timing.run("convex_hull"):      # jedno uruchomienie (raport)
+        with timing.stage("sort"):       # etap uruchomienia
+            ...
+
+Pomiar jest domyślnie wyłączony – wtedy run() i stage() zwracają wspólny pusty obiekt
+i nie mierzą czasu. Po włączeniu (enable()) każde zakończone zewnętrzne uruchomienie
+tworzy TimingReport przekazywany funkcjom zarejestrowanym przez add_listener().
+Uruchomienia zagnieżdżone (np. convex_hull wywołane z calculate() w GUI) dopisują swoje
+etapy do raportu zewnętrznego. Stos uruchomień jest osobny dla każdego wątku; funkcje
+nasłuchujące wywoływane są w wątku, który zakończył uruchomienie.
+"""
+
+_enabled = False
+_listeners = []
+_local = threading.local()
+
+class TimingReport:
+    """
+    Czasy etapów jednego uruchomienia.
+
+    - name: nazwa uruchomienia (np. "convex_hull", "calculate"),
+    - stages: słownik {etap: czas w sekundach} w kolejności rozpoczęcia etapów
+      (czasy powtórzonych etapów są sumowane),
+    - total: całkowity czas uruchomienia w sekundach.
+    """
+    __slots__ = ("name", "stages", "total")
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self.total = 0.0
+
+    def add(self, stage, seconds):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def text(self):
+        parts = ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in self.stages.items())
+        return f"{self.name}: {self.total * 1000:.1f} ms" + (f" ({parts})" if parts else "")
+
+class _Null:
+    # Pusty kontekst zwracany przy wyłączonym pomiarze
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL = _Null()
+
+class _Stage:
+    __slots__ = ("report", "name", "start")
+
+    def __init__(self, report, name):
+        self.report = report
+        self.name = name
+
+    def __enter__(self):
+        # Kolejność etapów w raporcie – według rozpoczęcia (etap zewnętrzny przed zagnieżdżonymi)
+        self.report.stages.setdefault(self.name, 0.0)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.report.add(self.name, perf_counter() - self.start)
+        return False
+
+class _Run:
+    __slots__ = ("report", "start", "outer")
+
+    def __init__(self, name):
+        stack = _stack()
+        self.outer = not stack
+        self.report = TimingReport(name) if self.outer else stack[-1]
+
+    def __enter__(self):
+        _stack().append(self.report)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        elapsed = perf_counter() - self.start
+        _stack().pop()
+        if self.outer:
+            self.report.total = elapsed
+            if exc_type is None:
+                for listener in list(_listeners):
+                    listener(self.report)
+        return False
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+def enable(on=True):
+    global _enabled
+    _enabled = bool(on)
+
+def disable():
+    enable(False)
+
+def is_enabled():
+    return _enabled
+
+def add_listener(callback):
+    # callback(report) wywoływane po każdym zakończonym zewnętrznym uruchomieniu
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+def run(name):
+    # Kontekst jednego uruchomienia; przy wyłączonym pomiarze nic nie robi
+    if not _enabled:
+        return _NULL
+    return _Run(name)
+
+def stage(name):
+    # Kontekst etapu bieżącego uruchomienia; poza uruchomieniem lub przy wyłączonym pomiarze nic nie robi
+    if not _enabled:
+        return _NULL
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        return _NULL
+    return _Stage(stack[-1], name)
@@ -10,6 +10,15 @@ translations = {
         "exit": "Wyjdź",
         "language": "Język",
         "theme": "Motyw",
+        "save_format": "Format zapisu",
+        "performance": "Pomiar wydajności",
+        "on": "Włącz",
+        "off": "Wyłącz",
+        "cache_hits": "Pamięć podręczna: {hits}/{total}",
+        "search": "Szukaj:",
+        "points_min": "Min. punktów:",
+        "points_max": "Maks. punktów:",
+        "points_count": "Punkty: {n}",
         "size": "Rozmiar okna",
         "back": "Wróć",
         "main_title": "Aplikacja Geometryczna",
@@ -17,6 +26,7 @@ translations = {
         "intersection": "1. Przecięcie dwóch odcinków",
         "convex": "2. Otoczka wypukła",
         "calculate": "Wyznacz",
+        "cancel": "Anuluj",
         "save": "Zapisz",
         "coords_prompt": "Podaj współrzędne punktów:",
         "info_text": (
@@ -78,6 +88,15 @@ translations = {
         "exit": "Exit",
         "language": "Language",
         "theme": "Theme",
+        "save_format": "Save format",
+        "performance": "Performance timing",
+        "on": "On",
+        "off": "Off",
+        "cache_hits": "Cache: {hits}/{total}",
+        "search": "Search:",
+        "points_min": "Min points:",
+        "points_max": "Max points:",
+        "points_count": "Points: {n}",
         "size": "Window size",
         "back": "Back",
         "main_title": "Geometry App",
@@ -85,6 +104,7 @@ translations = {
         "intersection": "1. Line segment intersection",
         "convex": "2. Convex hull",
         "calculate": "Calculate",
+        "cancel": "Cancel",
         "save": "Save",
         "coords_prompt": "Enter coordinates:",
         "missing_coords": "Not all coordinates have been provided. Please fill in all fields to define the two segments",